@@ -108,9 +108,9 @@ async def get_speedtest_history() -> Dict[str, List[Dict[str, Any]]]:
     Returns:
         List of previous test results
     """
-    history = SpeedTestService.get_history()
+    history = SpeedTestService.get_history_dicts()
     return {
-        "history": [r.to_dict() for r in history],
+        "history": history,
         "count": len(history),
     }
 
@@ -18,6 +18,7 @@ Configuration can be customized via environment variables:
 - ROSE_SERVER_PORT: API server bind port (default: 8000)
 - ROSE_LOG_LEVEL: Logging level (default: info)
 - ROSE_COMMAND_TIMEOUT: Default command timeout in seconds (default: 30)
+- ROSE_SUBPROCESS_POOL: Worker threads for blocking commands (default: 8)
 
 Author: ROSE Link Team
 License: MIT
@@ -126,7 +127,9 @@ class Paths:
     THERMAL_ZONE: Final[Path] = Path("/sys/class/thermal/thermal_zone0/temp")
     PROC_UPTIME: Final[Path] = Path("/proc/uptime")
     PROC_STAT: Final[Path] = Path("/proc/stat")
+    PROC_MEMINFO: Final[Path] = Path("/proc/meminfo")
     SYS_NET: Final[Path] = Path("/sys/class/net")
+    SYS_IEEE80211: Final[Path] = Path("/sys/class/ieee80211")
 
 
 # =============================================================================
@@ -180,6 +183,7 @@ class Limits:
 
     Configurable via environment variables:
     - ROSE_COMMAND_TIMEOUT: Default command timeout in seconds
+    - ROSE_SUBPROCESS_POOL: Worker threads for blocking commands
     """
 
     # File size limits
@@ -197,9 +201,25 @@ class Limits:
     DEFAULT_CHECK_INTERVAL: Final[int] = 60
     DEFAULT_PING_HOST: Final[str] = "8.8.8.8"
 
+    # Seconds a VPN provider reuses its last status before querying again
+    VPN_STATUS_CACHE_TTL: Final[float] = 2.0
+
+    # Seconds a WAN (Ethernet/WiFi) status read is reused
+    WAN_STATUS_CACHE_TTL: Final[float] = 2.0
+
+    # Seconds a parsed SSL certificate is reused before re-running openssl
+    CERT_CACHE_TTL: Final[float] = 60.0
+
+    # Minimum seconds between CPU usage samples; closer polls reuse the
+    # last reading instead of measuring over a few jiffies
+    CPU_SAMPLE_MIN_INTERVAL: Final[float] = 0.5
+
     # Command execution (configurable via environment)
     DEFAULT_COMMAND_TIMEOUT: Final[int] = _get_env_int("ROSE_COMMAND_TIMEOUT", 30)
 
+    # Threads dedicated to blocking commands awaited from async code
+    SUBPROCESS_POOL_SIZE: Final[int] = _get_env_int("ROSE_SUBPROCESS_POOL", 8)
+
     # Log retrieval
     DEFAULT_LOG_LINES: Final[int] = 100
 
@@ -19,18 +19,28 @@ import asyncio
 import json
 import logging
 import re
-from dataclasses import dataclass, field
+import shutil
+import socket
+import threading
+from dataclasses import dataclass, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from config import Paths
-from utils.command_runner import run_command
+from utils import json_codec
+from utils.command_runner import run_command_async
+from utils.compat import DATACLASS_OPTIONS
 
 logger = logging.getLogger("rose-link.speedtest")
 
 
-@dataclass
+def _now_iso() -> str:
+    """Return the current local time as an ISO 8601 string."""
+    return datetime.now().isoformat()
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class SpeedTestResult:
     """Result of a speed test."""
     timestamp: str
@@ -42,15 +52,28 @@ class SpeedTestResult:
     success: bool = True
     error: str = ""
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SpeedTestResult:
+        """
+        Create a result from a to_dict() dictionary.
+
+        Derived keys such as the formatted strings are ignored.
+        """
+        return cls(**{k: v for k, v in data.items() if k in _RESULT_FIELDS})
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Round once; formatting the rounded value to the same precision
+        # yields the same string
+        download = round(self.download_mbps, 2)
+        upload = round(self.upload_mbps, 2)
         return {
             "timestamp": self.timestamp,
-            "download_mbps": round(self.download_mbps, 2),
-            "upload_mbps": round(self.upload_mbps, 2),
+            "download_mbps": download,
+            "upload_mbps": upload,
             "ping_ms": round(self.ping_ms, 2),
-            "download_formatted": f"{self.download_mbps:.2f} Mbps",
-            "upload_formatted": f"{self.upload_mbps:.2f} Mbps",
+            "download_formatted": f"{download:.2f} Mbps",
+            "upload_formatted": f"{upload:.2f} Mbps",
             "ping_formatted": f"{self.ping_ms:.1f} ms",
             "server": self.server,
             "isp": self.isp,
@@ -59,6 +82,9 @@ class SpeedTestResult:
         }
 
 
+_RESULT_FIELDS = frozenset(f.name for f in fields(SpeedTestResult))
+
+
 class SpeedTestService:
     """
     Service for internet speed testing.
@@ -73,10 +99,27 @@ class SpeedTestService:
     # Maximum history entries
     MAX_HISTORY = 50
 
+    # Cheap reachability probe run before the bandwidth tests
+    PROBE_ADDRESS = ("1.1.1.1", 53)
+    PROBE_TIMEOUT = 1.0
+
+    # Speed test binaries, in order of preference
+    SPEEDTEST_CLI = "speedtest-cli"
+    OOKLA_CLI = "speedtest"
+
     # Flag to track if a test is in progress
     _test_in_progress: bool = False
     _current_result: Optional[SpeedTestResult] = None
 
+    # Speed test binaries found so far; missing ones are probed again
+    _installed_tools: Set[str] = set()
+
+    # Serialized history as (path, mtime_ns, entries)
+    _history_cache: Optional[Tuple[Path, int, List[Dict[str, Any]]]] = None
+
+    # Serializes history read-modify-write cycles across worker threads
+    _history_lock = threading.Lock()
+
     @classmethod
     def is_test_running(cls) -> bool:
         """Check if a speed test is currently running."""
@@ -104,32 +147,105 @@ class SpeedTestService:
             cls._current_result = result
 
             # Save to history
-            cls._save_to_history(result)
+            await cls._save_to_history(result)
 
             return result
 
         finally:
             cls._test_in_progress = False
 
+    @staticmethod
+    def _error_result(error: str) -> SpeedTestResult:
+        """
+        Build a failed SpeedTestResult.
+
+        Args:
+            error: Error message to report
+
+        Returns:
+            SpeedTestResult with zeroed measurements
+        """
+        return SpeedTestResult(
+            timestamp=_now_iso(),
+            download_mbps=0,
+            upload_mbps=0,
+            ping_ms=0,
+            success=False,
+            error=error,
+        )
+
+    @classmethod
+    async def _detect_tools(cls) -> Dict[str, bool]:
+        """
+        Detect which speed test binaries are installed.
+
+        Binaries not yet found are looked up concurrently. Only positive
+        results are cached, so a tool installed while the backend is
+        running is picked up by the next test.
+
+        Returns:
+            Mapping of binary name to availability
+        """
+        tools = (cls.SPEEDTEST_CLI, cls.OOKLA_CLI)
+        missing = [tool for tool in tools if tool not in cls._installed_tools]
+        if missing:
+            paths = await asyncio.gather(
+                *(asyncio.to_thread(shutil.which, tool) for tool in missing)
+            )
+            cls._installed_tools.update(
+                tool for tool, path in zip(missing, paths) if path is not None
+            )
+        return {tool: tool in cls._installed_tools for tool in tools}
+
+    @classmethod
+    async def _has_internet(cls) -> bool:
+        """
+        Check whether the internet is reachable.
+
+        Opens a TCP connection to a public DNS resolver with a short
+        timeout, which fails fast when the device is offline.
+
+        Returns:
+            True if the probe connection succeeded
+        """
+        def probe() -> None:
+            socket.create_connection(cls.PROBE_ADDRESS, timeout=cls.PROBE_TIMEOUT).close()
+
+        try:
+            await asyncio.to_thread(probe)
+            return True
+        except OSError:
+            return False
+
     @classmethod
     async def _execute_speedtest(cls) -> SpeedTestResult:
         """
         Execute the speed test command.
 
         Tries speedtest-cli first, then falls back to ookla speedtest.
+        Binaries that are not installed are skipped, and both are skipped
+        when the internet is unreachable.
 
         Returns:
             SpeedTestResult with test results
         """
+        if not await cls._has_internet():
+            logger.info("Internet unreachable, skipping bandwidth tests")
+            return await cls._run_basic_test()
+
+        tools = await cls._detect_tools()
+
         # Try speedtest-cli (Python package)
-        result = await cls._run_speedtest_cli()
-        if result.success:
-            return result
+        if tools.get(cls.SPEEDTEST_CLI):
+            result = await cls._run_speedtest_cli()
+            if result.success:
+                return result
 
         # Try ookla speedtest
-        result = await cls._run_ookla_speedtest()
-        if result.success:
-            return result
+        if tools.get(cls.OOKLA_CLI):
+            result = await cls._run_ookla_speedtest()
+            if result.success:
+                return result
 
         # Fall back to basic ping test
         result = await cls._run_basic_test()
@@ -145,75 +261,44 @@ class SpeedTestService:
         """
         try:
             # Run speedtest-cli with JSON output
-            ret, out, err = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: run_command(
-                    ["speedtest-cli", "--json"],
-                    timeout=120
-                )
+            ret, out, err = await run_command_async(
+                ["speedtest-cli", "--json"],
+                timeout=120
             )
 
             if ret != 0:
-                return SpeedTestResult(
-                    timestamp=datetime.now().isoformat(),
-                    download_mbps=0,
-                    upload_mbps=0,
-                    ping_ms=0,
-                    success=False,
-                    error="speedtest-cli failed"
-                )
+                return cls._error_result("speedtest-cli failed")
 
             # Parse JSON output
-            data = json.loads(out)
+            data = json_codec.loads(out)
 
             # Convert bits/s to Mbps
             download_mbps = data.get("download", 0) / 1_000_000
             upload_mbps = data.get("upload", 0) / 1_000_000
             ping_ms = data.get("ping", 0)
 
-            server = data.get("server", {})
+            server = data.get("server") or {}
             server_name = f"{server.get('sponsor', '')} ({server.get('name', '')})"
 
             return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
+                timestamp=_now_iso(),
                 download_mbps=download_mbps,
                 upload_mbps=upload_mbps,
                 ping_ms=ping_ms,
                 server=server_name,
-                isp=data.get("client", {}).get("isp", ""),
+                isp=(data.get("client") or {}).get("isp", ""),
                 success=True,
             )
 
         except json.JSONDecodeError as e:
             logger.debug(f"Failed to parse speedtest-cli output: {e}")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error="Failed to parse speedtest output"
-            )
+            return cls._error_result("Failed to parse speedtest output")
         except FileNotFoundError:
             logger.debug("speedtest-cli not found")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error="speedtest-cli not installed"
-            )
+            return cls._error_result("speedtest-cli not installed")
         except Exception as e:
             logger.error(f"speedtest-cli error: {e}")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error=str(e)
-            )
+            return cls._error_result(str(e))
 
     @classmethod
     async def _run_ookla_speedtest(cls) -> SpeedTestResult:
@@ -225,37 +310,27 @@ class SpeedTestService:
         """
         try:
             # Run ookla speedtest with JSON output
-            ret, out, err = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: run_command(
-                    ["speedtest", "--format=json", "--accept-license"],
-                    timeout=120
-                )
+            ret, out, err = await run_command_async(
+                ["speedtest", "--format=json", "--accept-license"],
+                timeout=120
             )
 
             if ret != 0:
-                return SpeedTestResult(
-                    timestamp=datetime.now().isoformat(),
-                    download_mbps=0,
-                    upload_mbps=0,
-                    ping_ms=0,
-                    success=False,
-                    error="ookla speedtest failed"
-                )
+                return cls._error_result("ookla speedtest failed")
 
             # Parse JSON output
-            data = json.loads(out)
+            data = json_codec.loads(out)
 
             # Convert bytes/s to Mbps
-            download_mbps = data.get("download", {}).get("bandwidth", 0) * 8 / 1_000_000
-            upload_mbps = data.get("upload", {}).get("bandwidth", 0) * 8 / 1_000_000
-            ping_ms = data.get("ping", {}).get("latency", 0)
+            download_mbps = (data.get("download") or {}).get("bandwidth", 0) * 8 / 1_000_000
+            upload_mbps = (data.get("upload") or {}).get("bandwidth", 0) * 8 / 1_000_000
+            ping_ms = (data.get("ping") or {}).get("latency", 0)
 
-            server = data.get("server", {})
+            server = data.get("server") or {}
             server_name = f"{server.get('name', '')} ({server.get('location', '')})"
 
             return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
+                timestamp=_now_iso(),
                 download_mbps=download_mbps,
                 upload_mbps=upload_mbps,
                 ping_ms=ping_ms,
@@ -266,34 +341,13 @@ class SpeedTestService:
 
         except json.JSONDecodeError as e:
             logger.debug(f"Failed to parse ookla speedtest output: {e}")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error="Failed to parse speedtest output"
-            )
+            return cls._error_result("Failed to parse speedtest output")
         except FileNotFoundError:
             logger.debug("ookla speedtest not found")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error="speedtest not installed"
-            )
+            return cls._error_result("speedtest not installed")
         except Exception as e:
             logger.error(f"ookla speedtest error: {e}")
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error=str(e)
-            )
+            return cls._error_result(str(e))
 
     @classmethod
     async def _run_basic_test(cls) -> SpeedTestResult:
@@ -304,12 +358,9 @@ class SpeedTestService:
             SpeedTestResult with ping only
         """
         try:
-            ret, out, err = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: run_command(
-                    ["ping", "-c", "5", "-W", "2", "8.8.8.8"],
-                    timeout=30
-                )
+            ret, out, err = await run_command_async(
+                ["ping", "-c", "5", "-W", "2", "8.8.8.8"],
+                timeout=30
             )
 
             ping_ms = 0
@@ -320,7 +371,7 @@ class SpeedTestService:
                     ping_ms = float(match.group(1))
 
             return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
+                timestamp=_now_iso(),
                 download_mbps=0,
                 upload_mbps=0,
                 ping_ms=ping_ms,
@@ -330,57 +381,101 @@ class SpeedTestService:
             )
 
         except Exception as e:
-            return SpeedTestResult(
-                timestamp=datetime.now().isoformat(),
-                download_mbps=0,
-                upload_mbps=0,
-                ping_ms=0,
-                success=False,
-                error=str(e)
-            )
+            return cls._error_result(str(e))
 
     @classmethod
-    def get_history(cls) -> List[SpeedTestResult]:
+    def _load_history(cls) -> List[Dict[str, Any]]:
         """
-        Get speed test history.
+        Load the serialized history entries, newest first.
+
+        Entries are kept in their on-disk dict form and cached until the
+        history file's mtime changes.
 
         Returns:
-            List of SpeedTestResult objects
+            List of result dictionaries (shared; do not mutate)
         """
-        if not cls.HISTORY_FILE.exists():
+        try:
+            mtime_ns = cls.HISTORY_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            logger.error(f"Failed to read history: {e}")
             return []
 
+        cached = cls._history_cache
+        if cached is not None and cached[0] == cls.HISTORY_FILE and cached[1] == mtime_ns:
+            return cached[2]
+
         try:
-            data = json.loads(cls.HISTORY_FILE.read_text())
-            return [
-                SpeedTestResult(**entry)
-                for entry in data
-            ]
+            entries = json_codec.load_file(cls.HISTORY_FILE)
         except (json.JSONDecodeError, OSError) as e:
             logger.error(f"Failed to read history: {e}")
             return []
 
+        if not isinstance(entries, list):
+            logger.error("Failed to read history: expected a JSON list")
+            return []
+
+        cls._history_cache = (cls.HISTORY_FILE, mtime_ns, entries)
+        return entries
+
     @classmethod
-    def _save_to_history(cls, result: SpeedTestResult) -> None:
+    def get_history(cls) -> List[SpeedTestResult]:
+        """
+        Get speed test history.
+
+        Returns:
+            List of SpeedTestResult objects
+        """
+        try:
+            return [SpeedTestResult.from_dict(entry) for entry in cls._load_history()]
+        except (TypeError, AttributeError) as e:
+            logger.error(f"Failed to read history: {e}")
+            return []
+
+    @classmethod
+    def get_history_dicts(cls) -> List[Dict[str, Any]]:
+        """
+        Get speed test history already serialized for JSON responses.
+
+        Returns:
+            List of result dictionaries as produced by SpeedTestResult.to_dict()
+        """
+        return list(cls._load_history())
+
+    @classmethod
+    async def _save_to_history(cls, result: SpeedTestResult) -> None:
         """
         Save a result to history.
 
+        The file update runs in a worker thread so it doesn't block the
+        event loop.
+
         Args:
             result: SpeedTestResult to save
         """
-        history = cls.get_history()
-        history.insert(0, result)
+        await asyncio.to_thread(cls._append_to_history, result)
 
-        # Trim to max size
-        history = history[:cls.MAX_HISTORY]
+    @classmethod
+    def _append_to_history(cls, result: SpeedTestResult) -> None:
+        """
+        Prepend a result to the history file (blocking).
 
-        try:
-            cls.HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
-            cls.HISTORY_FILE.write_text(
-                json.dumps([r.to_dict() for r in history], indent=2)
-            )
-        except OSError as e:
-            logger.error(f"Failed to save history: {e}")
+        Args:
+            result: SpeedTestResult to save
+        """
+        # Held across read-modify-write so concurrent saves don't drop entries
+        with cls._history_lock:
+            # Prepend and trim to max size
+            entries = [result.to_dict(), *cls._load_history()][:cls.MAX_HISTORY]
+
+            try:
+                cls.HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+                cls.HISTORY_FILE.write_bytes(json_codec.dumps(entries, indent=True))
+                mtime_ns = cls.HISTORY_FILE.stat().st_mtime_ns
+                cls._history_cache = (cls.HISTORY_FILE, mtime_ns, entries)
+            except OSError as e:
+                logger.error(f"Failed to save history: {e}")
 
     @classmethod
     def clear_history(cls) -> bool:
@@ -390,13 +485,17 @@ class SpeedTestService:
         Returns:
             True if cleared successfully
         """
-        try:
-            if cls.HISTORY_FILE.exists():
-                cls.HISTORY_FILE.unlink()
-            return True
-        except OSError as e:
-            logger.error(f"Failed to clear history: {e}")
-            return False
+        # Same lock as _append_to_history, so a save in progress can't
+        # write the old entries back after the clear
+        with cls._history_lock:
+            cls._history_cache = None
+            try:
+                if cls.HISTORY_FILE.exists():
+                    cls.HISTORY_FILE.unlink()
+                return True
+            except OSError as e:
+                logger.error(f"Failed to clear history: {e}")
+                return False
 
     @classmethod
     def get_last_result(cls) -> Optional[SpeedTestResult]:
@@ -17,19 +17,59 @@ License: MIT
 from __future__ import annotations
 
 import logging
+import os
 import re
-from dataclasses import dataclass
+import shutil
+import time
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from config import Paths
+from config import Limits, Paths
 from utils.command_runner import run_command, CommandRunner
+from utils.compat import DATACLASS_OPTIONS
 
 logger = logging.getLogger("rose-link.ssl")
 
+# Privileged commands only need sudo when not already running as root
+_SUDO: List[str] = [] if os.geteuid() == 0 else ["sudo"]
 
-@dataclass
+# Month abbreviations used in openssl's date output (always C locale)
+_MONTHS: Dict[str, int] = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _parse_openssl_date(value: str) -> datetime:
+    """
+    Parse a date printed by ``openssl x509 -dates``.
+
+    The format is fixed ("Nov 26 12:00:00 2025 GMT", day space-padded),
+    so it is split directly rather than going through strptime.
+
+    Args:
+        value: Date string from openssl
+
+    Returns:
+        Naive datetime for the given date
+
+    Raises:
+        ValueError: If the string is not in the expected format
+    """
+    try:
+        month, day, clock, year = value.split()[:4]
+        hour, minute, second = clock.split(":")
+        return datetime(
+            int(year), _MONTHS[month], int(day),
+            int(hour), int(minute), int(second),
+        )
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Invalid certificate date: {value!r}") from e
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class CertificateInfo:
     """Information about an SSL certificate."""
     domain: str
@@ -64,6 +104,11 @@ class SSLService:
 
     This service handles Let's Encrypt certificate operations
     using certbot.
+
+    Attributes:
+        _cert_cache: Parsed certificates keyed by (cert_path, domain),
+            storing (mtime_ns, cached_at, info)
+        _certbot_installed: Whether certbot was found on PATH
     """
 
     # Certificate paths
@@ -74,6 +119,18 @@ class SSLService:
     SELF_SIGNED_CERT = Path("/etc/nginx/ssl/rose-link.crt")
     SELF_SIGNED_KEY = Path("/etc/nginx/ssl/rose-link.key")
 
+    # How long a parsed certificate is reused before re-running openssl
+    CERT_CACHE_TTL = Limits.CERT_CACHE_TTL
+
+    _cert_cache: Dict[Tuple[str, str], Tuple[int, float, CertificateInfo]] = {}
+    _certbot_installed: bool = False
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the certificate cache to force re-parsing."""
+        cls._cert_cache = {}
+        logger.debug("Certificate cache cleared")
+
     @classmethod
     def get_certificate_info(cls, domain: str = "roselink.local") -> CertificateInfo:
         """
@@ -90,14 +147,17 @@ class SSLService:
         le_key = cls.CERT_DIR / domain / "privkey.pem"
 
         if le_cert.exists() and le_key.exists():
-            return cls._parse_certificate(le_cert, le_key, domain)
+            return cls._get_cached_certificate(
+                le_cert, le_key, domain, is_self_signed=False
+            )
 
         # Fall back to self-signed certificate
         if cls.SELF_SIGNED_CERT.exists():
-            return cls._parse_certificate(
+            return cls._get_cached_certificate(
                 cls.SELF_SIGNED_CERT,
                 cls.SELF_SIGNED_KEY,
-                domain
+                domain,
+                is_self_signed=True,
             )
 
         return CertificateInfo(
@@ -106,20 +166,66 @@ class SSLService:
             is_self_signed=True,
         )
 
+    @classmethod
+    def _get_cached_certificate(
+        cls,
+        cert_path: Path,
+        key_path: Path,
+        domain: str,
+        is_self_signed: bool = True,
+    ) -> CertificateInfo:
+        """
+        Return parsed certificate info, reusing a recent parse if possible.
+
+        Entries are invalidated when the certificate file's mtime changes
+        (e.g. after renewal) or once CERT_CACHE_TTL has elapsed. Callers
+        get their own copy, so changing it does not alter the cache.
+
+        Args:
+            cert_path: Path to certificate file
+            key_path: Path to private key file
+            domain: Domain name
+            is_self_signed: Whether cert_path is the self-signed certificate
+
+        Returns:
+            CertificateInfo with parsed details
+        """
+        try:
+            mtime_ns = cert_path.stat().st_mtime_ns
+        except OSError:
+            return cls._parse_certificate(cert_path, key_path, domain, is_self_signed)
+
+        key = (str(cert_path), domain)
+        now = time.monotonic()
+        cached = cls._cert_cache.get(key)
+        if cached is not None:
+            cached_mtime, cached_at, info = cached
+            if cached_mtime == mtime_ns and now - cached_at < cls.CERT_CACHE_TTL:
+                return replace(info)
+
+        info = cls._parse_certificate(cert_path, key_path, domain, is_self_signed)
+        cls._cert_cache[key] = (mtime_ns, now, info)
+        return replace(info)
+
     @classmethod
     def _parse_certificate(
         cls,
         cert_path: Path,
         key_path: Path,
-        domain: str
+        domain: str,
+        is_self_signed: bool = True,
     ) -> CertificateInfo:
         """
         Parse certificate information using openssl.
 
+        Whether the certificate is self-signed is decided by the caller
+        from the path it was loaded from, not from the issuer string.
+
         Args:
             cert_path: Path to certificate file
             key_path: Path to private key file
             domain: Domain name
+            is_self_signed: Whether cert_path is the self-signed certificate
 
         Returns:
             CertificateInfo with parsed details
@@ -127,6 +233,7 @@ class SSLService:
         info = CertificateInfo(
             domain=domain,
             valid=True,
+            is_self_signed=is_self_signed,
             cert_path=str(cert_path),
             key_path=str(key_path),
         )
@@ -144,10 +251,7 @@ class SSLService:
         # Parse issuer
         issuer_match = re.search(r"issuer=(.+)", out)
         if issuer_match:
-            issuer = issuer_match.group(1).strip()
-            info.issuer = issuer
-            # Check if self-signed
-            info.is_self_signed = "Let's Encrypt" not in issuer
+            info.issuer = issuer_match.group(1).strip()
 
         # Parse dates
         not_before_match = re.search(r"notBefore=(.+)", out)
@@ -162,10 +266,7 @@ class SSLService:
             # Parse expiry date and calculate days remaining
             try:
                 # Format: "Nov 26 12:00:00 2025 GMT"
-                expiry = datetime.strptime(
-                    not_after_str.replace(" GMT", ""),
-                    "%b %d %H:%M:%S %Y"
-                )
+                expiry = _parse_openssl_date(not_after_str)
                 delta = expiry - datetime.now()
                 info.days_until_expiry = max(0, delta.days)
             except ValueError:
@@ -178,11 +279,16 @@ class SSLService:
         """
         Check if certbot is installed.
 
+        Looks certbot up on PATH without spawning a process. A positive
+        result is cached for the life of the process; a negative one is
+        re-checked so installing certbot doesn't require a restart.
+
         Returns:
             True if certbot is available
         """
-        ret, _, _ = run_command(["which", "certbot"], check=False)
-        return ret == 0
+        if not cls._certbot_installed:
+            cls._certbot_installed = shutil.which("certbot") is not None
+        return cls._certbot_installed
 
     @classmethod
     def request_certificate(
@@ -210,7 +316,7 @@ class SSLService:
 
         # Build certbot command
         cmd = [
-            "sudo", "certbot", "certonly",
+            *_SUDO, "certbot", "certonly",
             "--nginx",
             "-d", domain,
             "--email", email,
@@ -255,7 +361,7 @@ class SSLService:
         if not cls.check_certbot_installed():
             raise RuntimeError("certbot is not installed")
 
-        cmd = ["sudo", "certbot", "renew"]
+        cmd = [*_SUDO, "certbot", "renew"]
 
         if dry_run:
             cmd.append("--dry-run")
@@ -293,12 +399,12 @@ class SSLService:
         # Ensure directory exists
         ssl_dir = cls.SELF_SIGNED_CERT.parent
         ret, _, err = run_command([
-            "sudo", "mkdir", "-p", str(ssl_dir)
+            *_SUDO, "mkdir", "-p", str(ssl_dir)
         ], check=False)
 
         # Generate self-signed certificate
         cmd = [
-            "sudo", "openssl", "req", "-x509",
+            *_SUDO, "openssl", "req", "-x509",
             "-nodes",
             "-days", "365",
             "-newkey", "rsa:2048",
@@ -334,5 +440,5 @@ class SSLService:
         Returns:
             True if reload successful
         """
-        ret, _, _ = run_command(["sudo", "systemctl", "reload", "nginx"], check=False)
+        ret, _, _ = run_command([*_SUDO, "systemctl", "reload", "nginx"], check=False)
         return ret == 0
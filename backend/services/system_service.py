@@ -18,12 +18,15 @@ License: MIT
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from config import Paths, Services, Limits
 from models import (
@@ -32,12 +35,125 @@ from models import (
     WiFiCapabilities,
     InterfaceInfo,
 )
+from utils import json_codec
 from utils.command_runner import run_command, CommandRunner
 from utils.sanitizers import sanitize_service_name
 from services.interface_service import InterfaceService
 
+try:
+    from pyroute2 import IPRoute
+except ImportError:  # pragma: no cover - depends on the environment
+    IPRoute = None
+
 logger = logging.getLogger("rose-link.system")
 
+# Device tree model substrings and their short names, most specific first
+_MODEL_MAP = (
+    ("Raspberry Pi 5", "Pi 5"),
+    ("Raspberry Pi 4", "Pi 4"),
+    ("Raspberry Pi 3", "Pi 3"),
+    ("Raspberry Pi Zero 2", "Zero 2W"),
+    ("Raspberry Pi", "Pi"),
+)
+
+# Interface name prefixes for each get_interfaces() category
+_INTERFACE_CATEGORIES = (
+    (("eth", "end", "enp"), "ethernet"),
+    (("wlan", "wlp"), "wifi"),
+    (("wg",), "vpn"),
+)
+
+# PRETTY_NAME value in /etc/os-release, with optional quoting
+_OS_RELEASE_RE = re.compile(rb"""^PRETTY_NAME=["']?([^"'\n]*)""", re.MULTILINE)
+
+# SystemInfo fields that cannot change without a reboot
+_STATIC_FIELDS = ("model", "model_short", "architecture", "kernel_version", "os_version")
+
+# 'iw list' markers, with groups named after the WiFiCapabilities flags:
+# 5xxx MHz frequencies, 802.11ac (VHT), 802.11ax (HE) and AP mode support
+_IW_CAPS_RE = re.compile(
+    r"(?P<supports_5ghz>5\d{3} MHz)"
+    r"|(?P<supports_ac>VHT)"
+    r"|(?P<supports_ax>HE)"
+    r"|(?P<ap_mode>\* AP)"
+)
+
+# Runs the independent get_info() collectors concurrently
+_collector_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rose-sysinfo")
+
+
+class _KeptFd:
+    """A kept-open descriptor and the number of reads currently using it."""
+
+    __slots__ = ("fd", "readers", "retired")
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.readers = 0
+        self.retired = False
+
+
+# Descriptors for frequently polled procfs/sysfs files, kept open
+# across calls. Reads use pread() at offset 0, so they need no seek and
+# can be shared between threads. A retired descriptor is only closed
+# once no read is using it, so its number cannot be reused under a
+# reader still holding it.
+_kept_fds: Dict[Path, _KeptFd] = {}
+_kept_fds_lock = threading.Lock()
+
+
+def _release_kept_fd(kept: _KeptFd) -> None:
+    """Close a retired descriptor once its last reader is done (lock held)."""
+    if kept.retired and kept.readers == 0:
+        os.close(kept.fd)
+
+
+def _read_kept_open(path: Path, size: int = 4096) -> bytes:
+    """
+    Read a frequently polled procfs/sysfs file through a kept-open fd.
+
+    procfs and sysfs regenerate the contents when read from offset 0,
+    so a single pread() returns fresh data without reopening the file.
+
+    Args:
+        path: File to read
+        size: Maximum number of bytes to read
+
+    Returns:
+        File contents (up to size bytes)
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    with _kept_fds_lock:
+        kept = _kept_fds.get(path)
+        if kept is None:
+            kept = _kept_fds[path] = _KeptFd(os.open(path, os.O_RDONLY))
+        kept.readers += 1
+
+    try:
+        return os.pread(kept.fd, size, 0)
+    except OSError:
+        # Drop the descriptor so the next call reopens the file
+        with _kept_fds_lock:
+            if _kept_fds.get(path) is kept:
+                del _kept_fds[path]
+                kept.retired = True
+        raise
+    finally:
+        with _kept_fds_lock:
+            kept.readers -= 1
+            _release_kept_fd(kept)
+
+
+def _close_kept_fds() -> None:
+    """Close all kept-open procfs/sysfs descriptors once no read uses them."""
+    with _kept_fds_lock:
+        for kept in _kept_fds.values():
+            kept.retired = True
+            _release_kept_fd(kept)
+        _kept_fds.clear()
+
 
 class SystemService:
     """
@@ -45,8 +161,37 @@ class SystemService:
 
     This service provides comprehensive system information including
     hardware details, resource usage, and network configuration.
+
+    Attributes:
+        _static_info: Values of the fields in _STATIC_FIELDS, collected
+            on the first get_info() call and reused afterwards
+        _wifi_caps_cache: Parsed 'iw list' capabilities, keyed by the
+            wireless PHYs present when they were detected
+        _cpu_prev: (idle, total) jiffies and monotonic time of the
+            previous /proc/stat sample
+        _cpu_percent: CPU usage computed from the last sample
     """
 
+    # Polls closer together than this reuse the last CPU usage reading
+    CPU_SAMPLE_MIN_INTERVAL = Limits.CPU_SAMPLE_MIN_INTERVAL
+
+    _static_info: Optional[Dict[str, Any]] = None
+    _wifi_caps_cache: Optional[Tuple[Tuple[str, ...], WiFiCapabilities]] = None
+    _cpu_prev: Optional[Tuple[int, int, float]] = None
+    _cpu_percent: Optional[float] = None
+    _cpu_lock = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the static system info cache to force re-detection."""
+        cls._static_info = None
+        cls._wifi_caps_cache = None
+        with cls._cpu_lock:
+            cls._cpu_prev = None
+            cls._cpu_percent = None
+        _close_kept_fds()
+        logger.debug("System info cache cleared")
+
     @classmethod
     def get_info(cls) -> SystemInfo:
         """
@@ -65,19 +210,42 @@ class SystemService:
         """
         info = SystemInfo()
 
-        # Gather information from various sources
-        cls._get_model_info(info)
-        cls._get_architecture(info)
-        cls._get_software_versions(info)
-        cls._get_memory_info(info)
-        cls._get_disk_info(info)
-        cls._get_cpu_info(info)
-        cls._get_uptime(info)
-        cls._get_interface_config(info)
-        cls._get_wifi_capabilities(info)
+        # Gather information from various sources. Each collector writes
+        # its own fields, so they can safely run in parallel.
+        collectors = (
+            cls._get_memory_info,
+            cls._get_disk_info,
+            cls._get_cpu_info,
+            cls._get_uptime,
+            cls._get_interface_config,
+            cls._get_wifi_capabilities,
+        )
+        futures = [_collector_pool.submit(collector, info) for collector in collectors]
+        cls._get_static_info(info)
+
+        for future in futures:
+            future.result()
 
         return info
 
+    @classmethod
+    def _get_static_info(cls, info: SystemInfo) -> None:
+        """
+        Fill in model, architecture and software versions.
+
+        These only change across reboots, so they are read once and
+        copied from the cache on later calls.
+        """
+        if cls._static_info is None:
+            cls._get_model_info(info)
+            cls._get_architecture(info)
+            cls._get_software_versions(info)
+            cls._static_info = {name: getattr(info, name) for name in _STATIC_FIELDS}
+            return
+
+        for name, value in cls._static_info.items():
+            setattr(info, name, value)
+
     @classmethod
     def _get_model_info(cls, info: SystemInfo) -> None:
         """Get Raspberry Pi model information."""
@@ -89,16 +257,10 @@ class SystemService:
             info.model = model
 
             # Extract short model name
-            if "Raspberry Pi 5" in model:
-                info.model_short = "Pi 5"
-            elif "Raspberry Pi 4" in model:
-                info.model_short = "Pi 4"
-            elif "Raspberry Pi 3" in model:
-                info.model_short = "Pi 3"
-            elif "Raspberry Pi Zero 2" in model:
-                info.model_short = "Zero 2W"
-            elif "Raspberry Pi" in model:
-                info.model_short = "Pi"
+            for needle, short_name in _MODEL_MAP:
+                if needle in model:
+                    info.model_short = short_name
+                    break
 
         except (IOError, OSError) as e:
             logger.debug(f"Could not read model info: {e}")
@@ -106,97 +268,124 @@ class SystemService:
     @classmethod
     def _get_architecture(cls, info: SystemInfo) -> None:
         """Get system architecture."""
-        ret, out, _ = run_command(["uname", "-m"], check=False)
-        if ret == 0:
-            info.architecture = out.strip()
+        info.architecture = os.uname().machine
 
     @classmethod
     def _get_software_versions(cls, info: SystemInfo) -> None:
         """Get kernel and OS versions."""
         # Kernel version
-        ret, out, _ = run_command(["uname", "-r"], check=False)
-        if ret == 0:
-            info.kernel_version = out.strip()
+        info.kernel_version = os.uname().release
 
         # OS version
-        if Paths.OS_RELEASE.exists():
-            try:
-                with open(Paths.OS_RELEASE, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if line.startswith("PRETTY_NAME="):
-                            info.os_version = line.split("=", 1)[1].strip().strip('"')
-                            break
-            except (IOError, OSError):
-                pass
+        try:
+            match = _OS_RELEASE_RE.search(Paths.OS_RELEASE.read_bytes())
+        except OSError:
+            return
+        if match:
+            info.os_version = match.group(1).decode("utf-8", "replace").strip()
 
     @classmethod
     def _get_memory_info(cls, info: SystemInfo) -> None:
-        """Get RAM information."""
-        ret, out, _ = run_command(["free", "-m"], check=False)
-        if ret != 0:
+        """Get RAM information from /proc/meminfo."""
+        try:
+            # MemTotal, MemFree and MemAvailable are the first three lines
+            content = _read_kept_open(Paths.PROC_MEMINFO, 256)
+        except OSError as e:
+            logger.debug(f"Could not read memory info: {e}")
             return
 
-        for line in out.splitlines():
-            if line.startswith("Mem:"):
-                parts = line.split()
-                if len(parts) >= 4:
-                    try:
-                        info.ram_mb = int(parts[1])
-                        info.ram_free_mb = int(parts[3])
-                    except ValueError:
-                        pass
-                break
+        fields: Dict[bytes, int] = {}
+        for line in content.splitlines():
+            key, _, value = line.partition(b":")
+            if key in (b"MemTotal", b"MemFree", b"MemAvailable"):
+                try:
+                    # Values are in kB
+                    fields[key] = int(value.split()[0]) >> 10
+                except (ValueError, IndexError):
+                    pass
+
+        if b"MemTotal" in fields:
+            info.ram_mb = fields[b"MemTotal"]
+        # MemAvailable (kernel 3.14+) includes reclaimable cache
+        free = fields.get(b"MemAvailable", fields.get(b"MemFree"))
+        if free is not None:
+            info.ram_free_mb = free
 
     @classmethod
     def _get_disk_info(cls, info: SystemInfo) -> None:
-        """Get disk usage information."""
-        ret, out, _ = run_command(["df", "-BG", "/"], check=False)
-        if ret != 0:
+        """Get disk usage information for the root filesystem."""
+        try:
+            st = os.statvfs("/")
+        except OSError as e:
+            logger.debug(f"Could not stat root filesystem: {e}")
             return
 
-        lines = out.strip().split("\n")
-        if len(lines) >= 2:
-            parts = lines[1].split()
-            if len(parts) >= 4:
-                try:
-                    info.disk_total_gb = int(parts[1].rstrip("G"))
-                    info.disk_free_gb = int(parts[3].rstrip("G"))
-                except ValueError:
-                    pass
+        # Free space as available to unprivileged users, like df
+        info.disk_total_gb = (st.f_blocks * st.f_frsize) >> 30
+        info.disk_free_gb = (st.f_bavail * st.f_frsize) >> 30
 
     @classmethod
     def _get_cpu_info(cls, info: SystemInfo) -> None:
         """Get CPU temperature and usage."""
         # Temperature
-        if Paths.THERMAL_ZONE.exists():
-            try:
-                temp = int(Paths.THERMAL_ZONE.read_text().strip())
-                info.cpu_temp_c = temp // 1000
-            except (IOError, OSError, ValueError):
-                pass
-
-        # CPU usage (simple calculation)
-        ret, out, _ = run_command(["grep", "cpu ", str(Paths.PROC_STAT)], check=False)
-        if ret == 0:
-            parts = out.split()
-            if len(parts) >= 5:
-                try:
-                    idle = int(parts[4])
-                    total = sum(int(x) for x in parts[1:])
-                    if total > 0:
-                        info.cpu_usage_percent = round(100 * (1 - idle / total), 1)
-                except (ValueError, IndexError):
-                    pass
+        try:
+            temp = int(_read_kept_open(Paths.THERMAL_ZONE, 32))
+            info.cpu_temp_c = temp // 1000
+        except (OSError, ValueError):
+            pass
+
+        # CPU usage from the aggregate "cpu" line, which always fits in
+        # the first 512 bytes
+        try:
+            content = _read_kept_open(Paths.PROC_STAT, 512)
+        except OSError:
+            return
+
+        # Split only the first line; int() parses the bytes fields as-is
+        end = content.find(b"\n")
+        parts = (content if end < 0 else content[:end]).split()
+        if len(parts) < 5 or parts[0] != b"cpu":
+            return
+
+        try:
+            idle = int(parts[4])
+            total = sum(int(x) for x in parts[1:])
+        except ValueError:
+            return
+
+        # Usage since the previous sample; the first call falls back to
+        # the average since boot. get_info() runs on a thread pool, so the
+        # sample is read and replaced under a lock.
+        with cls._cpu_lock:
+            now = time.monotonic()
+            prev = cls._cpu_prev
+            if prev is not None and (
+                now - prev[2] < cls.CPU_SAMPLE_MIN_INTERVAL or total <= prev[1]
+            ):
+                # Too short a window to measure; report the last reading
+                # and keep the old sample so the next window is longer
+                if cls._cpu_percent is not None:
+                    info.cpu_usage_percent = cls._cpu_percent
+                return
+
+            cls._cpu_prev = (idle, total, now)
+            if prev is not None:
+                idle -= prev[0]
+                total -= prev[1]
+
+            if total > 0:
+                cls._cpu_percent = round(100 * (1 - idle / total), 1)
+            if cls._cpu_percent is not None:
+                info.cpu_usage_percent = cls._cpu_percent
 
     @classmethod
     def _get_uptime(cls, info: SystemInfo) -> None:
         """Get system uptime."""
-        if Paths.PROC_UPTIME.exists():
-            try:
-                content = Paths.PROC_UPTIME.read_text()
-                info.uptime_seconds = int(float(content.split()[0]))
-            except (IOError, OSError, ValueError, IndexError):
-                pass
+        try:
+            content = _read_kept_open(Paths.PROC_UPTIME, 64)
+            info.uptime_seconds = int(float(content.split(b" ", 1)[0]))
+        except (OSError, ValueError):
+            pass
 
     @classmethod
     def _get_interface_config(cls, info: SystemInfo) -> None:
@@ -206,29 +395,41 @@ class SystemService:
 
     @classmethod
     def _get_wifi_capabilities(cls, info: SystemInfo) -> None:
-        """Detect WiFi hardware capabilities."""
+        """
+        Detect WiFi hardware capabilities.
+
+        The parsed 'iw list' output is cached until the set of wireless
+        PHYs changes (e.g. a USB adapter is plugged in or removed).
+        """
+        try:
+            phys = tuple(sorted(os.listdir(Paths.SYS_IEEE80211)))
+        except OSError:
+            phys = ()
+
+        cached = cls._wifi_caps_cache
+        if cached is not None and cached[0] == phys:
+            info.wifi_capabilities = cached[1]
+            return
+
         ret, out, _ = run_command(["iw", "list"], check=False)
         if ret != 0:
             return
 
         caps = WiFiCapabilities()
 
-        # Check for 5GHz support (look for 5xxx MHz frequencies)
-        if re.search(r"5[0-9]{3} MHz", out):
-            caps.supports_5ghz = True
+        # Single pass over the output, stopping once every flag is found
+        found: set[str] = set()
+        for match in _IW_CAPS_RE.finditer(out):
+            flag = match.lastgroup
+            if flag:
+                found.add(flag)
+                if len(found) == _IW_CAPS_RE.groups:
+                    break
 
-        # Check for 802.11ac (VHT)
-        if "VHT" in out:
-            caps.supports_ac = True
-
-        # Check for 802.11ax (HE)
-        if "HE" in out:
-            caps.supports_ax = True
-
-        # Check for AP mode support
-        if "* AP" in out:
-            caps.ap_mode = True
+        for flag in found:
+            setattr(caps, flag, True)
 
+        cls._wifi_caps_cache = (phys, caps)
         info.wifi_capabilities = caps
 
     # =========================================================================
@@ -249,36 +450,93 @@ class SystemService:
             "vpn": [],
         }
 
-        # Get interface information using JSON output
-        ret, out, _ = run_command(["ip", "-j", "addr", "show"], check=False)
-        if ret != 0:
-            return result
-
-        try:
-            interfaces = json.loads(out)
-        except json.JSONDecodeError:
+        interfaces = cls._dump_interfaces()
+        if interfaces is None:
             return result
 
         for iface in interfaces:
-            info = cls._parse_interface_info(iface)
+            # Categorize by name prefix before parsing, so loopback,
+            # bridges, veth pairs etc. are skipped without building an
+            # InterfaceInfo for them
+            name = iface.get("ifname") or ""
+            category = next(
+                (cat for prefixes, cat in _INTERFACE_CATEGORIES if name.startswith(prefixes)),
+                None,
+            )
+            if category is None:
+                continue
 
+            info = cls._parse_interface_info(iface)
             if info is None:
                 continue
 
-            # Categorize by name prefix
-            name = info.name
-            if name.startswith(("eth", "end", "enp")):
-                result["ethernet"].append(info)
-            elif name.startswith(("wlan", "wlp")):
+            if category == "wifi":
                 # Add WiFi-specific info
                 info.type = InterfaceService.get_interface_type(name)
                 info.driver = InterfaceService.get_interface_driver(name)
-                result["wifi"].append(info)
-            elif name.startswith("wg"):
-                result["vpn"].append(info)
+            result[category].append(info)
 
         return result
 
+    @classmethod
+    def _dump_interfaces(cls) -> Optional[list[dict]]:
+        """
+        List interfaces in 'ip -j addr show' format.
+
+        Queries netlink directly via pyroute2 when it is installed,
+        falling back to the ip command otherwise.
+
+        Returns:
+            List of interface dictionaries, or None on failure
+        """
+        if IPRoute is not None:
+            try:
+                return cls._dump_interfaces_netlink()
+            except Exception as e:
+                logger.debug(f"Netlink interface query failed: {e}")
+
+        # Get interface information using JSON output
+        ret, out, _ = run_command(["ip", "-j", "addr", "show"], check=False)
+        if ret != 0:
+            return None
+
+        try:
+            return json_codec.loads(out)
+        except json_codec.JSONDecodeError:
+            return None
+
+    @classmethod
+    def _dump_interfaces_netlink(cls) -> list[dict]:
+        """
+        List interfaces and their IPv4 addresses over netlink.
+
+        Only the fields used by _parse_interface_info are filled in.
+
+        Returns:
+            List of interface dictionaries shaped like 'ip -j' output
+        """
+        with IPRoute() as ipr:
+            links = ipr.get_links()
+            addrs = ipr.get_addr(family=socket.AF_INET)
+
+        addr_info: dict[int, list[dict]] = {}
+        for msg in addrs:
+            local = msg.get_attr("IFA_LOCAL") or msg.get_attr("IFA_ADDRESS")
+            if local:
+                addr_info.setdefault(msg["index"], []).append(
+                    {"family": "inet", "local": local}
+                )
+
+        return [
+            {
+                "ifname": link.get_attr("IFLA_IFNAME"),
+                "operstate": link.get_attr("IFLA_OPERSTATE") or "unknown",
+                "address": link.get_attr("IFLA_ADDRESS") or "",
+                "addr_info": addr_info.get(link["index"], []),
+            }
+            for link in links
+        ]
+
     @classmethod
     def _parse_interface_info(cls, data: dict) -> Optional[InterfaceInfo]:
         """
@@ -31,7 +31,11 @@ License: MIT
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
 
 from .base import VPNProvider, VPNType, VPNConnectionStatus, VPNTransferStats, VPNProfileInfo
 from .wireguard import WireGuardProvider
@@ -39,6 +43,8 @@ from .openvpn import OpenVPNProvider
 
 logger = logging.getLogger("rose-link.vpn")
 
+T = TypeVar("T")
+
 __all__ = [
     "VPNManager",
     "VPNProvider",
@@ -50,6 +56,12 @@ __all__ = [
     "OpenVPNProvider",
 ]
 
+# Profile file extensions (lowercase) and the provider that handles them
+_EXT_MAP: dict[str, VPNType] = {
+    ".conf": VPNType.WIREGUARD,
+    ".ovpn": VPNType.OPENVPN,
+}
+
 
 class VPNManager:
     """
@@ -59,9 +71,22 @@ class VPNManager:
     connections and profiles.
     """
 
-    # Provider instances (lazy-loaded singletons)
-    _wireguard: Optional[WireGuardProvider] = None
-    _openvpn: Optional[OpenVPNProvider] = None
+    # Provider classes by type; instances are created on first use
+    _factories: dict[VPNType, type[VPNProvider]] = {
+        VPNType.WIREGUARD: WireGuardProvider,
+        VPNType.OPENVPN: OpenVPNProvider,
+    }
+    _providers: dict[VPNType, VPNProvider] = {}
+
+    # Queries both providers concurrently (each one shells out)
+    _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rose-vpn")
+
+    # How long the result of an active-VPN probe is reused
+    ACTIVE_CACHE_TTL = 1.0
+
+    _active_cache: Optional[VPNType] = None
+    _active_cache_ts: float = float("-inf")
+    _active_lock = threading.Lock()
 
     @classmethod
     def get_provider(cls, vpn_type: VPNType) -> VPNProvider:
@@ -77,17 +102,47 @@ class VPNManager:
         Raises:
             ValueError: If unknown VPN type
         """
-        if vpn_type == VPNType.WIREGUARD:
-            if cls._wireguard is None:
-                cls._wireguard = WireGuardProvider()
-            return cls._wireguard
-        elif vpn_type == VPNType.OPENVPN:
-            if cls._openvpn is None:
-                cls._openvpn = OpenVPNProvider()
-            return cls._openvpn
-        else:
+        provider = cls._providers.get(vpn_type)
+        if provider is not None:
+            return provider
+
+        factory = cls._factories.get(vpn_type)
+        if factory is None:
             raise ValueError(f"Unknown VPN type: {vpn_type}")
 
+        return cls._providers.setdefault(vpn_type, factory())
+
+    @classmethod
+    def _submit_all(cls, func: Callable[[VPNProvider], T]) -> list[Future[T]]:
+        """
+        Call a function on every provider concurrently.
+
+        Args:
+            func: Function taking a provider
+
+        Returns:
+            Futures in VPNType order (WireGuard, then OpenVPN)
+        """
+        return [
+            cls._executor.submit(func, cls.get_provider(vpn_type))
+            for vpn_type in VPNType
+        ]
+
+    @staticmethod
+    def _status_if_active(provider: VPNProvider) -> VPNConnectionStatus:
+        """
+        Get a provider's full status only if it is running.
+
+        Uses the cheap is_active() check first; an inactive provider
+        gets a default status with the same shape as get_status().
+        """
+        if provider.is_active():
+            return provider.get_status()
+        return VPNConnectionStatus(
+            vpn_type=provider.vpn_type,
+            interface=provider.interface_name,
+        )
+
     @classmethod
     def detect_vpn_type(cls, filename: str) -> VPNType:
         """
@@ -102,17 +157,13 @@ class VPNManager:
         Raises:
             ValueError: If extension not recognized
         """
-        filename_lower = filename.lower()
-
-        if filename_lower.endswith(".conf"):
-            return VPNType.WIREGUARD
-        elif filename_lower.endswith(".ovpn"):
-            return VPNType.OPENVPN
-        else:
+        vpn_type = _EXT_MAP.get(os.path.splitext(filename)[1].lower())
+        if vpn_type is None:
             raise ValueError(
                 f"Unknown VPN config file type: {filename}. "
                 "Use .conf for WireGuard or .ovpn for OpenVPN."
             )
+        return vpn_type
 
     @classmethod
     def get_combined_status(cls) -> dict[str, Any]:
@@ -122,12 +173,15 @@ class VPNManager:
         Returns:
             Dictionary with status from each provider
         """
-        wireguard = cls.get_provider(VPNType.WIREGUARD)
-        openvpn = cls.get_provider(VPNType.OPENVPN)
-
-        wg_status = wireguard.get_status()
-        ovpn_status = openvpn.get_status()
-
+        wg_future, ovpn_future = cls._submit_all(cls._status_if_active)
+        return cls._combine_statuses(wg_future.result(), ovpn_future.result())
+
+    @staticmethod
+    def _combine_statuses(
+        wg_status: VPNConnectionStatus,
+        ovpn_status: VPNConnectionStatus,
+    ) -> dict[str, Any]:
+        """Build the combined status response from both providers."""
         # Determine which VPN is currently active
         active_vpn = None
         active_status = None
@@ -154,17 +208,12 @@ class VPNManager:
         Returns:
             VPNConnectionStatus of active VPN, or inactive status if none
         """
-        wireguard = cls.get_provider(VPNType.WIREGUARD)
-        wg_status = wireguard.get_status()
-
-        if wg_status.active:
-            return wg_status
-
-        openvpn = cls.get_provider(VPNType.OPENVPN)
-        ovpn_status = openvpn.get_status()
-
-        if ovpn_status.active:
-            return ovpn_status
+        for vpn_type in VPNType:
+            provider = cls.get_provider(vpn_type)
+            if provider.is_active():
+                status = provider.get_status()
+                if status.active:
+                    return status
 
         # Return inactive WireGuard status as default
         return VPNConnectionStatus(vpn_type=VPNType.WIREGUARD)
@@ -179,11 +228,8 @@ class VPNManager:
         """
         profiles = []
 
-        wireguard = cls.get_provider(VPNType.WIREGUARD)
-        profiles.extend(wireguard.list_profiles())
-
-        openvpn = cls.get_provider(VPNType.OPENVPN)
-        profiles.extend(openvpn.list_profiles())
+        for future in cls._submit_all(lambda provider: provider.list_profiles()):
+            profiles.extend(future.result())
 
         return profiles
 
@@ -220,7 +266,10 @@ class VPNManager:
         vpn_type = cls.detect_vpn_type(filename)
         provider = cls.get_provider(vpn_type)
 
-        profile_name = provider.import_profile(filename, content)
+        try:
+            profile_name = provider.import_profile(filename, content)
+        finally:
+            cls._invalidate_active_cache()
         return profile_name, vpn_type
 
     @classmethod
@@ -239,7 +288,10 @@ class VPNManager:
         cls.stop_all()
 
         provider = cls.get_provider(vpn_type)
-        return provider.activate_profile(name)
+        try:
+            return provider.activate_profile(name)
+        finally:
+            cls._invalidate_active_cache()
 
     @classmethod
     def delete_profile(cls, name: str, vpn_type: VPNType) -> bool:
@@ -279,7 +331,10 @@ class VPNManager:
             cls.get_provider(VPNType.WIREGUARD).stop()
 
         provider = cls.get_provider(vpn_type)
-        return provider.start()
+        try:
+            return provider.start()
+        finally:
+            cls._invalidate_active_cache()
 
     @classmethod
     def stop(cls, vpn_type: Optional[VPNType] = None) -> bool:
@@ -298,7 +353,10 @@ class VPNManager:
             return cls.stop_all()
 
         provider = cls.get_provider(vpn_type)
-        return provider.stop()
+        try:
+            return provider.stop()
+        finally:
+            cls._invalidate_active_cache()
 
     @classmethod
     def stop_all(cls) -> bool:
@@ -310,18 +368,14 @@ class VPNManager:
         """
         success = True
 
-        try:
-            cls.get_provider(VPNType.WIREGUARD).stop()
-        except Exception as e:
-            logger.debug(f"Error stopping WireGuard: {e}")
-            success = False
-
-        try:
-            cls.get_provider(VPNType.OPENVPN).stop()
-        except Exception as e:
-            logger.debug(f"Error stopping OpenVPN: {e}")
-            success = False
+        for vpn_type, future in zip(VPNType, cls._submit_all(lambda provider: provider.stop())):
+            try:
+                future.result()
+            except Exception as e:
+                logger.debug(f"Error stopping {vpn_type.value}: {e}")
+                success = False
 
+        cls._invalidate_active_cache()
         return success
 
     @classmethod
@@ -336,7 +390,41 @@ class VPNManager:
             True if successful
         """
         provider = cls.get_provider(vpn_type)
-        return provider.restart()
+        try:
+            return provider.restart()
+        finally:
+            cls._invalidate_active_cache()
+
+    @classmethod
+    def _invalidate_active_cache(cls) -> None:
+        """Force the next active-VPN check to probe the providers."""
+        cls._active_cache_ts = float("-inf")
+
+    @classmethod
+    def _probe_active_type(cls) -> Optional[VPNType]:
+        """
+        Find the active VPN, reusing a probe from the last ACTIVE_CACHE_TTL.
+
+        Concurrent callers wait for a single probe instead of each
+        querying the providers.
+
+        Returns:
+            VPNType of active VPN, or None if none active
+        """
+        with cls._active_lock:
+            now = time.monotonic()
+            if now - cls._active_cache_ts < cls.ACTIVE_CACHE_TTL:
+                return cls._active_cache
+
+            active: Optional[VPNType] = None
+            for vpn_type in VPNType:
+                if cls.get_provider(vpn_type).is_active():
+                    active = vpn_type
+                    break
+
+            cls._active_cache = active
+            cls._active_cache_ts = now
+            return active
 
     @classmethod
     def is_any_active(cls) -> bool:
@@ -346,10 +434,7 @@ class VPNManager:
         Returns:
             True if any VPN is connected
         """
-        return (
-            cls.get_provider(VPNType.WIREGUARD).is_active() or
-            cls.get_provider(VPNType.OPENVPN).is_active()
-        )
+        return cls._probe_active_type() is not None
 
     @classmethod
     def get_active_type(cls) -> Optional[VPNType]:
@@ -359,8 +444,4 @@ class VPNManager:
         Returns:
             VPNType of active VPN, or None if none active
         """
-        if cls.get_provider(VPNType.WIREGUARD).is_active():
-            return VPNType.WIREGUARD
-        elif cls.get_provider(VPNType.OPENVPN).is_active():
-            return VPNType.OPENVPN
-        return None
+        return cls._probe_active_type()
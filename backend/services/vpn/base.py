@@ -11,12 +11,19 @@ License: MIT
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, Optional
 
+from config import Limits
+from utils.compat import DATACLASS_OPTIONS
+
 
 class VPNType(str, Enum):
     """Supported VPN types."""
@@ -24,7 +31,7 @@ class VPNType(str, Enum):
     OPENVPN = "openvpn"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class VPNTransferStats:
     """VPN transfer statistics."""
 
@@ -43,7 +50,7 @@ class VPNTransferStats:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class VPNConnectionStatus:
     """Current VPN connection status."""
 
@@ -70,7 +77,7 @@ class VPNConnectionStatus:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class VPNProfileInfo:
     """Information about a VPN profile."""
 
@@ -94,8 +101,68 @@ class VPNProvider(ABC):
     Abstract base class for VPN providers.
 
     Defines the interface that all VPN implementations must follow.
+
+    Attributes:
+        STATUS_CACHE_TTL: Seconds a status snapshot is reused, so bursts
+            of status polls share one round of system queries
     """
 
+    STATUS_CACHE_TTL: float = Limits.VPN_STATUS_CACHE_TTL
+
+    # Digests of recently validated configs, shared by all providers
+    VALIDATION_CACHE_SIZE = 128
+    _validated_configs: OrderedDict[tuple[VPNType, bytes], None] = OrderedDict()
+    _validated_lock = threading.Lock()
+
+    # (monotonic timestamp, status); set per instance once populated
+    _status_cache: Optional[tuple[float, VPNConnectionStatus]] = None
+
+    def _get_cached_status(self) -> Optional[VPNConnectionStatus]:
+        """
+        Return the last status if it is younger than STATUS_CACHE_TTL.
+
+        The returned object is shared with other callers and must not
+        be modified.
+        """
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            return cached[1]
+        return None
+
+    def _set_cached_status(self, status: VPNConnectionStatus) -> VPNConnectionStatus:
+        """Store a freshly read status and return it."""
+        self._status_cache = (time.monotonic(), status)
+        return status
+
+    @classmethod
+    def clear_validation_cache(cls) -> None:
+        """Forget which configs have already been validated."""
+        with cls._validated_lock:
+            cls._validated_configs.clear()
+
+    def _validation_key(self, content: bytes) -> tuple[VPNType, bytes]:
+        """Key identifying a config's content for this provider type."""
+        return self.vpn_type, hashlib.blake2b(content, digest_size=16).digest()
+
+    def _is_validated(self, key: tuple[VPNType, bytes]) -> bool:
+        """Whether a config with this key recently passed validation."""
+        with self._validated_lock:
+            if key in self._validated_configs:
+                self._validated_configs.move_to_end(key)
+                return True
+        return False
+
+    def _mark_validated(self, key: tuple[VPNType, bytes]) -> None:
+        """Remember a config that passed validation, evicting the oldest."""
+        with self._validated_lock:
+            self._validated_configs[key] = None
+            if len(self._validated_configs) > self.VALIDATION_CACHE_SIZE:
+                self._validated_configs.popitem(last=False)
+
+    def invalidate_status_cache(self) -> None:
+        """Drop the cached status, e.g. after starting or stopping the VPN."""
+        self._status_cache = None
+
     @property
     @abstractmethod
     def vpn_type(self) -> VPNType:
@@ -174,12 +241,16 @@ class VPNProvider(ABC):
         pass
 
     @abstractmethod
-    def activate_profile(self, name: str) -> bool:
+    def activate_profile(self, name: str, force: bool = False) -> bool:
         """
         Activate a VPN profile.
 
+        Does nothing if the profile is already active and running,
+        unless force is set.
+
         Args:
             name: Profile name (without extension)
+            force: Restart even if the profile is already active
 
         Returns:
             True if activation successful
@@ -20,6 +20,7 @@ from __future__ import annotations
 import logging
 import os
 import re
+import socket
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -33,10 +34,21 @@ from exceptions import (
     ValidationError,
 )
 from utils.command_runner import run_command, CommandRunner
+from utils.fileio import write_private_file
 from utils.sanitizers import sanitize_filename
 
 from .base import VPNProvider, VPNType, VPNConnectionStatus, VPNTransferStats, VPNProfileInfo
 
+try:
+    from pyroute2 import IPRoute
+except ImportError:  # pragma: no cover - depends on the environment
+    IPRoute = None
+
+try:
+    from systemd import journal
+except ImportError:  # pragma: no cover - depends on the environment
+    journal = None
+
 logger = logging.getLogger("rose-link.vpn.openvpn")
 
 # OpenVPN configuration
@@ -46,6 +58,48 @@ OPENVPN_AUTH_FILE = Path("/etc/openvpn/client/auth.txt")
 OPENVPN_SERVICE = "openvpn-client@active"
 OPENVPN_STATUS_FILE = Path("/var/run/openvpn/active.status")
 
+# Recent log entries searched for the endpoint
+OPENVPN_LOG_LINES = 50
+
+# Without pyroute2 and the journal bindings, the service, interface and
+# log queries run in one shell ($1 = unit, $2 = interface, $3 = lines)
+_STATUS_SEPARATOR = "__ROSE_STATUS_SEP__"
+_BATCHED_STATUS_SCRIPT = (
+    'systemctl is-active --quiet "$1" || exit 3; '
+    'ip addr show "$2" || exit 4; '
+    f'echo {_STATUS_SEPARATOR}; '
+    'journalctl -u "$1" -n "$3" --no-pager'
+)
+
+# Units for transfer counters, one per factor of 1024
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
+# Status file keys ("key,value" or "key: value" lines) and result fields
+_STATUS_FILE_FIELDS = {
+    "Connected Since": "connected_since",
+    "TUN/TAP read bytes": "received",
+    "TUN/TAP write bytes": "sent",
+}
+
+# Status parsing patterns
+_RE_INET = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)')
+_RE_CONNECTING = re.compile(r'Connecting to \[AF_INET\]([0-9.:]+)')
+_RE_PEER_INIT = re.compile(r'Peer Connection Initiated with \[AF_INET\]([0-9.:]+)')
+
+# Config validation: required directives plus ones that can run scripts.
+# Comment lines never match since the directive must start the line.
+# Byte patterns, so uploads are scanned without decoding them.
+_RE_DIRECTIVE = re.compile(
+    rb'^[ \t]*('
+    rb'remote(?=[ \t])|client(?=[ \t]*\r?$)'
+    rb'|script-security|up(?=[ \t])|down(?=[ \t])|route-up|route-pre-down'
+    rb'|ipchange|client-connect|client-disconnect|learn-address'
+    rb'|auth-user-pass-verify|tls-verify'
+    rb')',
+    re.IGNORECASE | re.MULTILINE,
+)
+_RE_CONNECTION_BLOCK = re.compile(rb'<connection>', re.IGNORECASE)
+
 
 class OpenVPNProvider(VPNProvider):
     """
@@ -53,8 +107,15 @@ class OpenVPNProvider(VPNProvider):
 
     Manages OpenVPN VPN profiles and connections using
     openvpn systemd service.
+
+    Attributes:
+        _status_file_sig: (mtime_ns, size) of the last parsed status file
+        _status_file_data: Result of the last status file parse
     """
 
+    _status_file_sig: Optional[tuple[int, int]] = None
+    _status_file_data: Optional[dict] = None
+
     @property
     def vpn_type(self) -> VPNType:
         return VPNType.OPENVPN
@@ -76,71 +137,161 @@ class OpenVPNProvider(VPNProvider):
         Get current OpenVPN connection status.
 
         Parses status from the OpenVPN status file and journalctl.
+        Results are reused for STATUS_CACHE_TTL seconds.
         """
+        status = self._get_cached_status()
+        if status is None:
+            status = self._set_cached_status(self._read_status())
+        return status
+
+    def _read_status(self) -> VPNConnectionStatus:
+        """Query the service, interface and logs for the current status."""
         status = VPNConnectionStatus(
             vpn_type=VPNType.OPENVPN,
             interface=self.interface_name,
         )
 
-        # Check if service is running
-        if not CommandRunner.is_service_active(OPENVPN_SERVICE):
-            return status
+        logs: Optional[str] = None
 
-        # Check if interface exists
-        ret, out, _ = run_command(f"ip addr show {self.interface_name}", timeout=5)
-        if ret != 0:
-            return status
+        if IPRoute is None and journal is None:
+            # One process instead of up to three
+            probe = self._probe_batched()
+            if probe is None:
+                return status
+            local_ip, logs = probe
+        else:
+            # Check if service is running
+            if not CommandRunner.is_service_active(OPENVPN_SERVICE):
+                return status
 
-        status.active = True
+            # Check if interface exists
+            exists, local_ip = self._query_interface()
+            if not exists:
+                return status
 
-        # Parse interface IP
-        ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', out)
-        if ip_match:
-            status.local_ip = ip_match.group(1)
+        status.active = True
+        status.local_ip = local_ip
 
         # Try to get status from status file
-        if OPENVPN_STATUS_FILE.exists():
-            try:
-                status_data = self._parse_status_file()
-                if status_data:
-                    status.connected_since = status_data.get("connected_since")
-                    status.endpoint = status_data.get("endpoint")
-                    status.transfer = status_data.get("transfer", VPNTransferStats())
-            except Exception as e:
-                logger.debug(f"Error parsing OpenVPN status file: {e}")
+        try:
+            status_data = self._parse_status_file()
+            if status_data:
+                status.connected_since = status_data.get("connected_since")
+                status.endpoint = status_data.get("endpoint")
+                status.transfer = status_data.get("transfer", VPNTransferStats())
+        except Exception as e:
+            logger.debug(f"Error parsing OpenVPN status file: {e}")
 
         # Fallback: get info from journalctl
         if not status.endpoint:
-            endpoint = self._get_endpoint_from_logs()
+            endpoint = self._get_endpoint_from_logs(logs)
             if endpoint:
                 status.endpoint = endpoint
 
         return status
 
+    def _probe_batched(self) -> Optional[tuple[Optional[str], str]]:
+        """
+        Check the service and interface and fetch recent logs in one shell.
+
+        Returns:
+            Tuple of (IPv4 address or None, recent log text), or None if
+            the service is not running or the interface does not exist
+        """
+        ret, out, _ = run_command(
+            [
+                "sh", "-c", _BATCHED_STATUS_SCRIPT, "sh",
+                OPENVPN_SERVICE, self.interface_name, str(OPENVPN_LOG_LINES),
+            ],
+            timeout=15,
+        )
+        addr_out, sep, logs = out.partition(f"{_STATUS_SEPARATOR}\n")
+        if not sep:
+            return None
+
+        ip_match = _RE_INET.search(addr_out)
+        return (ip_match.group(1) if ip_match else None), logs
+
+    def _query_interface(self) -> tuple[bool, Optional[str]]:
+        """
+        Check that the tunnel interface exists and get its IPv4 address.
+
+        Queries netlink directly via pyroute2 when it is installed,
+        falling back to the ip command otherwise.
+
+        Returns:
+            Tuple of (interface exists, IPv4 address or None)
+        """
+        if IPRoute is not None:
+            try:
+                with IPRoute() as ipr:
+                    indexes = ipr.link_lookup(ifname=self.interface_name)
+                    if not indexes:
+                        return False, None
+                    addrs = ipr.get_addr(index=indexes[0], family=socket.AF_INET)
+
+                for msg in addrs:
+                    local = msg.get_attr("IFA_LOCAL") or msg.get_attr("IFA_ADDRESS")
+                    if local:
+                        return True, local
+                return True, None
+            except Exception as e:
+                logger.debug(f"Netlink interface query failed: {e}")
+
+        ret, out, _ = run_command(["ip", "addr", "show", self.interface_name], timeout=5)
+        if ret != 0:
+            return False, None
+
+        ip_match = _RE_INET.search(out)
+        return True, ip_match.group(1) if ip_match else None
+
+    def invalidate_status_cache(self) -> None:
+        """Drop the cached status and status file parse."""
+        super().invalidate_status_cache()
+        self._status_file_sig = None
+        self._status_file_data = None
+
     def _parse_status_file(self) -> Optional[dict]:
-        """Parse OpenVPN status file for connection details."""
-        if not OPENVPN_STATUS_FILE.exists():
+        """
+        Parse OpenVPN status file for connection details.
+
+        OpenVPN rewrites the file every few seconds, so the previous
+        result is reused while the file's mtime and size are unchanged.
+        """
+        try:
+            st = os.stat(OPENVPN_STATUS_FILE)
+        except OSError:
             return None
 
+        sig = (st.st_mtime_ns, st.st_size)
+        if sig == self._status_file_sig:
+            return self._status_file_data
+
         try:
+            fields: dict[str, str] = {}
             with open(OPENVPN_STATUS_FILE, "r") as f:
-                content = f.read()
+                for line in f:
+                    key, _, value = line.partition(",")
+                    if key not in _STATUS_FILE_FIELDS:
+                        key, _, value = line.partition(":")
+                        if key not in _STATUS_FILE_FIELDS:
+                            continue
+                    fields[_STATUS_FILE_FIELDS[key]] = value.strip()
+                    if len(fields) == len(_STATUS_FILE_FIELDS):
+                        break
 
             result = {}
 
-            # Parse connected since
-            connected_match = re.search(r'Connected Since[,:](.+)', content)
-            if connected_match:
-                result["connected_since"] = connected_match.group(1).strip()
+            if "connected_since" in fields:
+                result["connected_since"] = fields["connected_since"]
 
-            # Parse transfer stats
             # Format: "TUN/TAP read bytes,123456" or similar
-            recv_match = re.search(r'TUN/TAP read bytes[,:](\d+)', content)
-            sent_match = re.search(r'TUN/TAP write bytes[,:](\d+)', content)
+            recv = fields.get("received", "")
+            sent = fields.get("sent", "")
 
-            if recv_match or sent_match:
-                recv_bytes = int(recv_match.group(1)) if recv_match else 0
-                sent_bytes = int(sent_match.group(1)) if sent_match else 0
+            if recv.isdigit() or sent.isdigit():
+                recv_bytes = int(recv) if recv.isdigit() else 0
+                sent_bytes = int(sent) if sent.isdigit() else 0
 
                 result["transfer"] = VPNTransferStats(
                     received=self._format_bytes(recv_bytes),
@@ -149,29 +300,34 @@ class OpenVPNProvider(VPNProvider):
                     sent_bytes=sent_bytes,
                 )
 
+            self._status_file_sig = sig
+            self._status_file_data = result
             return result
 
         except Exception as e:
             logger.debug(f"Error reading status file: {e}")
             return None
 
-    def _get_endpoint_from_logs(self) -> Optional[str]:
-        """Extract endpoint from OpenVPN logs."""
+    def _get_endpoint_from_logs(self, out: Optional[str] = None) -> Optional[str]:
+        """
+        Extract endpoint from OpenVPN logs.
+
+        Args:
+            out: Already fetched log text; read from the journal if None
+        """
         try:
-            ret, out, _ = run_command(
-                f"journalctl -u {OPENVPN_SERVICE} -n 50 --no-pager",
-                timeout=10
-            )
-            if ret != 0:
+            if out is None:
+                out = self._read_recent_logs()
+            if out is None:
                 return None
 
             # Look for connection line: "TCP/UDP: Connecting to [AF_INET]1.2.3.4:1194"
-            match = re.search(r'Connecting to \[AF_INET\]([0-9.:]+)', out)
+            match = _RE_CONNECTING.search(out)
             if match:
                 return match.group(1)
 
             # Alternative format: "peer info: IV_PLAT=..."
-            match = re.search(r'Peer Connection Initiated with \[AF_INET\]([0-9.:]+)', out)
+            match = _RE_PEER_INIT.search(out)
             if match:
                 return match.group(1)
 
@@ -180,37 +336,83 @@ class OpenVPNProvider(VPNProvider):
 
         return None
 
+    def _read_recent_logs(self) -> Optional[str]:
+        """
+        Read the last OPENVPN_LOG_LINES journal messages of the service.
+
+        Uses the systemd journal bindings when installed, which read the
+        unit's entries through journald's index instead of spawning
+        journalctl and parsing its rendered output.
+
+        Returns:
+            Messages oldest first, one per line, or None if unavailable
+        """
+        if journal is not None:
+            with journal.Reader() as reader:
+                reader.add_match(_SYSTEMD_UNIT=f"{OPENVPN_SERVICE}.service")
+                reader.seek_tail()
+                messages = []
+                for _ in range(OPENVPN_LOG_LINES):
+                    entry = reader.get_previous()
+                    if not entry:
+                        break
+                    messages.append(str(entry.get("MESSAGE", "")))
+            messages.reverse()
+            return "\n".join(messages)
+
+        ret, out, _ = run_command(
+            ["journalctl", "-u", OPENVPN_SERVICE, "-n", str(OPENVPN_LOG_LINES), "--no-pager"],
+            timeout=10
+        )
+        return out if ret == 0 else None
+
     def _format_bytes(self, size: int) -> str:
         """Format bytes to human-readable string."""
-        for unit in ["B", "KiB", "MiB", "GiB", "TiB"]:
-            if size < 1024:
-                return f"{size:.2f} {unit}"
-            size /= 1024
-        return f"{size:.2f} PiB"
+        # Each binary unit is 10 more bits
+        index = min(max(size.bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+        return f"{size / (1 << (10 * index)):.2f} {_BYTE_UNITS[index]}"
 
     def list_profiles(self) -> list[VPNProfileInfo]:
         """List all available OpenVPN profiles."""
         profiles = []
 
-        if not self.profiles_dir.exists():
+        try:
+            entries = list(os.scandir(self.profiles_dir))
+        except OSError:
             return profiles
 
         active_profile_path = self._get_active_profile_path()
 
-        for conf_file in self.profiles_dir.glob("*.ovpn"):
+        # The active symlink normally points into profiles_dir, in which
+        # case comparing names avoids resolving every profile
+        active_name = None
+        if active_profile_path:
+            try:
+                if active_profile_path.parent == self.profiles_dir.resolve():
+                    active_name = active_profile_path.name
+            except OSError:
+                pass
+
+        for entry in entries:
+            # d_type from the directory listing saves a stat per entry
+            if not entry.name.endswith(".ovpn") or not entry.is_file():
+                continue
+
             is_active = False
 
-            if active_profile_path:
+            if active_name is not None:
+                is_active = entry.name == active_name
+            elif active_profile_path:
                 try:
-                    is_active = conf_file.resolve() == active_profile_path
+                    is_active = Path(entry.path).resolve() == active_profile_path
                 except OSError:
                     pass
 
             profiles.append(VPNProfileInfo(
-                name=conf_file.stem,
+                name=entry.name[:-5],
                 vpn_type=VPNType.OPENVPN,
                 active=is_active,
-                filename=conf_file.name,
+                filename=entry.name,
             ))
 
         return profiles
@@ -227,6 +429,17 @@ class OpenVPNProvider(VPNProvider):
         except OSError:
             return None
 
+    def _is_active_profile(self, profile_path: Path) -> bool:
+        """Whether the active symlink points at the given profile."""
+        active_path = self._get_active_profile_path()
+        if active_path is None:
+            return False
+
+        try:
+            return profile_path.resolve() == active_path
+        except OSError:
+            return False
+
     def upload_profile(self, filename: str, content: bytes) -> str:
         """Upload a new OpenVPN profile without activating it."""
         # Check file size
@@ -248,11 +461,7 @@ class OpenVPNProvider(VPNProvider):
         profile_path = self.profiles_dir / safe_filename
         self._ensure_profiles_dir()
 
-        with open(profile_path, "wb") as f:
-            f.write(content)
-
-        # Set secure permissions
-        os.chmod(profile_path, 0o600)
+        write_private_file(profile_path, content)
 
         logger.info(f"OpenVPN profile uploaded: {safe_filename}")
         return safe_filename
@@ -262,12 +471,13 @@ class OpenVPNProvider(VPNProvider):
         safe_filename = self.upload_profile(filename, content)
         profile_name = safe_filename.replace('.ovpn', '')
 
-        self.activate_profile(profile_name)
+        # The file may have changed under an already active profile
+        self.activate_profile(profile_name, force=True)
 
         logger.info(f"OpenVPN profile imported and activated: {profile_name}")
         return profile_name
 
-    def activate_profile(self, name: str) -> bool:
+    def activate_profile(self, name: str, force: bool = False) -> bool:
         """Activate an OpenVPN profile."""
         safe_name = sanitize_filename(name)
         if safe_name.endswith('.ovpn'):
@@ -278,6 +488,10 @@ class OpenVPNProvider(VPNProvider):
         if not profile_path.exists():
             raise VPNProfileNotFoundError(safe_name)
 
+        if not force and self._is_active_profile(profile_path) and self.is_active():
+            logger.info(f"OpenVPN profile already active: {safe_name}")
+            return True
+
         # Stop current VPN
         self.stop()
 
@@ -302,13 +516,8 @@ class OpenVPNProvider(VPNProvider):
             raise VPNProfileNotFoundError(safe_name)
 
         # Check if this is the active profile
-        active_path = self._get_active_profile_path()
-        if active_path:
-            try:
-                if profile_path.resolve() == active_path:
-                    raise VPNProfileActiveError(safe_name)
-            except OSError:
-                pass
+        if self._is_active_profile(profile_path):
+            raise VPNProfileActiveError(safe_name)
 
         profile_path.unlink()
 
@@ -330,7 +539,9 @@ class OpenVPNProvider(VPNProvider):
         """Start the OpenVPN VPN connection."""
         logger.info("Starting OpenVPN VPN")
 
-        if not CommandRunner.start_service(OPENVPN_SERVICE):
+        succeeded = CommandRunner.start_service(OPENVPN_SERVICE)
+        self.invalidate_status_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to start OpenVPN VPN", operation="start")
 
         return True
@@ -341,19 +552,29 @@ class OpenVPNProvider(VPNProvider):
 
         # Stop service (ignore errors if not running)
         CommandRunner.stop_service(OPENVPN_SERVICE)
+        self.invalidate_status_cache()
         return True
 
     def restart(self) -> bool:
         """Restart the OpenVPN VPN connection."""
         logger.info("Restarting OpenVPN VPN")
 
-        if not CommandRunner.restart_service(OPENVPN_SERVICE):
+        succeeded = CommandRunner.restart_service(OPENVPN_SERVICE)
+        self.invalidate_status_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to restart OpenVPN VPN", operation="restart")
 
         return True
 
     def is_active(self) -> bool:
-        """Quick check if OpenVPN VPN is currently active."""
+        """
+        Quick check if OpenVPN VPN is currently active.
+
+        Answers from a fresh cached status when there is one.
+        """
+        status = self._get_cached_status()
+        if status is not None:
+            return status.active
         return CommandRunner.is_service_active(OPENVPN_SERVICE)
 
     def validate_config(self, content: bytes) -> bool:
@@ -361,55 +582,40 @@ class OpenVPNProvider(VPNProvider):
         Validate an OpenVPN configuration file.
 
         Checks for required directives and dangerous options.
+        Re-uploads of a config that recently passed are not re-checked.
         """
-        try:
-            config_text = content.decode("utf-8")
-        except UnicodeDecodeError:
-            raise ValidationError("OpenVPN config must be valid UTF-8 text")
+        key = self._validation_key(content)
+        if self._is_validated(key):
+            return True
 
-        lines = config_text.strip().split("\n")
+        # ASCII is valid UTF-8; otherwise decode only to check validity
+        if not content.isascii():
+            try:
+                content.decode("utf-8")
+            except UnicodeDecodeError:
+                raise ValidationError("OpenVPN config must be valid UTF-8 text")
 
-        if not lines:
+        if not content or content.isspace():
             raise ValidationError("OpenVPN config file is empty")
 
         # Check for at least a remote directive or embedded config
         has_remote = False
         has_client = False
 
-        for line in lines:
-            line = line.strip().lower()
-
-            # Skip comments and empty lines
-            if not line or line.startswith("#") or line.startswith(";"):
-                continue
-
-            if line.startswith("remote "):
+        for match in _RE_DIRECTIVE.finditer(content):
+            directive = match.group(1).decode("ascii").lower()
+            if directive == "remote":
                 has_remote = True
-            elif line == "client":
+            elif directive == "client":
                 has_client = True
-
-            # Check for dangerous directives
-            dangerous = [
-                "script-security",
-                "up ",
-                "down ",
-                "route-up",
-                "route-pre-down",
-                "ipchange",
-                "client-connect",
-                "client-disconnect",
-                "learn-address",
-                "auth-user-pass-verify",
-                "tls-verify",
-            ]
-
-            for d in dangerous:
-                if line.startswith(d):
-                    logger.warning(f"OpenVPN config contains potentially dangerous directive: {d}")
-                    # We allow these but log a warning
+            else:
+                # We allow these but log a warning
+                logger.warning(
+                    f"OpenVPN config contains potentially dangerous directive: {directive}"
+                )
 
         # Check for <connection> blocks (alternative to remote)
-        if "<connection>" in config_text.lower():
+        if _RE_CONNECTION_BLOCK.search(content):
             has_remote = True
 
         if not has_remote:
@@ -420,6 +626,7 @@ class OpenVPNProvider(VPNProvider):
         if not has_client:
             logger.warning("OpenVPN config doesn't have 'client' directive, may not work as expected")
 
+        self._mark_validated(key)
         return True
 
     def set_credentials(self, username: str, password: str) -> bool:
@@ -438,10 +645,9 @@ class OpenVPNProvider(VPNProvider):
         try:
             self._ensure_profiles_dir()
 
-            with open(OPENVPN_AUTH_FILE, "w") as f:
-                f.write(f"{username}\n{password}\n")
-
-            os.chmod(OPENVPN_AUTH_FILE, 0o600)
+            write_private_file(
+                OPENVPN_AUTH_FILE, f"{username}\n{password}\n".encode()
+            )
 
             logger.info("OpenVPN credentials saved")
             return True
@@ -16,9 +16,11 @@ License: MIT
 
 from __future__ import annotations
 
+import errno
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -31,13 +33,59 @@ from exceptions import (
     FileTooLargeError,
 )
 from utils.command_runner import CommandRunner
+from utils.fileio import write_private_file
 from utils.sanitizers import sanitize_filename
 from utils.validators import validate_wireguard_config
 
 from .base import VPNProvider, VPNType, VPNConnectionStatus, VPNTransferStats, VPNProfileInfo
 
+try:
+    from pyroute2 import WireGuard as WireGuardNetlink
+except ImportError:  # pragma: no cover - depends on the environment
+    WireGuardNetlink = None
+
 logger = logging.getLogger("rose-link.vpn.wireguard")
 
+# WireGuard's netlink GET_DEVICE needs CAP_NET_ADMIN, which the backend
+# only has when running as root; otherwise the query is always refused
+_NETLINK_PERMITTED = os.geteuid() == 0
+
+# Peer fields of interest in 'wg show' output
+_RE_WG_FIELDS = re.compile(
+    r'^[ \t]*(endpoint|latest handshake|transfer):[ \t]*(.*?)[ \t]*\r?$',
+    re.MULTILINE,
+)
+
+# "transfer: 1.23 MiB received, 456 KiB sent"
+_RE_WG_TRANSFER = re.compile(
+    r'^\s*transfer:\s*([\d.]+)\s+(\S+)\s+received,\s+([\d.]+)\s+(\S+)\s+sent'
+)
+
+# Units used by 'wg show' for transfer sizes, largest first
+_WG_SIZE_UNITS = (("TiB", 1024 ** 4), ("GiB", 1024 ** 3), ("MiB", 1024 ** 2), ("KiB", 1024))
+
+# Units used by 'wg show' for the handshake age, largest first
+_WG_AGE_UNITS = (
+    ("year", 365 * 24 * 3600),
+    ("day", 24 * 3600),
+    ("hour", 3600),
+    ("minute", 60),
+    ("second", 1),
+)
+
+# Byte multipliers for the units printed by 'wg show' (lowercased)
+_SIZE_MULTIPLIERS: dict[str, int] = {
+    "b": 1,
+    "kib": 1024,
+    "mib": 1024 ** 2,
+    "gib": 1024 ** 3,
+    "tib": 1024 ** 4,
+    "kb": 1000,
+    "mb": 1000 ** 2,
+    "gb": 1000 ** 3,
+    "tb": 1000 ** 4,
+}
+
 
 class WireGuardProvider(VPNProvider):
     """
@@ -72,31 +120,127 @@ class WireGuardProvider(VPNProvider):
         - Endpoint address
         - Latest handshake time
         - Transfer statistics
+
+        Results are reused for STATUS_CACHE_TTL seconds.
+        """
+        status = self._get_cached_status()
+        if status is None:
+            status = self._read_status_netlink()
+            if status is None:
+                ret, out, _ = CommandRunner.wg_show(self.interface_name)
+                status = self._parse_wg_show(ret, out)
+            status = self._set_cached_status(status)
+        return status
+
+    def _read_status_netlink(self) -> Optional[VPNConnectionStatus]:
         """
+        Query the interface over WireGuard's generic netlink family.
+
+        Uses pyroute2 when it is installed, avoiding 'wg show' and the
+        parsing of its text output. Requires CAP_NET_ADMIN, so an
+        unprivileged backend skips it and uses 'sudo wg show' directly.
+
+        Returns:
+            VPNConnectionStatus formatted like 'wg show', or None if
+            netlink is unavailable
+        """
+        if WireGuardNetlink is None or not _NETLINK_PERMITTED:
+            return None
+
         status = VPNConnectionStatus(
             vpn_type=VPNType.WIREGUARD,
             interface=self.interface_name,
         )
 
-        ret, out, _ = CommandRunner.wg_show()
+        try:
+            with WireGuardNetlink() as wg:
+                messages = wg.info(self.interface_name)
+        except Exception as e:
+            if getattr(e, "code", None) == errno.ENODEV:
+                return status
+            logger.debug(f"WireGuard netlink query failed: {e}")
+            return None
+
+        status.active = True
+
+        # Like the text output, the last peer's details win
+        for msg in messages:
+            for peer in msg.get_attr("WGDEVICE_A_PEERS") or ():
+                endpoint = peer.get_attr("WGPEER_A_ENDPOINT")
+                if endpoint and endpoint.get("addr"):
+                    addr = endpoint["addr"]
+                    if ":" in addr:
+                        addr = f"[{addr}]"
+                    status.endpoint = f"{addr}:{endpoint['port']}"
+
+                handshake = peer.get_attr("WGPEER_A_LAST_HANDSHAKE_TIME")
+                if handshake and handshake.get("tv_sec"):
+                    status.latest_handshake = self._format_age(
+                        int(time.time()) - handshake["tv_sec"]
+                    )
+
+                rx_bytes = peer.get_attr("WGPEER_A_RX_BYTES") or 0
+                tx_bytes = peer.get_attr("WGPEER_A_TX_BYTES") or 0
+                if rx_bytes or tx_bytes:
+                    status.transfer = VPNTransferStats(
+                        received=self._format_size(rx_bytes),
+                        sent=self._format_size(tx_bytes),
+                        received_bytes=rx_bytes,
+                        sent_bytes=tx_bytes,
+                    )
+
+        return status
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        """Format a byte count the way 'wg show' does."""
+        for unit, factor in _WG_SIZE_UNITS:
+            if size >= factor:
+                return f"{size / factor:.2f} {unit}"
+        return f"{size} B"
+
+    @staticmethod
+    def _format_age(seconds: int) -> str:
+        """Format a handshake age the way 'wg show' does."""
+        parts = []
+        for unit, length in _WG_AGE_UNITS:
+            count, seconds = divmod(seconds, length)
+            if count:
+                parts.append(f"{count} {unit}{'' if count == 1 else 's'}")
+        return f"{', '.join(parts)} ago" if parts else "Now"
+
+    def _parse_wg_show(self, ret: int, out: str) -> VPNConnectionStatus:
+        """
+        Build a connection status from 'wg show' output.
+
+        Args:
+            ret: Return code of 'wg show'
+            out: Standard output of 'wg show'
+
+        Returns:
+            VPNConnectionStatus (inactive if the command failed)
+        """
+        status = VPNConnectionStatus(
+            vpn_type=VPNType.WIREGUARD,
+            interface=self.interface_name,
+        )
 
         if ret != 0 or not out:
             return status
 
         status.active = True
 
-        # Parse wg show output line by line
-        for line in out.splitlines():
-            line = line.strip()
+        for match in _RE_WG_FIELDS.finditer(out):
+            key, value = match.groups()
 
-            if line.startswith("endpoint:"):
-                status.endpoint = line.split(":", 1)[1].strip()
+            if key == "endpoint":
+                status.endpoint = value
 
-            elif line.startswith("latest handshake:"):
-                status.latest_handshake = line.split(":", 1)[1].strip()
+            elif key == "latest handshake":
+                status.latest_handshake = value
 
-            elif line.startswith("transfer:"):
-                status.transfer = self._parse_transfer_stats(line)
+            else:
+                status.transfer = self._parse_transfer_stats(match.group(0))
 
         return status
 
@@ -106,49 +250,23 @@ class WireGuardProvider(VPNProvider):
 
         Example line: "transfer: 1.23 MiB received, 456 KiB sent"
         """
-        stats = VPNTransferStats()
-
-        try:
-            transfer = line.split(":", 1)[1].strip()
-            parts = transfer.split(",")
-
-            if len(parts) == 2:
-                recv_parts = parts[0].strip().split()
-                if len(recv_parts) >= 2:
-                    stats.received = f"{recv_parts[0]} {recv_parts[1]}"
-                    stats.received_bytes = self._parse_size_to_bytes(
-                        recv_parts[0], recv_parts[1]
-                    )
-
-                sent_parts = parts[1].strip().split()
-                if len(sent_parts) >= 2:
-                    stats.sent = f"{sent_parts[0]} {sent_parts[1]}"
-                    stats.sent_bytes = self._parse_size_to_bytes(
-                        sent_parts[0], sent_parts[1]
-                    )
-
-        except (IndexError, ValueError) as e:
-            logger.debug(f"Error parsing transfer stats: {e}")
-
-        return stats
+        match = _RE_WG_TRANSFER.match(line)
+        if not match:
+            logger.debug(f"Unrecognized transfer stats: {line!r}")
+            return VPNTransferStats()
+
+        recv_value, recv_unit, sent_value, sent_unit = match.groups()
+        return VPNTransferStats(
+            received=f"{recv_value} {recv_unit}",
+            sent=f"{sent_value} {sent_unit}",
+            received_bytes=self._parse_size_to_bytes(recv_value, recv_unit),
+            sent_bytes=self._parse_size_to_bytes(sent_value, sent_unit),
+        )
 
     def _parse_size_to_bytes(self, value: str, unit: str) -> int:
         """Convert size string to bytes."""
         try:
-            num = float(value)
-            unit = unit.lower()
-            multipliers = {
-                "b": 1,
-                "kib": 1024,
-                "mib": 1024 ** 2,
-                "gib": 1024 ** 3,
-                "tib": 1024 ** 4,
-                "kb": 1000,
-                "mb": 1000 ** 2,
-                "gb": 1000 ** 3,
-                "tb": 1000 ** 4,
-            }
-            return int(num * multipliers.get(unit, 1))
+            return int(float(value) * _SIZE_MULTIPLIERS.get(unit.lower(), 1))
         except (ValueError, TypeError):
             return 0
 
@@ -156,25 +274,43 @@ class WireGuardProvider(VPNProvider):
         """List all available WireGuard profiles."""
         profiles = []
 
-        if not self.profiles_dir.exists():
+        try:
+            entries = list(os.scandir(self.profiles_dir))
+        except OSError:
             return profiles
 
         active_profile_path = self._get_active_profile_path()
 
-        for conf_file in self.profiles_dir.glob("*.conf"):
+        # The active symlink normally points into profiles_dir, in which
+        # case comparing names avoids resolving every profile
+        active_name = None
+        if active_profile_path:
+            try:
+                if active_profile_path.parent == self.profiles_dir.resolve():
+                    active_name = active_profile_path.name
+            except OSError:
+                pass
+
+        for entry in entries:
+            # d_type from the directory listing saves a stat per entry
+            if not entry.name.endswith(".conf") or not entry.is_file():
+                continue
+
             is_active = False
 
-            if active_profile_path:
+            if active_name is not None:
+                is_active = entry.name == active_name
+            elif active_profile_path:
                 try:
-                    is_active = conf_file.resolve() == active_profile_path
+                    is_active = Path(entry.path).resolve() == active_profile_path
                 except OSError:
                     pass
 
             profiles.append(VPNProfileInfo(
-                name=conf_file.stem,
+                name=entry.name[:-5],
                 vpn_type=VPNType.WIREGUARD,
                 active=is_active,
-                filename=conf_file.name,
+                filename=entry.name,
             ))
 
         return profiles
@@ -189,6 +325,17 @@ class WireGuardProvider(VPNProvider):
         except OSError:
             return None
 
+    def _is_active_profile(self, profile_path: Path) -> bool:
+        """Whether the active symlink points at the given profile."""
+        active_path = self._get_active_profile_path()
+        if active_path is None:
+            return False
+
+        try:
+            return profile_path.resolve() == active_path
+        except OSError:
+            return False
+
     def upload_profile(self, filename: str, content: bytes) -> str:
         """Upload a new WireGuard profile without activating it."""
         # Check file size
@@ -210,11 +357,7 @@ class WireGuardProvider(VPNProvider):
         profile_path = self.profiles_dir / safe_filename
         self._ensure_profiles_dir()
 
-        with open(profile_path, "wb") as f:
-            f.write(content)
-
-        # Set secure permissions
-        os.chmod(profile_path, 0o600)
+        write_private_file(profile_path, content)
 
         logger.info(f"WireGuard profile uploaded: {safe_filename}")
         return safe_filename
@@ -224,12 +367,13 @@ class WireGuardProvider(VPNProvider):
         safe_filename = self.upload_profile(filename, content)
         profile_name = safe_filename.replace('.conf', '')
 
-        self.activate_profile(profile_name)
+        # The file may have changed under an already active profile
+        self.activate_profile(profile_name, force=True)
 
         logger.info(f"WireGuard profile imported and activated: {profile_name}")
         return profile_name
 
-    def activate_profile(self, name: str) -> bool:
+    def activate_profile(self, name: str, force: bool = False) -> bool:
         """Activate a WireGuard profile."""
         safe_name = sanitize_filename(name)
         if safe_name.endswith('.conf'):
@@ -240,14 +384,21 @@ class WireGuardProvider(VPNProvider):
         if not profile_path.exists():
             raise VPNProfileNotFoundError(safe_name)
 
-        # Stop current VPN
-        CommandRunner.wg_stop()
+        if not force and self._is_active_profile(profile_path) and self.is_active():
+            logger.info(f"WireGuard profile already active: {safe_name}")
+            return True
 
-        # Update symlink
-        self._update_active_symlink(profile_path)
+        try:
+            # Stop current VPN
+            CommandRunner.wg_stop()
+
+            # Update symlink
+            self._update_active_symlink(profile_path)
 
-        # Start VPN with new profile
-        CommandRunner.wg_start()
+            # Start VPN with new profile
+            CommandRunner.wg_start()
+        finally:
+            self.invalidate_status_cache()
 
         logger.info(f"WireGuard profile activated: {safe_name}")
         return True
@@ -264,13 +415,8 @@ class WireGuardProvider(VPNProvider):
             raise VPNProfileNotFoundError(safe_name)
 
         # Check if this is the active profile
-        active_path = self._get_active_profile_path()
-        if active_path:
-            try:
-                if profile_path.resolve() == active_path:
-                    raise VPNProfileActiveError(safe_name)
-            except OSError:
-                pass
+        if self._is_active_profile(profile_path):
+            raise VPNProfileActiveError(safe_name)
 
         profile_path.unlink()
 
@@ -292,7 +438,9 @@ class WireGuardProvider(VPNProvider):
         """Start the WireGuard VPN connection."""
         logger.info("Starting WireGuard VPN")
 
-        if not CommandRunner.wg_start():
+        succeeded = CommandRunner.wg_start()
+        self.invalidate_status_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to start WireGuard VPN", operation="start")
 
         return True
@@ -301,7 +449,9 @@ class WireGuardProvider(VPNProvider):
         """Stop the WireGuard VPN connection."""
         logger.info("Stopping WireGuard VPN")
 
-        if not CommandRunner.wg_stop():
+        succeeded = CommandRunner.wg_stop()
+        self.invalidate_status_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to stop WireGuard VPN", operation="stop")
 
         return True
@@ -310,16 +460,30 @@ class WireGuardProvider(VPNProvider):
         """Restart the WireGuard VPN connection."""
         logger.info("Restarting WireGuard VPN")
 
-        if not CommandRunner.wg_restart():
+        succeeded = CommandRunner.wg_restart()
+        self.invalidate_status_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to restart WireGuard VPN", operation="restart")
 
         return True
 
     def is_active(self) -> bool:
-        """Quick check if WireGuard VPN is currently active."""
-        return self.get_status().active
+        """
+        Quick check if WireGuard VPN is currently active.
+
+        wg-quick creates the interface on start and removes it on stop,
+        so checking sysfs avoids running 'wg show'.
+        """
+        return os.path.exists(Paths.SYS_NET / self.interface_name)
 
     def validate_config(self, content: bytes) -> bool:
-        """Validate a WireGuard configuration file."""
-        validate_wireguard_config(content)
+        """
+        Validate a WireGuard configuration file.
+
+        Re-uploads of a config that recently passed are not re-parsed.
+        """
+        key = self._validation_key(content)
+        if not self._is_validated(key):
+            validate_wireguard_config(content)
+            self._mark_validated(key)
         return True
@@ -22,9 +22,13 @@ License: MIT
 
 from __future__ import annotations
 
+import configparser
+import contextlib
 import logging
 import os
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -43,11 +47,21 @@ from exceptions import (
     FileTooLargeError,
 )
 from utils.command_runner import run_command, CommandRunner
+from utils.fileio import write_private_file
 from utils.sanitizers import sanitize_filename
 from utils.validators import validate_wireguard_config
 
 logger = logging.getLogger("rose-link.vpn")
 
+# Fields read from 'wg show' output, matched across the whole buffer
+_WG_SHOW_RE = re.compile(
+    r"^[ \t]*(endpoint|latest handshake|transfer):[ \t]*(.*?)[ \t]*\r?$",
+    re.MULTILINE,
+)
+
+# "1.23 MiB received, 456 KiB sent"
+_TRANSFER_RE = re.compile(r"([\d.]+\s+\S+)\s+received,\s+([\d.]+\s+\S+)\s+sent")
+
 
 class VPNService:
     """
@@ -55,14 +69,58 @@ class VPNService:
 
     This service handles all VPN-related operations including
     profile management and connection control.
+
+    Attributes:
+        _status_cache: Last status read, stored as (cached_at, status)
+        _status_lock: Serializes refreshes of the status cache
     """
 
+    # How long a parsed 'wg show' result is reused
+    STATUS_CACHE_TTL = Limits.VPN_STATUS_CACHE_TTL
+
+    _status_cache: Optional[tuple[float, VPNStatus]] = None
+    _status_lock = threading.Lock()
+
     @classmethod
-    def get_status(cls) -> VPNStatus:
+    def clear_cache(cls) -> None:
+        """Clear the status cache so the next read runs 'wg show'."""
+        cls._status_cache = None
+
+    @classmethod
+    def get_status(cls, force: bool = False) -> VPNStatus:
         """
         Get current VPN connection status.
 
-        Parses output from 'wg show' command to extract:
+        The result is reused for STATUS_CACHE_TTL seconds, so dashboard,
+        metrics and health polling don't each spawn 'wg show'. Concurrent
+        callers share a single refresh.
+
+        Args:
+            force: Bypass the cache and query WireGuard directly
+
+        Returns:
+            VPNStatus with connection details
+        """
+        with cls._status_lock:
+            cached = cls._status_cache
+            now = time.monotonic()
+            if (
+                not force
+                and cached is not None
+                and now - cached[0] < cls.STATUS_CACHE_TTL
+            ):
+                return cached[1]
+
+            status = cls._read_status()
+            cls._status_cache = (time.monotonic(), status)
+            return status
+
+    @classmethod
+    def _read_status(cls) -> VPNStatus:
+        """
+        Read the VPN status from 'wg show'.
+
+        Parses the command output to extract:
         - Connection state
         - Endpoint address
         - Latest handshake time
@@ -80,18 +138,17 @@ class VPNService:
 
         status.active = True
 
-        # Parse wg show output line by line
-        for line in out.splitlines():
-            line = line.strip()
+        for match in _WG_SHOW_RE.finditer(out):
+            key, value = match.groups()
 
-            if line.startswith("endpoint:"):
-                status.endpoint = line.split(":", 1)[1].strip()
+            if key == "endpoint":
+                status.endpoint = value
 
-            elif line.startswith("latest handshake:"):
-                status.latest_handshake = line.split(":", 1)[1].strip()
+            elif key == "latest handshake":
+                status.latest_handshake = value
 
-            elif line.startswith("transfer:"):
-                status.transfer = cls._parse_transfer_stats(line)
+            else:
+                status.transfer = cls._parse_transfer_stats(value)
 
         return status
 
@@ -103,31 +160,18 @@ class VPNService:
         Example line: "transfer: 1.23 MiB received, 456 KiB sent"
 
         Args:
-            line: Transfer line from wg show output
+            line: Transfer line (or just its value) from wg show output
 
         Returns:
             TransferStats with received and sent values
         """
         stats = TransferStats()
 
-        try:
-            # Extract the value after "transfer:"
-            transfer = line.split(":", 1)[1].strip()
-            parts = transfer.split(",")
-
-            if len(parts) == 2:
-                # Parse received (e.g., "1.23 MiB received")
-                recv_parts = parts[0].strip().split()
-                if len(recv_parts) >= 2:
-                    stats.received = f"{recv_parts[0]} {recv_parts[1]}"
-
-                # Parse sent (e.g., "456 KiB sent")
-                sent_parts = parts[1].strip().split()
-                if len(sent_parts) >= 2:
-                    stats.sent = f"{sent_parts[0]} {sent_parts[1]}"
-
-        except (IndexError, ValueError) as e:
-            logger.debug(f"Error parsing transfer stats: {e}")
+        match = _TRANSFER_RE.search(line)
+        if match:
+            stats.received, stats.sent = match.groups()
+        else:
+            logger.debug(f"Unrecognized transfer stats: {line!r}")
 
         return stats
 
@@ -145,41 +189,45 @@ class VPNService:
         """
         profiles = []
 
-        if not Paths.WG_PROFILES_DIR.exists():
+        try:
+            with os.scandir(Paths.WG_PROFILES_DIR) as it:
+                # d_type from the directory listing saves a stat per entry
+                entries = [
+                    entry for entry in it
+                    if entry.name.endswith(".conf") and entry.is_file()
+                ]
+        except OSError:
             return profiles
 
-        # Get active profile path for comparison
-        active_profile_path = cls._get_active_profile_path()
+        # Identify the active profile by inode rather than resolving paths
+        active_stat = cls._get_active_profile_stat()
 
-        for conf_file in Paths.WG_PROFILES_DIR.glob("*.conf"):
+        for entry in entries:
             is_active = False
 
-            if active_profile_path:
+            if active_stat is not None:
                 try:
-                    is_active = conf_file.resolve() == active_profile_path
+                    is_active = os.path.samestat(entry.stat(), active_stat)
                 except OSError:
                     pass
 
             profiles.append(VPNProfileInfo(
-                name=conf_file.stem,
+                name=entry.name[:-5],
                 active=is_active,
             ))
 
         return profiles
 
     @classmethod
-    def _get_active_profile_path(cls) -> Optional[Path]:
+    def _get_active_profile_stat(cls) -> Optional[os.stat_result]:
         """
-        Get the path of the currently active profile.
+        Stat the currently active profile through the active symlink.
 
         Returns:
-            Resolved path of active profile or None
+            stat_result of the active profile, or None if there is none
         """
-        if not Paths.WG_ACTIVE_CONF.exists():
-            return None
-
         try:
-            return Paths.WG_ACTIVE_CONF.resolve()
+            return os.stat(Paths.WG_ACTIVE_CONF)
         except OSError:
             return None
 
@@ -219,11 +267,8 @@ class VPNService:
         profile_path = Paths.WG_PROFILES_DIR / safe_filename
         cls._ensure_profiles_dir()
 
-        with open(profile_path, "wb") as f:
-            f.write(content)
-
-        # Set secure permissions
-        os.chmod(profile_path, 0o600)
+        # Owner-only permissions so the keys are never exposed
+        write_private_file(profile_path, content)
 
         logger.info(f"VPN profile uploaded: {safe_filename}")
         return safe_filename
@@ -291,6 +336,7 @@ class VPNService:
 
         # Start VPN with new profile
         CommandRunner.wg_start()
+        cls.clear_cache()
 
         logger.info(f"VPN profile activated: {safe_name}")
         return True
@@ -323,13 +369,14 @@ class VPNService:
             raise VPNProfileNotFoundError(safe_name)
 
         # Check if this is the active profile
-        active_path = cls._get_active_profile_path()
-        if active_path:
+        active_stat = cls._get_active_profile_stat()
+        if active_stat is not None:
             try:
-                if profile_path.resolve() == active_path:
-                    raise VPNProfileActiveError(safe_name)
+                is_active = os.path.samestat(profile_path.stat(), active_stat)
             except OSError:
-                pass
+                is_active = False
+            if is_active:
+                raise VPNProfileActiveError(safe_name)
 
         # Delete the profile
         profile_path.unlink()
@@ -381,7 +428,9 @@ class VPNService:
                 operation="start"
             )
 
-        if not CommandRunner.wg_start():
+        succeeded = CommandRunner.wg_start()
+        cls.clear_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to start VPN", operation="start")
 
         return True
@@ -399,7 +448,9 @@ class VPNService:
         """
         logger.info("Stopping VPN")
 
-        if not CommandRunner.wg_stop():
+        succeeded = CommandRunner.wg_stop()
+        cls.clear_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to stop VPN", operation="stop")
 
         return True
@@ -417,7 +468,9 @@ class VPNService:
         """
         logger.info("Restarting VPN")
 
-        if not CommandRunner.wg_restart():
+        succeeded = CommandRunner.wg_restart()
+        cls.clear_cache()
+        if not succeeded:
             raise VPNConnectionError("Failed to restart VPN", operation="restart")
 
         return True
@@ -440,27 +493,35 @@ class VPNService:
             return settings
 
         try:
-            with open(Paths.VPN_SETTINGS_CONF, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-
-                    if line.startswith("#") or "=" not in line:
-                        continue
+            content = Paths.VPN_SETTINGS_CONF.read_text(encoding="utf-8")
+        except (IOError, OSError) as e:
+            logger.warning(f"Error reading VPN settings: {e}")
+            return settings
 
-                    key, value = line.split("=", 1)
-                    key = key.strip().lower()
-                    value = value.strip().strip('"')
+        # The file is a KEY=value shell fragment; give it a section header so
+        # configparser can read it. Option names are lowercased by the parser.
+        parser = configparser.ConfigParser(
+            delimiters=("=",),
+            comment_prefixes=("#",),
+            interpolation=None,
+            strict=False,
+        )
+        try:
+            parser.read_string("[settings]\n" + content)
+        except configparser.ParsingError as e:
+            # Well-formed lines are still parsed; only the bad ones are dropped
+            logger.debug(f"Ignoring malformed VPN settings lines: {e}")
 
-                    if key == "ping_host":
-                        settings.ping_host = value
-                    elif key == "check_interval":
-                        try:
-                            settings.check_interval = int(value)
-                        except ValueError:
-                            pass
+        ping_host = parser.get("settings", "ping_host", fallback=None)
+        if ping_host is not None:
+            settings.ping_host = ping_host.strip('"')
 
-        except (IOError, OSError) as e:
-            logger.warning(f"Error reading VPN settings: {e}")
+        check_interval = parser.get("settings", "check_interval", fallback=None)
+        if check_interval is not None:
+            try:
+                settings.check_interval = int(check_interval.strip('"'))
+            except ValueError:
+                pass
 
         return settings
 
@@ -469,7 +530,9 @@ class VPNService:
         """
         Save VPN watchdog settings to configuration file.
 
-        Restarts the watchdog service to apply new settings.
+        The file is replaced atomically and the watchdog service is
+        restarted to apply the new settings. If the settings are unchanged,
+        neither the file nor the service is touched.
 
         Args:
             settings: New VPN settings
@@ -487,11 +550,31 @@ PING_HOST={settings.ping_host}
 # Check interval in seconds (30-300)
 CHECK_INTERVAL={settings.check_interval}
 """
+            new_content = config_content.encode("utf-8")
+            settings_path = Paths.VPN_SETTINGS_CONF
+
+            try:
+                if settings_path.read_bytes() == new_content:
+                    logger.debug("VPN settings unchanged, skipping watchdog restart")
+                    return True
+            except FileNotFoundError:
+                pass
+
             # Ensure directory exists
-            Paths.VPN_SETTINGS_CONF.parent.mkdir(parents=True, exist_ok=True)
+            settings_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(Paths.VPN_SETTINGS_CONF, "w", encoding="utf-8") as f:
-                f.write(config_content)
+            # Write alongside and rename so the watchdog never sees a partial file
+            tmp_path = settings_path.with_name(f".{settings_path.name}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(new_content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, settings_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_path)
+                raise
 
             # Restart watchdog to apply settings
             CommandRunner.restart_service(Services.ROSE_WATCHDOG)
@@ -19,8 +19,12 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from config import Limits
 from models import (
     WANStatus,
     EthernetStatus,
@@ -33,6 +37,15 @@ from services.interface_service import InterfaceService
 
 logger = logging.getLogger("rose-link.wan")
 
+# IPv4 address line in 'ip addr show' output
+_INET_RE = re.compile(r"inet\s+(\S+)")
+
+# NetworkManager device state code for a fully connected device
+_NM_DEVICE_STATE_ACTIVATED = "100"
+
+# Three-field 'nmcli -t' line; colons inside the first field are escaped as "\:"
+_NMCLI_LINE_RE = re.compile(r"^((?:[^:\\]|\\.)*):([^:]*):(.*)$")
+
 
 class WANService:
     """
@@ -41,24 +54,63 @@ class WANService:
     This service handles both Ethernet and WiFi WAN connections,
     providing methods to check status, scan networks, and manage
     WiFi connections through NetworkManager.
+
+    Attributes:
+        _status_cache: Last status read, stored as (cached_at, status)
+        _status_lock: Serializes refreshes of the status cache
     """
 
+    # How long a WAN status read is reused
+    STATUS_CACHE_TTL = Limits.WAN_STATUS_CACHE_TTL
+
+    # Runs the Ethernet check while the WiFi check runs on the caller's thread
+    _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rose-wan")
+
+    _status_cache: Optional[tuple[float, WANStatus]] = None
+    _status_lock = threading.Lock()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the status cache so the next read queries the interfaces."""
+        cls._status_cache = None
+
     @classmethod
-    def get_status(cls) -> WANStatus:
+    def get_status(cls, force: bool = False) -> WANStatus:
         """
         Get WAN connection status for both Ethernet and WiFi.
 
+        The result is reused for STATUS_CACHE_TTL seconds, so
+        get_current_ssid(), is_connected() and the status endpoints
+        share one set of ip/nmcli calls.
+
+        Args:
+            force: Bypass the cache and query the interfaces directly
+
         Returns:
             WANStatus containing ethernet and wifi status
         """
-        interfaces = InterfaceService.get_interfaces()
+        with cls._status_lock:
+            cached = cls._status_cache
+            now = time.monotonic()
+            if (
+                not force
+                and cached is not None
+                and now - cached[0] < cls.STATUS_CACHE_TTL
+            ):
+                return cached[1]
+
+            interfaces = InterfaceService.get_interfaces()
+
+            # Both checks shell out, so overlap them
+            ethernet = cls._executor.submit(
+                cls._get_ethernet_status, interfaces.ethernet
+            )
+            wifi = cls._get_wifi_status(interfaces.wifi_wan)
 
-        status = WANStatus(
-            ethernet=cls._get_ethernet_status(interfaces.ethernet),
-            wifi=cls._get_wifi_status(interfaces.wifi_wan),
-        )
+            status = WANStatus(ethernet=ethernet.result(), wifi=wifi)
 
-        return status
+            cls._status_cache = (time.monotonic(), status)
+            return status
 
     @classmethod
     def _get_ethernet_status(cls, interface: str) -> EthernetStatus:
@@ -81,13 +133,10 @@ class WANService:
             check=False,
         )
 
-        if ret == 0 and "inet " in out:
+        match = _INET_RE.search(out) if ret == 0 else None
+        if match:
             status.connected = True
-
-            # Extract IP address
-            match = re.search(r"inet\s+(\S+)", out)
-            if match:
-                status.ip = match.group(1)
+            status.ip = match.group(1)
 
         return status
 
@@ -107,9 +156,13 @@ class WANService:
         if not interface:
             return status
 
-        # Get device state from NetworkManager
+        # State, connection name and address of this device in one call
         ret, out, _ = run_command(
-            ["nmcli", "-t", "-f", "DEVICE,STATE,CONNECTION", "device"],
+            [
+                "nmcli", "-t", "-g",
+                "GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS",
+                "device", "show", interface,
+            ],
             check=False,
         )
 
@@ -117,18 +170,14 @@ class WANService:
             logger.warning("Failed to get WiFi status from NetworkManager")
             return status
 
-        for line in out.splitlines():
-            parts = line.split(":")
-            if len(parts) >= 3:
-                device, state, connection = parts[0], parts[1], parts[2]
-
-                if device == interface and state == "connected":
-                    status.connected = True
-                    status.ssid = connection
+        # One value per line, e.g. "100 (connected)", "MyNetwork",
+        # "192.168.1.50/24 | 10.0.0.2/24"
+        state, connection, address = (out.splitlines() + ["", "", ""])[:3]
 
-                    # Get IP address
-                    status.ip = CommandRunner.get_interface_ip(interface)
-                    break
+        if state.split(" ", 1)[0] == _NM_DEVICE_STATE_ACTIVATED:
+            status.connected = True
+            status.ssid = connection.replace("\\:", ":")
+            status.ip = address.split(" | ", 1)[0].replace("\\:", ":") or None
 
         return status
 
@@ -137,7 +186,8 @@ class WANService:
         """
         Scan for available WiFi networks.
 
-        Uses NetworkManager (nmcli) to perform the scan.
+        Uses NetworkManager (nmcli) to perform the scan. When an SSID is
+        seen from several access points, the strongest one is kept.
 
         Returns:
             List of WifiNetwork objects sorted by signal strength
@@ -151,35 +201,37 @@ class WANService:
             logger.error(f"WiFi scan failed: {err}")
             raise WifiScanError(f"Scan failed: {err}")
 
-        networks = []
-        seen_ssids: set[str] = set()
+        # Strongest access point per SSID, as (signal, security)
+        best: dict[str, tuple[int, str]] = {}
 
         for line in out.splitlines():
-            parts = line.split(":")
-            if len(parts) >= 3:
-                ssid = parts[0].strip()
+            match = _NMCLI_LINE_RE.match(line)
+            if not match:
+                continue
 
-                # Skip empty SSIDs and duplicates
-                if ssid and ssid not in seen_ssids:
-                    seen_ssids.add(ssid)
+            ssid = match.group(1).replace("\\:", ":").strip()
 
-                    # Parse signal strength
-                    try:
-                        signal = int(parts[1]) if parts[1].isdigit() else 0
-                    except (ValueError, IndexError):
-                        signal = 0
+            # Skip empty SSIDs (hidden networks)
+            if not ssid:
+                continue
 
-                    # Get security type
-                    security = parts[2] if len(parts) > 2 else "Open"
+            # Parse signal strength
+            try:
+                signal = int(match.group(2))
+            except ValueError:
+                signal = 0
 
-                    networks.append(WifiNetwork(
-                        ssid=ssid,
-                        signal=signal,
-                        security=security,
-                    ))
+            current = best.get(ssid)
+            if current is None or signal > current[0]:
+                best[ssid] = (signal, match.group(3))
 
         # Sort by signal strength (strongest first)
-        networks.sort(key=lambda x: x.signal, reverse=True)
+        networks = [
+            WifiNetwork(ssid=ssid, signal=signal, security=security)
+            for ssid, (signal, security) in sorted(
+                best.items(), key=lambda item: item[1][0], reverse=True
+            )
+        ]
 
         logger.info(f"WiFi scan found {len(networks)} networks")
         return networks
@@ -204,6 +256,7 @@ class WANService:
         logger.info(f"Connecting to WiFi: {ssid}")
 
         ret, out, err = CommandRunner.wifi_connect(ssid, password)
+        cls.clear_cache()
 
         if ret != 0:
             logger.error(f"WiFi connection failed: {err}")
@@ -234,6 +287,7 @@ class WANService:
         logger.info(f"Disconnecting WiFi: {interface}")
 
         ret, out, err = CommandRunner.wifi_disconnect(interface)
+        cls.clear_cache()
 
         if ret != 0:
             logger.error(f"WiFi disconnect failed: {err}")
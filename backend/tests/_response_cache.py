@@ -0,0 +1,139 @@
+"""
+Test Response Cache
+===================
+
+Opt-in on-disk cache of HTTP responses for idempotent endpoints.
+
+When ROSE_TEST_CACHE is set, responses are pickled keyed on (method,
+path, headers hash) and replayed on later runs without going through
+the FastAPI stack. This only speeds up repeated local runs; CI leaves
+the variable unset so the real app is always exercised.
+
+The cache file lives in this checkout's .pytest_cache (see
+cache_file()), never in a shared temporary directory, since loading a
+pickle another user could write would run their code.
+
+Only wrap requests whose response does not depend on per-test mocks.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from httpx import Response
+
+# (method, path, headers hash) -> (status code, headers, body)
+CacheKey = Tuple[str, str, str]
+CacheEntry = Tuple[int, List[Tuple[str, str]], bytes]
+
+# Body is stored decoded, so these no longer describe it on replay
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length"})
+
+# Loaded cache contents by cache file
+_caches: Dict[Path, Dict[CacheKey, CacheEntry]] = {}
+
+
+def is_enabled() -> bool:
+    """Whether response caching was requested for this run."""
+    return bool(os.environ.get("ROSE_TEST_CACHE"))
+
+
+def cache_file(config: Any) -> Optional[Path]:
+    """
+    Location of the cache file for a pytest session.
+
+    Args:
+        config: The pytest Config
+
+    Returns:
+        Path under the checkout's .pytest_cache, or None when the cache
+        provider is disabled (-p no:cacheprovider)
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return None
+    return cache.mkdir("rose_response_cache") / "responses.pickle"
+
+
+def _load(path: Path) -> Dict[CacheKey, CacheEntry]:
+    """Load a cache file once per process, tolerating a bad file."""
+    cache = _caches.get(path)
+    if cache is None:
+        try:
+            with open(path, "rb") as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            cache = {}
+        _caches[path] = cache
+    return cache
+
+
+def _store(path: Path, key: CacheKey, entry: CacheEntry) -> None:
+    """Add an entry and rewrite the cache file."""
+    cache = _load(path)
+    cache[key] = entry
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _headers_hash(headers: Any) -> str:
+    """Stable digest of request headers."""
+    items = sorted((str(k).lower(), str(v)) for k, v in dict(headers or {}).items())
+    return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+def debug_caching(
+    method: str,
+    path: Optional[Path],
+) -> Callable[[Callable[..., Response]], Callable[..., Response]]:
+    """
+    Decorate a client request function to replay responses from disk.
+
+    Only successful responses are cached. Without ROSE_TEST_CACHE, or
+    without a cache file, the wrapped function is called unchanged.
+
+    Args:
+        method: HTTP method of the wrapped function, part of the cache key
+        path: Cache file, from cache_file()
+
+    Returns:
+        Decorator for functions taking (path, **kwargs)
+    """
+    def decorator(func: Callable[..., Response]) -> Callable[..., Response]:
+        @functools.wraps(func)
+        def wrapper(url: str, **kwargs: Any) -> Response:
+            if path is None or not is_enabled():
+                return func(url, **kwargs)
+
+            key = (method.upper(), url, _headers_hash(kwargs.get("headers")))
+            cached = _load(path).get(key)
+            if cached is not None:
+                status_code, headers, content = cached
+                return Response(status_code, headers=headers, content=content)
+
+            response = func(url, **kwargs)
+            if response.status_code == 200:
+                _store(path, key, (
+                    response.status_code,
+                    [
+                        (name, value)
+                        for name, value in response.headers.multi_items()
+                        if name.lower() not in _DROPPED_HEADERS
+                    ],
+                    response.content,
+                ))
+            return response
+
+        return wrapper
+
+    return decorator
@@ -19,12 +19,15 @@ from __future__ import annotations
 import os
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator
 from unittest.mock import MagicMock
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from tests._response_cache import cache_file, debug_caching
 from utils.command_runner import (
     CommandResult,
     ICommandExecutor,
@@ -49,6 +52,8 @@ class MockCommandExecutor(ICommandExecutor):
         self.calls: list[tuple[list[str], int]] = []
         self.responses: dict[str, CommandResult] = {}
         self.default_response = CommandResult(0, "", "")
+        # Distinct key lengths, longest first, for prefix lookups
+        self._key_lengths: list[int] = []
 
     def execute(
         self,
@@ -58,15 +63,13 @@ class MockCommandExecutor(ICommandExecutor):
         """Record the command and return a mock response."""
         self.calls.append((cmd, timeout))
 
-        # Check for specific command responses
+        # Exact match, else the longest configured prefix of the command
         cmd_key = " ".join(cmd)
-        if cmd_key in self.responses:
-            return self.responses[cmd_key]
-
-        # Check for partial matches (first few elements)
-        for key, response in self.responses.items():
-            if cmd_key.startswith(key):
-                return response
+        for length in self._key_lengths:
+            if length <= len(cmd_key):
+                response = self.responses.get(cmd_key[:length])
+                if response is not None:
+                    return response
 
         return self.default_response
 
@@ -77,13 +80,16 @@ class MockCommandExecutor(ICommandExecutor):
         stdout: str = "",
         stderr: str = "",
     ) -> None:
-        """Set a response for a specific command."""
+        """Set a response for a command or command prefix."""
         self.responses[cmd] = CommandResult(return_code, stdout, stderr)
+        if len(cmd) not in self._key_lengths:
+            self._key_lengths = sorted({*self._key_lengths, len(cmd)}, reverse=True)
 
     def reset(self) -> None:
         """Reset all recorded calls and responses."""
         self.calls.clear()
         self.responses.clear()
+        self._key_lengths.clear()
 
 
 @pytest.fixture
@@ -93,6 +99,7 @@ def mock_executor() -> Generator[MockCommandExecutor, None, None]:
 
     This fixture automatically:
     - Sets up the mock executor before each test
+    - Clears service status caches so earlier results don't leak in
     - Resets to the real executor after each test
 
     Example:
@@ -101,6 +108,11 @@ def mock_executor() -> Generator[MockCommandExecutor, None, None]:
             # ... test code that calls commands ...
             assert len(mock_executor.calls) == 1
     """
+    from services.vpn_service import VPNService
+    from services.wan_service import WANService
+
+    VPNService.clear_cache()
+    WANService.clear_cache()
     executor = MockCommandExecutor()
     set_executor(executor)
     yield executor
@@ -153,9 +165,28 @@ def temp_config_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
 # FastAPI Test Client Fixtures
 # =============================================================================
 
+# Fixed API key used by authenticated_client, and its SHA-256 hex digest
+TEST_API_KEY = "test-api-key-12345"
+TEST_API_KEY_HASH = "2688f4e126ca5efd4a60022073e6cd90017626e56c3f30b194d53e6299edfe3c"
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    The FastAPI application, imported once per session.
+
+    Imported lazily so collecting tests that don't need the app doesn't
+    pull in every router and service.
+    """
+    from main import app as _app
+
+    return _app
+
 
 @pytest.fixture
-def client(mock_executor: MockCommandExecutor) -> Generator[TestClient, None, None]:
+def client(
+    mock_executor: MockCommandExecutor, app: FastAPI
+) -> Generator[TestClient, None, None]:
     """
     Fixture providing a FastAPI test client.
 
@@ -166,13 +197,64 @@ def client(mock_executor: MockCommandExecutor) -> Generator[TestClient, None, No
             response = client.get("/api/health")
             assert response.status_code == 200
     """
-    # Import here to avoid side effects at module load time
-    from main import app
-
     with TestClient(app) as test_client:
         yield test_client
 
 
+@pytest.fixture(scope="session")
+def _shared_api_client(app: FastAPI) -> TestClient:
+    """
+    One TestClient for the whole session, built without entering it.
+
+    The app lifespan is deliberately not started, so no background
+    broadcast loop runs between tests.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture
+def api_client(_shared_api_client: TestClient) -> TestClient:
+    """
+    Fixture providing the shared session TestClient with no cookies or
+    extra headers left over from earlier tests.
+
+    Use it for read-only contract checks that don't need mocked commands.
+    """
+    _shared_api_client.cookies.clear()
+    _shared_api_client.headers.pop("X-API-Key", None)
+    return _shared_api_client
+
+
+@pytest.fixture
+def api_key_client(api_client: TestClient) -> Generator[TestClient, None, None]:
+    """
+    Fixture providing the shared session TestClient with an X-API-Key header.
+
+    The header is set on the shared client rather than on a copy, since
+    httpx clients can't be safely copied, and it is removed afterwards.
+    The key is not installed, so protected endpoints still answer 401
+    unless the test sets up auth itself.
+    """
+    api_client.headers["X-API-Key"] = TEST_API_KEY
+    yield api_client
+    api_client.headers.pop("X-API-Key", None)
+
+
+@pytest.fixture
+def cached_client(
+    api_client: TestClient, request: pytest.FixtureRequest
+) -> SimpleNamespace:
+    """
+    Fixture providing api_client.get with opt-in response replay.
+
+    With ROSE_TEST_CACHE=1, responses are replayed from the on-disk
+    cache in tests/_response_cache.py. Only use it for idempotent
+    endpoints that don't run host commands or depend on per-test mocks.
+    """
+    path = cache_file(request.config)
+    return SimpleNamespace(get=debug_caching("GET", path)(api_client.get))
+
+
 @pytest.fixture
 def authenticated_client(
     client: TestClient,
@@ -184,17 +266,12 @@ def authenticated_client(
     Creates a valid API key and adds it to the client headers.
     """
     # Create API key in temp directory
-    api_key = "test-api-key-12345"
-    api_key_file = temp_config_dir / "system" / ".api_key"
-    api_key_file.write_text(api_key)
-
-    import hashlib
-    key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-    hash_file = temp_config_dir / "system" / ".api_key_hash"
-    hash_file.write_text(key_hash)
+    system_dir = temp_config_dir / "system"
+    (system_dir / ".api_key").write_text(TEST_API_KEY)
+    (system_dir / ".api_key_hash").write_text(TEST_API_KEY_HASH)
 
     # Add API key header
-    client.headers["X-API-Key"] = api_key
+    client.headers["X-API-Key"] = TEST_API_KEY
     return client
 
 
@@ -12,107 +12,157 @@ License: MIT
 from __future__ import annotations
 
 import pytest
-from fastapi.testclient import TestClient
-from typing import Any
-
-from main import app
+from typing import Any, Dict, List, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+NoneType = type(None)
+
+# (path, required fields, optional fields); each maps field -> expected type(s)
+CONTRACTS: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+    (
+        "/api/health",
+        {"status": str},
+        {"version": str, "timestamp": str},
+    ),
+    (
+        "/api/vpn/status",
+        {"active": bool},
+        {"endpoint": (str, NoneType), "transfer": dict},
+    ),
+    (
+        "/api/hotspot/status",
+        {"active": bool},
+        {"ssid": (str, NoneType), "channel": (int, NoneType), "clients_count": int},
+    ),
+    (
+        "/api/auth/check",
+        {"authenticated": bool, "message": str},
+        {},
+    ),
+    (
+        # Values may be None on non-Pi systems, only presence is checked
+        "/api/system/info",
+        {"model": object, "ram_mb": object, "disk_total_gb": object, "cpu_temp_c": object},
+        {},
+    ),
+]
+
+# Endpoints whose responses don't depend on host state, safe to replay
+# with ROSE_TEST_CACHE (the others run real system commands)
+CACHEABLE_PATHS = frozenset({"/api/health", "/api/auth/check"})
+
+# Same shape, with dotted field names addressing nested objects
+NESTED_CONTRACTS: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+    (
+        "/api/status",
+        {"wan": dict, "vpn.active": bool, "ap.active": bool},
+        {},
+    ),
+    (
+        "/api/vpn/status",
+        {},
+        {"transfer.received": str, "transfer.sent": str},
+    ),
+]
+
+
+class _LatencyContract(BaseModel):
+    """Schema of latency_ms in GET /api/metrics/performance."""
+
+    model_config = ConfigDict(strict=True)
+
+    avg: float
+    min: float
+    max: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class _PerformanceMetricsContract(BaseModel):
+    """Schema of GET /api/metrics/performance, validated in one pass."""
+
+    model_config = ConfigDict(strict=True)
+
+    total_requests: int
+    total_errors: int
+    error_rate: float
+    latency_ms: _LatencyContract
+
+
+_MISSING = object()
+
+
+def _lookup(data: Dict[str, Any], field: str) -> Any:
+    """Resolve a dotted field name, returning _MISSING if any part is absent."""
+    for part in field.split("."):
+        if not isinstance(data, dict) or part not in data:
+            return _MISSING
+        data = data[part]
+    return data
+
+
+def _assert_contract(
+    data: Dict[str, Any],
+    required: Dict[str, Any],
+    optional: Dict[str, Any],
+) -> None:
+    """Check required and optional fields against their expected types."""
+    for field, expected in required.items():
+        value = _lookup(data, field)
+        assert value is not _MISSING, f"Missing field: {field}"
+        assert isinstance(value, expected), f"{field}: {value!r}"
+
+    for field, expected in optional.items():
+        value = _lookup(data, field)
+        if value is not _MISSING:
+            assert isinstance(value, expected), f"{field}: {value!r}"
+
+
+@pytest.mark.parametrize("path,required,optional", CONTRACTS)
+def test_contract(api_client, cached_client, path, required, optional):
+    """Test GET response schema of flat endpoints."""
+    client = cached_client if path in CACHEABLE_PATHS else api_client
+    response = client.get(path)
+    assert response.status_code == 200
+
+    _assert_contract(response.json(), required, optional)
+
+
+@pytest.mark.parametrize("path,required,optional", NESTED_CONTRACTS)
+def test_nested_contract(api_client, path, required, optional):
+    """Test GET response schema of endpoints with nested objects."""
+    response = api_client.get(path)
+    assert response.status_code == 200
+
+    _assert_contract(response.json(), required, optional)
 
 
 class TestHealthAPIContract:
     """Test health endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_health_endpoint_contract(self):
-        """Test GET /api/health response schema."""
-        response = self.client.get("/api/health")
-        assert response.status_code == 200
+    def test_health_status_value(self, api_client):
+        """Test GET /api/health reports a known status."""
+        data = api_client.get("/api/health").json()
 
-        data = response.json()
-
-        # Required fields
-        assert "status" in data
-        assert isinstance(data["status"], str)
         assert data["status"] in ["ok", "healthy", "unhealthy", "degraded"]
 
-        # Optional but expected fields
-        if "version" in data:
-            assert isinstance(data["version"], str)
-
-        if "timestamp" in data:
-            assert isinstance(data["timestamp"], str)
+    def test_status_wan_contract(self, api_client):
+        """Test GET /api/status WAN section structure."""
+        wan = api_client.get("/api/status").json()["wan"]
 
-    def test_status_endpoint_contract(self):
-        """Test GET /api/status response schema."""
-        response = self.client.get("/api/status")
-        assert response.status_code == 200
-
-        data = response.json()
-
-        # Required top-level fields
-        assert "wan" in data
-        assert "vpn" in data
-        assert "ap" in data
-
-        # WAN status contract
-        wan = data["wan"]
-        assert isinstance(wan, dict)
         # WAN status uses ethernet/wifi structure, not active flag
         assert "ethernet" in wan or "wifi" in wan or "connected" in wan
 
-        # VPN status contract
-        vpn = data["vpn"]
-        assert isinstance(vpn, dict)
-        assert "active" in vpn
-        assert isinstance(vpn["active"], bool)
-
-        # AP status contract
-        ap = data["ap"]
-        assert isinstance(ap, dict)
-        assert "active" in ap
-        assert isinstance(ap["active"], bool)
-
 
 class TestVPNAPIContract:
     """Test VPN endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_vpn_status_contract(self):
-        """Test GET /api/vpn/status response schema."""
-        response = self.client.get("/api/vpn/status")
-        assert response.status_code == 200
-
-        data = response.json()
-
-        # Required fields
-        assert "active" in data
-        assert isinstance(data["active"], bool)
-
-        # Optional fields when active
-        if data["active"]:
-            # These should be present when VPN is active
-            if "endpoint" in data:
-                assert isinstance(data["endpoint"], (str, type(None)))
-            if "transfer" in data:
-                transfer = data["transfer"]
-                assert isinstance(transfer, dict)
-                if "received" in transfer:
-                    assert isinstance(transfer["received"], str)
-                if "sent" in transfer:
-                    assert isinstance(transfer["sent"], str)
-
-    def test_vpn_profiles_contract(self):
+    def test_vpn_profiles_contract(self, api_key_client):
         """Test GET /api/vpn/profiles response schema (requires auth)."""
         # This endpoint requires auth, so we test with auth header
-        response = self.client.get(
-            "/api/vpn/profiles",
-            headers={"X-API-Key": "test-key"}  # Will fail auth but tests schema
-        )
+        response = api_key_client.get("/api/vpn/profiles")
 
         # Should return 401 without valid auth
         assert response.status_code in [200, 401]
@@ -132,68 +182,13 @@ class TestVPNAPIContract:
 class TestWiFiAPIContract:
     """Test WiFi endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-
-class TestHotspotAPIContract:
-    """Test Hotspot endpoint response contracts."""
-
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_hotspot_status_contract(self):
-        """Test GET /api/hotspot/status response schema."""
-        response = self.client.get("/api/hotspot/status")
-        assert response.status_code == 200
-
-        data = response.json()
-
-        # Required fields
-        assert "active" in data
-        assert isinstance(data["active"], bool)
-
-        # Optional fields when active
-        if data["active"]:
-            if "ssid" in data:
-                assert isinstance(data["ssid"], str)
-            if "channel" in data:
-                assert isinstance(data["channel"], int)
-            if "clients_count" in data:
-                assert isinstance(data["clients_count"], int)
-
 
 class TestSystemAPIContract:
     """Test System endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_system_info_contract(self):
-        """Test GET /api/system/info response schema."""
-        response = self.client.get("/api/system/info")
-        assert response.status_code == 200
-
-        data = response.json()
-
-        # Expected fields (may be None on non-Pi systems)
-        expected_fields = [
-            "model",
-            "ram_mb",
-            "disk_total_gb",
-            "cpu_temp_c",
-        ]
-
-        for field in expected_fields:
-            # Field should exist in response
-            assert field in data, f"Missing field: {field}"
-
-    def test_system_interfaces_contract(self):
+    def test_system_interfaces_contract(self, api_client):
         """Test GET /api/system/interfaces response schema."""
-        response = self.client.get("/api/system/interfaces")
+        response = api_client.get("/api/system/interfaces")
         assert response.status_code == 200
 
         data = response.json()
@@ -209,79 +204,36 @@ class TestSystemAPIContract:
 class TestMetricsAPIContract:
     """Test Metrics endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_prometheus_metrics_contract(self):
+    def test_prometheus_metrics_contract(self, api_client):
         """Test GET /api/metrics response format."""
-        response = self.client.get("/api/metrics")
+        response = api_client.get("/api/metrics")
         assert response.status_code == 200
 
         # Should return plain text
         assert response.headers["content-type"].startswith("text/plain")
 
-        content = response.text
+        # Prometheus format, opening with our info metric; checking the
+        # prefix avoids scanning the whole exposition for each needle
+        assert response.text.startswith("# HELP rose_link_info ")
 
-        # Should contain Prometheus format metrics
-        assert "# TYPE" in content or "# HELP" in content
-
-        # Should have our custom metrics
-        assert "rose_link" in content
-
-    def test_performance_metrics_contract(self):
+    def test_performance_metrics_contract(self, api_client):
         """Test GET /api/metrics/performance response schema."""
-        response = self.client.get("/api/metrics/performance")
+        response = api_client.get("/api/metrics/performance")
         assert response.status_code == 200
 
         data = response.json()
+        _PerformanceMetricsContract.model_validate(data)
 
-        # Required fields
-        assert "total_requests" in data
-        assert "total_errors" in data
-        assert "error_rate" in data
-        assert "latency_ms" in data
-
-        # Type checks
-        assert isinstance(data["total_requests"], int)
-        assert isinstance(data["total_errors"], int)
+        # Strict float fields still accept ints, the rate must be a float
         assert isinstance(data["error_rate"], float)
-        assert isinstance(data["latency_ms"], dict)
-
-        # Latency structure
-        latency = data["latency_ms"]
-        assert "avg" in latency
-        assert "min" in latency
-        assert "max" in latency
-        assert "p50" in latency
-        assert "p95" in latency
-        assert "p99" in latency
 
 
 class TestAuthAPIContract:
     """Test Authentication endpoint response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_auth_check_contract(self):
-        """Test GET /api/auth/check response schema."""
-        response = self.client.get("/api/auth/check")
-        assert response.status_code == 200
-
-        data = response.json()
-
-        # Required fields
-        assert "authenticated" in data
-        assert "message" in data
-
-        assert isinstance(data["authenticated"], bool)
-        assert isinstance(data["message"], str)
-
-    def test_login_error_contract(self):
+    def test_login_error_contract(self, api_client):
         """Test POST /api/auth/login error response schema."""
-        response = self.client.post(
+        response = api_client.post(
             "/api/auth/login",
             json={"api_key": "invalid-key"}
         )
@@ -292,9 +244,9 @@ class TestAuthAPIContract:
         data = response.json()
         assert "detail" in data
 
-    def test_logout_contract(self):
+    def test_logout_contract(self, api_client):
         """Test POST /api/auth/logout response schema."""
-        response = self.client.post("/api/auth/logout")
+        response = api_client.post("/api/auth/logout")
         assert response.status_code == 200
 
         data = response.json()
@@ -305,32 +257,28 @@ class TestAuthAPIContract:
 class TestErrorResponseContract:
     """Test error response contracts."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
-
-    def test_404_error_contract(self):
+    def test_404_error_contract(self, api_client):
         """Test 404 error response schema."""
-        response = self.client.get("/api/nonexistent-endpoint")
+        response = api_client.get("/api/nonexistent-endpoint")
         assert response.status_code == 404
 
         data = response.json()
         assert "detail" in data
 
-    def test_401_error_contract(self):
+    def test_401_error_contract(self, api_client):
         """Test 401 error response schema."""
         # Access protected endpoint without auth
-        response = self.client.get("/api/system/logs")
+        response = api_client.get("/api/system/logs")
         assert response.status_code == 401
 
         data = response.json()
         assert "detail" in data
         assert isinstance(data["detail"], str)
 
-    def test_422_validation_error_contract(self):
+    def test_422_validation_error_contract(self, api_client):
         """Test 422 validation error response schema."""
         # Send invalid data to endpoint expecting specific schema
-        response = self.client.post(
+        response = api_client.post(
             "/api/auth/login",
             json={}  # Missing required fields
         )
@@ -12,98 +12,69 @@ from __future__ import annotations
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from tests.conftest import MockCommandExecutor
 
 
+@pytest.fixture(scope="module")
+def health_response(_shared_api_client: TestClient) -> Response:
+    """GET /api/health once; the endpoint is static, so tests share it."""
+    return _shared_api_client.get("/api/health")
+
+
 class TestHealthEndpoint:
     """Tests for the /api/health endpoint."""
 
-    def test_health_returns_200(self, client: TestClient) -> None:
+    def test_health_returns_200(self, health_response: Response) -> None:
         """Health endpoint should return 200 OK."""
-        response = client.get("/api/health")
+        assert health_response.status_code == 200
 
-        assert response.status_code == 200
-
-    def test_health_returns_status_ok(self, client: TestClient) -> None:
+    def test_health_returns_status_ok(self, health_response: Response) -> None:
         """Health endpoint should return status 'ok'."""
-        response = client.get("/api/health")
-        data = response.json()
+        data = health_response.json()
 
         assert data["status"] == "ok"
 
-    def test_health_returns_service_name(self, client: TestClient) -> None:
+    def test_health_returns_service_name(self, health_response: Response) -> None:
         """Health endpoint should return service name."""
-        response = client.get("/api/health")
-        data = response.json()
+        data = health_response.json()
 
         assert "service" in data
         assert data["service"] == "ROSE Link"
 
-    def test_health_returns_version(self, client: TestClient) -> None:
+    def test_health_returns_version(self, health_response: Response) -> None:
         """Health endpoint should return version."""
-        response = client.get("/api/health")
-        data = response.json()
+        data = health_response.json()
 
         assert "version" in data
         assert len(data["version"]) > 0
 
 
+@pytest.fixture
+def status_mocks(mock_executor: MockCommandExecutor) -> MockCommandExecutor:
+    """Mock the commands behind /api/status."""
+    mock_executor.set_response("ip addr show", return_code=0, stdout="")
+    mock_executor.set_response("nmcli -t", return_code=0, stdout="")
+    mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+    mock_executor.set_response("systemctl is-active", return_code=0, stdout="active\n")
+    return mock_executor
+
+
+@pytest.fixture
+def status_response(client: TestClient, status_mocks: MockCommandExecutor) -> Response:
+    """GET /api/status with the commands mocked."""
+    return client.get("/api/status")
+
+
 class TestStatusEndpoint:
     """Tests for the /api/status endpoint."""
 
-    def test_status_returns_200(
-        self, client: TestClient, mock_executor: MockCommandExecutor
-    ) -> None:
+    def test_status_returns_200(self, status_response: Response) -> None:
         """Status endpoint should return 200 OK."""
-        # Mock the underlying commands
-        mock_executor.set_response("ip addr show", return_code=0, stdout="")
-        mock_executor.set_response("nmcli -t -f", return_code=0, stdout="")
-        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
-        mock_executor.set_response("systemctl is-active", return_code=0, stdout="active\n")
-
-        response = client.get("/api/status")
-
-        assert response.status_code == 200
-
-    def test_status_returns_wan_info(
-        self, client: TestClient, mock_executor: MockCommandExecutor
-    ) -> None:
-        """Status endpoint should return WAN information."""
-        mock_executor.set_response("ip addr show", return_code=0, stdout="")
-        mock_executor.set_response("nmcli -t -f", return_code=0, stdout="")
-        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
-        mock_executor.set_response("systemctl is-active", return_code=0, stdout="active\n")
-
-        response = client.get("/api/status")
-        data = response.json()
-
-        assert "wan" in data
-
-    def test_status_returns_vpn_info(
-        self, client: TestClient, mock_executor: MockCommandExecutor
-    ) -> None:
-        """Status endpoint should return VPN information."""
-        mock_executor.set_response("ip addr show", return_code=0, stdout="")
-        mock_executor.set_response("nmcli -t -f", return_code=0, stdout="")
-        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
-        mock_executor.set_response("systemctl is-active", return_code=0, stdout="active\n")
-
-        response = client.get("/api/status")
-        data = response.json()
-
-        assert "vpn" in data
-
-    def test_status_returns_ap_info(
-        self, client: TestClient, mock_executor: MockCommandExecutor
-    ) -> None:
-        """Status endpoint should return AP (hotspot) information."""
-        mock_executor.set_response("ip addr show", return_code=0, stdout="")
-        mock_executor.set_response("nmcli -t -f", return_code=0, stdout="")
-        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
-        mock_executor.set_response("systemctl is-active", return_code=0, stdout="active\n")
-
-        response = client.get("/api/status")
-        data = response.json()
-
-        assert "ap" in data
+        assert status_response.status_code == 200
+
+    @pytest.mark.parametrize("section", ["wan", "vpn", "ap"])
+    def test_status_returns_section(self, status_response: Response, section: str) -> None:
+        """Status endpoint should return WAN, VPN and AP (hotspot) information."""
+        assert section in status_response.json()
@@ -151,11 +151,12 @@ inactive_msec=500"""
                         assert clients[0].rx_bytes == 1024
                         assert clients[0].connected is True
 
-    def test_get_blocked_macs_empty(self):
+    def test_get_blocked_macs_empty(self, tmp_path):
         """Test getting blocked MACs when file doesn't exist."""
-        with patch('pathlib.Path.exists', return_value=False):
+        with patch('services.clients_service.BLOCKED_CLIENTS_FILE', tmp_path / "missing.txt"):
             blocked = ClientsService._get_blocked_macs()
-            assert isinstance(blocked, set)
+
+        assert blocked == set()
 
     def test_get_blocked_macs_with_data(self, tmp_path):
         """Test getting blocked MACs from file."""
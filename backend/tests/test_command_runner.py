@@ -10,12 +10,15 @@ License: MIT
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 from utils.command_runner import (
     CommandResult,
     CommandRunner,
     run_command,
+    run_command_async,
     ICommandExecutor,
     SubprocessExecutor,
     set_executor,
@@ -100,6 +103,37 @@ class TestRunCommand:
         assert mock_executor.calls[0][1] == 60
 
 
+class TestRunCommandAsync:
+    """Tests for the run_command_async function."""
+
+    @pytest.mark.asyncio
+    async def test_returns_command_output(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """run_command_async should return the same tuple as run_command."""
+        mock_executor.set_response("echo hello", return_code=0, stdout="hello\n")
+
+        result = await run_command_async(["echo", "hello"], timeout=60)
+
+        assert result == (0, "hello\n", "")
+        assert mock_executor.calls[0] == (["echo", "hello"], 60)
+
+    @pytest.mark.asyncio
+    async def test_runs_on_dedicated_pool(self) -> None:
+        """run_command_async should run on the rose-subproc threads."""
+        class ThreadRecordingExecutor(ICommandExecutor):
+            def execute(self, cmd: list[str], timeout: int = 30) -> CommandResult:
+                return CommandResult(0, threading.current_thread().name, "")
+
+        set_executor(ThreadRecordingExecutor())
+        try:
+            _, thread_name, _ = await run_command_async(["true"])
+        finally:
+            reset_executor()
+
+        assert thread_name.startswith("rose-subproc")
+
+
 class TestCommandRunner:
     """Tests for CommandRunner class methods."""
 
@@ -153,6 +187,7 @@ class TestCommandRunner:
         result = CommandRunner.is_service_active("nginx")
 
         assert result is True
+        assert mock_executor.calls[0][0] == ["systemctl", "is-active", "nginx", "--quiet"]
 
     def test_is_service_active_returns_false_when_inactive(
         self, mock_executor: MockCommandExecutor
@@ -0,0 +1,55 @@
+"""
+File Writing Helper Tests
+=========================
+
+Unit tests for utils.fileio.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from utils.fileio import write_private_file
+
+
+class TestWritePrivateFile:
+    """Tests for write_private_file()."""
+
+    def test_writes_owner_only_file(self, temp_dir: Path) -> None:
+        """Should create the file with mode 0600 and no temp file left behind."""
+        path = temp_dir / "home.conf"
+
+        write_private_file(path, b"[Interface]\n")
+
+        assert path.read_bytes() == b"[Interface]\n"
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in temp_dir.iterdir()] == ["home.conf"]
+
+    def test_replaces_existing_file(self, temp_dir: Path) -> None:
+        """Should tighten permissions when overwriting a readable file."""
+        path = temp_dir / "home.conf"
+        path.write_bytes(b"old contents that are longer")
+        path.chmod(0o644)
+
+        write_private_file(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_failed_write_keeps_original(self, temp_dir: Path) -> None:
+        """Should leave the previous file intact if writing fails."""
+        path = temp_dir / "home.conf"
+        path.write_bytes(b"original")
+
+        with patch("utils.fileio.os.write", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_private_file(path, b"new")
+
+        assert path.read_bytes() == b"original"
+        assert [p.name for p in temp_dir.iterdir()] == ["home.conf"]
@@ -0,0 +1,94 @@
+"""
+JSON Codec Tests
+================
+
+Unit tests for the orjson/json wrapper, covering both backends.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from utils import json_codec
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request: pytest.FixtureRequest):
+    """Run each test with orjson (if installed) and the json fallback."""
+    if request.param == "json":
+        with patch.object(json_codec, "orjson", None):
+            yield request.param
+    else:
+        if not json_codec.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        yield request.param
+
+
+class TestLoads:
+    """Tests for json_codec.loads."""
+
+    def test_parses_str(self, backend: str) -> None:
+        """Should parse a JSON string."""
+        assert json_codec.loads('{"a": 1}') == {"a": 1}
+
+    def test_parses_bytes(self, backend: str) -> None:
+        """Should parse UTF-8 encoded bytes."""
+        assert json_codec.loads(b'[1, "\xc3\xa9"]') == [1, "é"]
+
+    def test_parses_memoryview(self, backend: str) -> None:
+        """Should parse buffer objects."""
+        assert json_codec.loads(memoryview(b'{"ok": true}')) == {"ok": True}
+
+    def test_raises_standard_decode_error(self, backend: str) -> None:
+        """Should raise json.JSONDecodeError on invalid input."""
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("not valid json")
+
+
+class TestLoadFile:
+    """Tests for json_codec.load_file."""
+
+    def test_parses_file(self, backend: str, temp_dir: Path) -> None:
+        """Should parse a JSON file from disk."""
+        path = temp_dir / "data.json"
+        path.write_text('[{"ping_ms": 15.5}]')
+
+        assert json_codec.load_file(path) == [{"ping_ms": 15.5}]
+
+    def test_empty_file_raises_decode_error(self, backend: str, temp_dir: Path) -> None:
+        """Should raise JSONDecodeError for an empty file."""
+        path = temp_dir / "empty.json"
+        path.write_text("")
+
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.load_file(path)
+
+    def test_missing_file_raises_os_error(self, backend: str, temp_dir: Path) -> None:
+        """Should raise OSError when the file does not exist."""
+        with pytest.raises(OSError):
+            json_codec.load_file(temp_dir / "missing.json")
+
+
+class TestDumps:
+    """Tests for json_codec.dumps."""
+
+    def test_returns_bytes(self, backend: str) -> None:
+        """Should serialize to bytes that round-trip."""
+        data = [{"timestamp": "2024-01-01T12:00:00", "ping_ms": 15.5}]
+        encoded = json_codec.dumps(data)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == data
+
+    def test_indent(self, backend: str) -> None:
+        """Should pretty-print with two-space indentation."""
+        encoded = json_codec.dumps({"a": 1}, indent=True)
+
+        assert encoded == b'{\n  "a": 1\n}'
@@ -84,6 +84,22 @@ class TestSanitizeFilename:
         with pytest.raises(ValueError):
             sanitize_filename(None)  # type: ignore
 
+    def test_repeated_names_are_cached(self) -> None:
+        """Should serve repeat calls from the cache."""
+        sanitize_filename.cache_clear()
+
+        first = sanitize_filename("home vpn.conf")
+        second = sanitize_filename("home vpn.conf")
+
+        assert first == second == "home_vpn.conf"
+        assert sanitize_filename.cache_info().hits == 1
+
+    def test_invalid_names_raise_every_time(self) -> None:
+        """Should not cache failures."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                sanitize_filename("dir/")
+
     def test_only_dots_returns_underscores(self) -> None:
         """Leading dot gets replaced with underscore."""
         # "..." has leading dot replaced, resulting in "_.."
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import threading
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
 
@@ -75,6 +77,20 @@ class TestSpeedTestResult:
         assert data["upload_mbps"] == 50.99
         assert data["ping_ms"] == 15.46
 
+    def test_to_dict_formatted_values_match_rounded(self) -> None:
+        """Formatted strings should agree with the rounded numbers."""
+        result = SpeedTestResult(
+            timestamp="2024-01-01T12:00:00",
+            download_mbps=100.12345,
+            upload_mbps=50.98765,
+            ping_ms=15.456,
+        )
+        data = result.to_dict()
+
+        assert data["download_formatted"] == "100.12 Mbps"
+        assert data["upload_formatted"] == "50.99 Mbps"
+        assert data["ping_formatted"] == "15.5 ms"
+
     def test_to_dict_error_result(self) -> None:
         """Should include error in dictionary."""
         result = SpeedTestResult(
@@ -122,7 +138,7 @@ class TestSpeedTestServiceRunTest:
 
     @pytest.mark.asyncio
     async def test_sets_test_in_progress_flag(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, temp_dir: Path
     ) -> None:
         """Should set _test_in_progress flag during test."""
         mock_executor.set_response("speedtest-cli --json", return_code=1)
@@ -132,6 +148,8 @@ class TestSpeedTestServiceRunTest:
         SpeedTestService._test_in_progress = False
 
         with patch.object(
+            SpeedTestService, "HISTORY_FILE", temp_dir / "speedtest_history.json"
+        ), patch.object(
             SpeedTestService, "_execute_speedtest",
             new_callable=AsyncMock,
             return_value=SpeedTestResult(
@@ -170,6 +188,129 @@ class TestSpeedTestServiceRunTest:
         assert history_file.exists()
 
 
+class TestSpeedTestServiceExecuteSpeedtest:
+    """Tests for _execute_speedtest backend selection."""
+
+    @pytest.mark.asyncio
+    async def test_detect_tools_caches_installed(self) -> None:
+        """Should not look up a binary again once it was found."""
+        SpeedTestService._installed_tools = set()
+
+        with patch(
+            "services.speedtest_service.shutil.which", return_value="/usr/bin/tool"
+        ) as which:
+            first = await SpeedTestService._detect_tools()
+            second = await SpeedTestService._detect_tools()
+
+        assert first == {"speedtest-cli": True, "speedtest": True}
+        assert second == first
+        assert which.call_count == 2
+        SpeedTestService._installed_tools = set()
+
+    @pytest.mark.asyncio
+    async def test_detect_tools_rechecks_missing(self) -> None:
+        """Should pick up a binary installed after a failed lookup."""
+        SpeedTestService._installed_tools = set()
+
+        with patch("services.speedtest_service.shutil.which", return_value=None):
+            first = await SpeedTestService._detect_tools()
+        with patch(
+            "services.speedtest_service.shutil.which",
+            side_effect=lambda tool: "/usr/bin/speedtest" if tool == "speedtest" else None,
+        ) as which:
+            second = await SpeedTestService._detect_tools()
+
+        assert first == {"speedtest-cli": False, "speedtest": False}
+        assert second == {"speedtest-cli": False, "speedtest": True}
+        assert which.call_count == 2
+        SpeedTestService._installed_tools = set()
+
+    @pytest.mark.asyncio
+    async def test_skips_missing_tools(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should go straight to the ping test when no tool is installed."""
+        mock_executor.set_response(
+            "ping -c 5 -W 2 8.8.8.8",
+            return_code=0,
+            stdout="rtt min/avg/max/mdev = 10.0/15.5/20.0/2.5 ms"
+        )
+        SpeedTestService._installed_tools = set()
+
+        with patch.object(
+            SpeedTestService, "_has_internet", new_callable=AsyncMock, return_value=True
+        ), patch("services.speedtest_service.shutil.which", return_value=None):
+            result = await SpeedTestService._execute_speedtest()
+
+        commands = [c[0][0] for c in mock_executor.calls]
+        assert commands == ["ping"]
+        assert result.ping_ms == 15.5
+        SpeedTestService._installed_tools = set()
+
+    @pytest.mark.asyncio
+    async def test_uses_installed_tool(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should run the ookla binary directly when only it is installed."""
+        output = json.dumps({
+            "download": {"bandwidth": 12_500_000},
+            "upload": {"bandwidth": 6_250_000},
+            "ping": {"latency": 15.5},
+        })
+        mock_executor.set_response(
+            "speedtest --format=json --accept-license",
+            return_code=0,
+            stdout=output
+        )
+        SpeedTestService._installed_tools = {"speedtest"}
+
+        with patch.object(
+            SpeedTestService, "_has_internet", new_callable=AsyncMock, return_value=True
+        ), patch("services.speedtest_service.shutil.which", return_value=None):
+            result = await SpeedTestService._execute_speedtest()
+
+        commands = [c[0][0] for c in mock_executor.calls]
+        assert commands == ["speedtest"]
+        assert result.download_mbps == 100.0
+        SpeedTestService._installed_tools = set()
+
+
+    @pytest.mark.asyncio
+    async def test_skips_bandwidth_tests_when_offline(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should go straight to the ping test when the probe fails."""
+        mock_executor.set_response("ping -c 5 -W 2 8.8.8.8", return_code=1)
+        SpeedTestService._installed_tools = {"speedtest-cli", "speedtest"}
+
+        with patch.object(
+            SpeedTestService, "_has_internet", new_callable=AsyncMock, return_value=False
+        ):
+            result = await SpeedTestService._execute_speedtest()
+
+        commands = [c[0][0] for c in mock_executor.calls]
+        assert commands == ["ping"]
+        assert result.success is False
+        SpeedTestService._installed_tools = set()
+
+    @pytest.mark.asyncio
+    async def test_has_internet_true_when_probe_connects(self) -> None:
+        """Should report online when the probe connection succeeds."""
+        with patch("services.speedtest_service.socket.create_connection") as connect:
+            assert await SpeedTestService._has_internet() is True
+
+        connect.assert_called_once_with(("1.1.1.1", 53), timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_has_internet_false_on_error(self) -> None:
+        """Should report offline when the probe connection fails."""
+        with patch(
+            "services.speedtest_service.socket.create_connection",
+            side_effect=OSError("Network is unreachable"),
+        ):
+            assert await SpeedTestService._has_internet() is False
+
+
 class TestSpeedTestServiceSpeedtestCli:
     """Tests for _run_speedtest_cli method."""
 
@@ -345,7 +486,8 @@ class TestSpeedTestServiceHistory:
         assert len(result) == 1
         assert result[0].download_mbps == 100.0
 
-    def test_save_to_history(self, temp_dir: Path) -> None:
+    @pytest.mark.asyncio
+    async def test_save_to_history(self, temp_dir: Path) -> None:
         """Should save result to history file."""
         history_file = temp_dir / "speedtest_history.json"
 
@@ -358,12 +500,86 @@ class TestSpeedTestServiceHistory:
         )
 
         with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
-            SpeedTestService._save_to_history(result)
+            await SpeedTestService._save_to_history(result)
 
         assert history_file.exists()
         data = json.loads(history_file.read_text())
         assert len(data) == 1
 
+    @pytest.mark.asyncio
+    async def test_save_to_history_round_trips(self, temp_dir: Path) -> None:
+        """Should load entries written by a previous save."""
+        history_file = temp_dir / "speedtest_history.json"
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            for ping in (10.0, 20.0):
+                await SpeedTestService._save_to_history(SpeedTestResult(
+                    timestamp="2024-01-01T12:00:00",
+                    download_mbps=100.0,
+                    upload_mbps=50.0,
+                    ping_ms=ping,
+                ))
+            SpeedTestService._history_cache = None
+            result = SpeedTestService.get_history()
+
+        assert [r.ping_ms for r in result] == [20.0, 10.0]
+
+    @pytest.mark.asyncio
+    async def test_save_to_history_trims_to_max(self, temp_dir: Path) -> None:
+        """Should keep only the newest MAX_HISTORY entries."""
+        history_file = temp_dir / "speedtest_history.json"
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            with patch.object(SpeedTestService, "MAX_HISTORY", 3):
+                for i in range(5):
+                    await SpeedTestService._save_to_history(SpeedTestResult(
+                        timestamp=f"2024-01-0{i+1}T12:00:00",
+                        download_mbps=100.0,
+                        upload_mbps=50.0,
+                        ping_ms=15.0,
+                    ))
+
+        data = json.loads(history_file.read_text())
+        assert [e["timestamp"][:10] for e in data] == [
+            "2024-01-05", "2024-01-04", "2024-01-03"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_history_dicts_returns_serialized_entries(self, temp_dir: Path) -> None:
+        """Should return stored entries including formatted fields."""
+        history_file = temp_dir / "speedtest_history.json"
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            await SpeedTestService._save_to_history(SpeedTestResult(
+                timestamp="2024-01-01T12:00:00",
+                download_mbps=100.0,
+                upload_mbps=50.0,
+                ping_ms=15.0,
+            ))
+            result = SpeedTestService.get_history_dicts()
+
+        assert len(result) == 1
+        assert result[0]["download_formatted"] == "100.00 Mbps"
+
+    @pytest.mark.asyncio
+    async def test_get_history_reloads_when_file_changes(self, temp_dir: Path) -> None:
+        """Should not serve a stale cache after the file is rewritten."""
+        history_file = temp_dir / "speedtest_history.json"
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            await SpeedTestService._save_to_history(SpeedTestResult(
+                timestamp="2024-01-01T12:00:00",
+                download_mbps=100.0,
+                upload_mbps=50.0,
+                ping_ms=15.0,
+            ))
+            history_file.write_text("[]")
+            stat = history_file.stat()
+            os.utime(history_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            result = SpeedTestService.get_history()
+
+        assert result == []
+
     def test_save_to_history_limits_size(self, temp_dir: Path) -> None:
         """Should limit history to MAX_HISTORY entries."""
         history_file = temp_dir / "speedtest_history.json"
@@ -406,6 +622,42 @@ class TestSpeedTestServiceHistory:
 
         assert result is True
 
+    def test_clear_history_waits_for_save(self, temp_dir: Path) -> None:
+        """Should not clear while a save holds the history lock."""
+        history_file = temp_dir / "speedtest_history.json"
+        history_file.write_text('[{"test": "data"}]')
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            with SpeedTestService._history_lock:
+                clearer = threading.Thread(target=SpeedTestService.clear_history)
+                clearer.start()
+                clearer.join(timeout=0.1)
+                assert clearer.is_alive()
+                assert history_file.exists()
+            clearer.join(timeout=5)
+
+        assert not clearer.is_alive()
+        assert not history_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_keep_all_entries(self, temp_dir: Path) -> None:
+        """Should not lose entries when saves run concurrently."""
+        history_file = temp_dir / "speedtest_history.json"
+
+        with patch.object(SpeedTestService, "HISTORY_FILE", history_file):
+            await asyncio.gather(*(
+                SpeedTestService._save_to_history(SpeedTestResult(
+                    timestamp="2024-01-01T12:00:00",
+                    download_mbps=100.0,
+                    upload_mbps=50.0,
+                    ping_ms=float(i),
+                ))
+                for i in range(10)
+            ))
+
+        data = json.loads(history_file.read_text())
+        assert sorted(e["ping_ms"] for e in data) == [float(i) for i in range(10)]
+
 
 class TestSpeedTestServiceGetLastResult:
     """Tests for get_last_result method."""
@@ -10,15 +10,36 @@ License: MIT
 
 from __future__ import annotations
 
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch
+from typing import Generator
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from services.ssl_service import SSLService, CertificateInfo
+from services.ssl_service import SSLService, CertificateInfo, _parse_openssl_date
 from tests.conftest import MockCommandExecutor
 
 
+@pytest.fixture(autouse=True)
+def sudo_prefix():
+    """Run commands as an unprivileged service user regardless of test uid."""
+    with patch("services.ssl_service._SUDO", ["sudo"]):
+        yield
+
+
+@pytest.fixture
+def certbot() -> Generator[MagicMock, None, None]:
+    """Patch the certbot PATH lookup; set return_value to None to uninstall it."""
+    SSLService._certbot_installed = False
+    with patch(
+        "services.ssl_service.shutil.which", return_value="/usr/bin/certbot"
+    ) as which:
+        yield which
+    SSLService._certbot_installed = False
+
+
 class TestCertificateInfo:
     """Tests for CertificateInfo dataclass."""
 
@@ -139,6 +160,120 @@ notAfter=Jan  1 00:00:00 2025 GMT
         assert result.valid is False
 
 
+class TestSSLServiceCertificateCache:
+    """Tests for certificate info caching."""
+
+    OPENSSL_OUTPUT = """
+subject=CN = roselink.local
+issuer=CN = roselink.local, O = ROSE Link
+notBefore=Jan  1 00:00:00 2024 GMT
+notAfter=Jan  1 00:00:00 2025 GMT
+"""
+
+    def _openssl_calls(self, mock_executor: MockCommandExecutor) -> int:
+        return len([c for c in mock_executor.calls if c[0][0] == "openssl"])
+
+    def test_reuses_parsed_certificate(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should not re-run openssl while the cached entry is fresh."""
+        cert_file = temp_dir / "rose-link.crt"
+        cert_file.write_text("cert content")
+        mock_executor.set_response(
+            "openssl x509", return_code=0, stdout=self.OPENSSL_OUTPUT
+        )
+
+        SSLService.clear_cache()
+        with patch.object(SSLService, "CERT_DIR", temp_dir / "nonexistent"):
+            with patch.object(SSLService, "SELF_SIGNED_CERT", cert_file):
+                first = SSLService.get_certificate_info()
+                second = SSLService.get_certificate_info()
+
+        assert first == second
+        assert self._openssl_calls(mock_executor) == 1
+
+    def test_cached_certificate_is_copied(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should not let a caller's changes leak into the cache."""
+        cert_file = temp_dir / "rose-link.crt"
+        cert_file.write_text("cert content")
+        mock_executor.set_response(
+            "openssl x509", return_code=0, stdout=self.OPENSSL_OUTPUT
+        )
+
+        SSLService.clear_cache()
+        with patch.object(SSLService, "CERT_DIR", temp_dir / "nonexistent"):
+            with patch.object(SSLService, "SELF_SIGNED_CERT", cert_file):
+                first = SSLService.get_certificate_info()
+                first.valid = False
+                first.days_until_expiry = -1
+                second = SSLService.get_certificate_info()
+
+        assert second is not first
+        assert second.valid is True
+        assert second.days_until_expiry != -1
+
+    def test_reparses_when_certificate_changes(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should re-run openssl when the certificate mtime changes."""
+        cert_file = temp_dir / "rose-link.crt"
+        cert_file.write_text("cert content")
+        mock_executor.set_response(
+            "openssl x509", return_code=0, stdout=self.OPENSSL_OUTPUT
+        )
+
+        SSLService.clear_cache()
+        with patch.object(SSLService, "CERT_DIR", temp_dir / "nonexistent"):
+            with patch.object(SSLService, "SELF_SIGNED_CERT", cert_file):
+                SSLService.get_certificate_info()
+                stat = cert_file.stat()
+                os.utime(cert_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                SSLService.get_certificate_info()
+
+        assert self._openssl_calls(mock_executor) == 2
+
+    def test_reparses_after_ttl(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should re-run openssl once the cache TTL has expired."""
+        cert_file = temp_dir / "rose-link.crt"
+        cert_file.write_text("cert content")
+        mock_executor.set_response(
+            "openssl x509", return_code=0, stdout=self.OPENSSL_OUTPUT
+        )
+
+        SSLService.clear_cache()
+        with patch.object(SSLService, "CERT_DIR", temp_dir / "nonexistent"):
+            with patch.object(SSLService, "SELF_SIGNED_CERT", cert_file):
+                with patch.object(SSLService, "CERT_CACHE_TTL", 0):
+                    SSLService.get_certificate_info()
+                    SSLService.get_certificate_info()
+
+        assert self._openssl_calls(mock_executor) == 2
+
+
+class TestParseOpensslDate:
+    """Tests for the openssl date parser."""
+
+    def test_parses_padded_day(self) -> None:
+        """Should parse openssl's space-padded single-digit day."""
+        assert _parse_openssl_date("Jan  1 00:00:00 2024 GMT") == datetime(2024, 1, 1)
+
+    def test_parses_full_timestamp(self) -> None:
+        """Should parse time of day."""
+        assert _parse_openssl_date("Nov 26 12:34:56 2025 GMT") == datetime(
+            2025, 11, 26, 12, 34, 56
+        )
+
+    @pytest.mark.parametrize("value", ["", "Foo 1 00:00:00 2024 GMT", "Jan 1 2024"])
+    def test_rejects_invalid_dates(self, value: str) -> None:
+        """Should raise ValueError for malformed input."""
+        with pytest.raises(ValueError):
+            _parse_openssl_date(value)
+
+
 class TestSSLServiceParseCertificate:
     """Tests for _parse_certificate method."""
 
@@ -169,6 +304,44 @@ notAfter=Dec 31 23:59:59 2024 GMT
         assert result.domain == "example.com"
         assert "Test CA" in result.issuer
 
+    def test_calculates_days_until_expiry(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should compute days remaining from notAfter."""
+        cert_file = temp_dir / "cert.pem"
+        cert_file.write_text("cert")
+        not_after = (datetime.now() + timedelta(days=45, hours=1)).strftime(
+            "%b %d %H:%M:%S %Y GMT"
+        )
+        mock_executor.set_response(
+            "openssl x509",
+            return_code=0,
+            stdout=f"issuer=CN = Test\nnotAfter={not_after}\n"
+        )
+
+        result = SSLService._parse_certificate(cert_file, temp_dir / "key.pem", "example.com")
+
+        assert result.days_until_expiry == 45
+
+    def test_self_signed_flag_comes_from_caller(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should not infer self-signed status from the issuer string."""
+        cert_file = temp_dir / "cert.pem"
+        cert_file.write_text("cert")
+        mock_executor.set_response(
+            "openssl x509",
+            return_code=0,
+            stdout="issuer=C = US, O = Some Other CA, CN = E1\n"
+        )
+
+        result = SSLService._parse_certificate(
+            cert_file, temp_dir / "key.pem", "example.com", is_self_signed=False
+        )
+
+        assert result.is_self_signed is False
+        assert "Some Other CA" in result.issuer
+
     def test_returns_invalid_on_openssl_error(
         self, temp_dir: Path, mock_executor: MockCommandExecutor
     ) -> None:
@@ -193,34 +366,47 @@ class TestSSLServiceCheckCertbotInstalled:
     """Tests for check_certbot_installed method."""
 
     def test_returns_true_when_installed(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should return True when certbot is installed."""
-        mock_executor.set_response("which certbot", return_code=0)
-
         result = SSLService.check_certbot_installed()
 
         assert result is True
+        assert mock_executor.calls == []
 
     def test_returns_false_when_not_installed(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should return False when certbot is not installed."""
-        mock_executor.set_response("which certbot", return_code=1)
+        certbot.return_value = None
 
         result = SSLService.check_certbot_installed()
 
         assert result is False
 
+    def test_caches_positive_result(self, certbot: MagicMock) -> None:
+        """Should look up certbot only once after it is found."""
+        SSLService.check_certbot_installed()
+        SSLService.check_certbot_installed()
+
+        assert certbot.call_count == 1
+
+    def test_rechecks_when_not_installed(self, certbot: MagicMock) -> None:
+        """Should detect certbot installed after a negative check."""
+        certbot.return_value = None
+        assert SSLService.check_certbot_installed() is False
+
+        certbot.return_value = "/usr/bin/certbot"
+        assert SSLService.check_certbot_installed() is True
+
 
 class TestSSLServiceRequestCertificate:
     """Tests for request_certificate method."""
 
     def test_requests_certificate_successfully(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should request certificate and return success."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response("sudo certbot certonly", return_code=0)
 
         result = SSLService.request_certificate(
@@ -232,10 +418,10 @@ class TestSSLServiceRequestCertificate:
         assert "example.com" in result["domain"]
 
     def test_raises_error_when_certbot_not_installed(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should raise RuntimeError when certbot not installed."""
-        mock_executor.set_response("which certbot", return_code=1)
+        certbot.return_value = None
 
         with pytest.raises(RuntimeError, match="not installed"):
             SSLService.request_certificate(
@@ -244,10 +430,9 @@ class TestSSLServiceRequestCertificate:
             )
 
     def test_returns_failure_on_certbot_error(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should return failure when certbot fails."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response(
             "sudo certbot certonly",
             return_code=1,
@@ -262,9 +447,10 @@ class TestSSLServiceRequestCertificate:
         assert result["success"] is False
         assert "failed" in result["message"].lower()
 
-    def test_dry_run_mode(self, mock_executor: MockCommandExecutor) -> None:
+    def test_dry_run_mode(
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
+    ) -> None:
         """Should run in dry-run mode when requested."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response("sudo certbot certonly", return_code=0)
 
         result = SSLService.request_certificate(
@@ -286,10 +472,9 @@ class TestSSLServiceRenewCertificates:
     """Tests for renew_certificates method."""
 
     def test_renews_certificates_successfully(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should renew certificates and return success."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response("sudo certbot renew", return_code=0)
 
         result = SSLService.renew_certificates()
@@ -297,19 +482,18 @@ class TestSSLServiceRenewCertificates:
         assert result["success"] is True
 
     def test_raises_error_when_certbot_not_installed(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should raise RuntimeError when certbot not installed."""
-        mock_executor.set_response("which certbot", return_code=1)
+        certbot.return_value = None
 
         with pytest.raises(RuntimeError, match="not installed"):
             SSLService.renew_certificates()
 
     def test_returns_failure_on_renew_error(
-        self, mock_executor: MockCommandExecutor
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
     ) -> None:
         """Should return failure when renewal fails."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response(
             "sudo certbot renew",
             return_code=1,
@@ -320,9 +504,10 @@ class TestSSLServiceRenewCertificates:
 
         assert result["success"] is False
 
-    def test_dry_run_mode(self, mock_executor: MockCommandExecutor) -> None:
+    def test_dry_run_mode(
+        self, mock_executor: MockCommandExecutor, certbot: MagicMock
+    ) -> None:
         """Should run in dry-run mode when requested."""
-        mock_executor.set_response("which certbot", return_code=0)
         mock_executor.set_response("sudo certbot renew", return_code=0)
 
         result = SSLService.renew_certificates(dry_run=True)
@@ -387,6 +572,20 @@ class TestSSLServiceGenerateSelfSigned:
         assert result["success"] is True
 
 
+class TestSSLServiceRunningAsRoot:
+    """Tests for command construction when already running as root."""
+
+    def test_omits_sudo(self, mock_executor: MockCommandExecutor) -> None:
+        """Should not prefix privileged commands with sudo."""
+        mock_executor.set_response("systemctl reload nginx", return_code=0)
+
+        with patch("services.ssl_service._SUDO", []):
+            result = SSLService.reload_nginx()
+
+        assert result is True
+        assert mock_executor.calls[0][0] == ["systemctl", "reload", "nginx"]
+
+
 class TestSSLServiceReloadNginx:
     """Tests for reload_nginx method."""
 
@@ -11,16 +11,28 @@ License: MIT
 from __future__ import annotations
 
 import json
+import os
+import threading
 from pathlib import Path
+from typing import Optional
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from models import SystemInfo, InterfaceInfo, WiFiCapabilities
+from services import system_service
 from services.system_service import SystemService
 from tests.conftest import MockCommandExecutor
 
 
+@pytest.fixture(autouse=True)
+def clear_system_cache():
+    """Ensure cached static system info doesn't leak between tests."""
+    SystemService.clear_cache()
+    yield
+    SystemService.clear_cache()
+
+
 class TestSystemServiceGetInfo:
     """Tests for SystemService.get_info()."""
 
@@ -28,13 +40,8 @@ class TestSystemServiceGetInfo:
         self, mock_executor: MockCommandExecutor
     ) -> None:
         """Should return a SystemInfo object."""
-        mock_executor.set_response("uname -m", return_code=0, stdout="aarch64\n")
-        mock_executor.set_response("uname -r", return_code=0, stdout="6.1.0-rpi\n")
-        mock_executor.set_response("free -m", return_code=0, stdout="Mem: 8000 4000 4000 0 0 0\n")
-        mock_executor.set_response("df -BG /", return_code=0, stdout="Filesystem 32G 16G 16G 50% /\n")
         mock_executor.set_response("iw list", return_code=1, stdout="")
         mock_executor.set_response("ip -j addr show", return_code=0, stdout="[]")
-        mock_executor.set_response("grep cpu ", return_code=1, stdout="")
 
         info = SystemService.get_info()
 
@@ -44,17 +51,122 @@ class TestSystemServiceGetInfo:
         self, mock_executor: MockCommandExecutor
     ) -> None:
         """Should include system architecture."""
-        mock_executor.set_response("uname -m", return_code=0, stdout="aarch64\n")
-        mock_executor.set_response("uname -r", return_code=1, stdout="")
-        mock_executor.set_response("free -m", return_code=1, stdout="")
-        mock_executor.set_response("df -BG /", return_code=1, stdout="")
         mock_executor.set_response("iw list", return_code=1, stdout="")
         mock_executor.set_response("ip -j addr show", return_code=0, stdout="[]")
-        mock_executor.set_response("grep cpu ", return_code=1, stdout="")
 
-        info = SystemService.get_info()
+        uname = os.uname_result(("Linux", "roselink", "6.1.0-rpi", "#1 SMP", "aarch64"))
+        with patch("services.system_service.os.uname", return_value=uname):
+            info = SystemService.get_info()
 
         assert info.architecture == "aarch64"
+        assert info.kernel_version == "6.1.0-rpi"
+
+
+    def test_get_info_runs_collectors_concurrently(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should not serialize slow collectors behind each other."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer(info: SystemInfo) -> None:
+            # Deadlocks (and times out) unless both run at the same time
+            barrier.wait()
+
+        with patch.object(SystemService, "_get_disk_info", wait_for_peer), \
+                patch.object(SystemService, "_get_wifi_capabilities", wait_for_peer):
+            mock_executor.set_response("ip -j addr show", return_code=0, stdout="[]")
+
+            info = SystemService.get_info()
+
+        assert isinstance(info, SystemInfo)
+
+    def test_get_info_propagates_collector_errors(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should re-raise unexpected errors from a collector."""
+        with patch.object(
+            SystemService, "_get_uptime", side_effect=RuntimeError("boom")
+        ):
+            with pytest.raises(RuntimeError, match="boom"):
+                SystemService.get_info()
+
+
+class TestSystemServiceStaticInfoCache:
+    """Tests for caching of boot-invariant system info."""
+
+    def test_static_info_read_once(self, temp_dir: Path) -> None:
+        """Should read model and versions only on the first call."""
+        model_file = temp_dir / "model"
+        model_file.write_text("Raspberry Pi 5 Model B Rev 1.0\x00")
+        os_release = temp_dir / "os-release"
+        os_release.write_text('PRETTY_NAME="Debian GNU/Linux 12 (bookworm)"\n')
+        uname = os.uname_result(("Linux", "roselink", "6.1.0-rpi", "#1 SMP", "aarch64"))
+
+        with patch("services.system_service.Paths") as mock_paths, \
+                patch("services.system_service.os.uname", return_value=uname) as mock_uname:
+            mock_paths.DEVICE_TREE_MODEL = model_file
+            mock_paths.OS_RELEASE = os_release
+
+            first = SystemInfo()
+            SystemService._get_static_info(first)
+            model_file.unlink()
+            second = SystemInfo()
+            SystemService._get_static_info(second)
+
+        assert mock_uname.call_count == 2  # architecture + kernel, first call only
+        assert second.model_short == "Pi 5"
+        assert second.architecture == "aarch64"
+        assert second.kernel_version == "6.1.0-rpi"
+        assert second.os_version == "Debian GNU/Linux 12 (bookworm)"
+
+    def test_clear_cache_forces_reload(self) -> None:
+        """Should re-read static info after clear_cache()."""
+        SystemService._static_info = {"model": "stale"}
+
+        SystemService.clear_cache()
+
+        assert SystemService._static_info is None
+
+
+class TestSystemServiceSoftwareVersions:
+    """Tests for OS version detection."""
+
+    @pytest.mark.parametrize("content, expected", [
+        ('NAME="Debian GNU/Linux"\nPRETTY_NAME="Debian GNU/Linux 12 (bookworm)"\n',
+         "Debian GNU/Linux 12 (bookworm)"),
+        ("PRETTY_NAME='Raspbian GNU/Linux 11 (bullseye)'\nID=raspbian\n",
+         "Raspbian GNU/Linux 11 (bullseye)"),
+        ("ID=alpine\nPRETTY_NAME=Alpine\n", "Alpine"),
+    ])
+    def test_reads_pretty_name(self, temp_dir: Path, content: str, expected: str) -> None:
+        """Should extract PRETTY_NAME with or without quotes."""
+        os_release = temp_dir / "os-release"
+        os_release.write_text(content)
+
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.OS_RELEASE = os_release
+
+            SystemService._get_software_versions(info)
+
+        assert info.os_version == expected
+
+    def test_missing_pretty_name(self, temp_dir: Path) -> None:
+        """Should keep the default when PRETTY_NAME is absent or unreadable."""
+        os_release = temp_dir / "os-release"
+        os_release.write_text("NAME=Debian\nXPRETTY_NAME=nope\n")
+
+        info = SystemInfo()
+        default = info.os_version
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.OS_RELEASE = os_release
+            SystemService._get_software_versions(info)
+            mock_paths.OS_RELEASE = temp_dir / "nonexistent"
+            SystemService._get_software_versions(info)
+
+        assert info.os_version == default
 
 
 class TestSystemServiceModelInfo:
@@ -103,6 +215,27 @@ class TestSystemServiceModelInfo:
 
         assert info.model_short == "Zero 2W"
 
+    @pytest.mark.parametrize("model, expected", [
+        ("Raspberry Pi 3 Model B Plus Rev 1.3", "Pi 3"),
+        ("Raspberry Pi Compute Module 4 Rev 1.1", "Pi"),
+        ("Generic ARM board", "unknown"),
+    ])
+    def test_get_model_info_short_names(
+        self, temp_dir: Path, model: str, expected: str
+    ) -> None:
+        """Should map other models to their short names."""
+        model_file = temp_dir / "model"
+        model_file.write_text(model + "\x00")
+
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.DEVICE_TREE_MODEL = model_file
+
+            SystemService._get_model_info(info)
+
+        assert info.model_short == expected
+
     def test_get_model_info_missing_file(self, temp_dir: Path) -> None:
         """Should handle missing model file gracefully."""
         info = SystemInfo()
@@ -119,64 +252,109 @@ class TestSystemServiceModelInfo:
 class TestSystemServiceMemoryInfo:
     """Tests for memory information parsing."""
 
-    def test_get_memory_info_parses_ram(
-        self, mock_executor: MockCommandExecutor
-    ) -> None:
-        """Should parse RAM from free output."""
-        mock_executor.set_response(
-            "free -m",
-            return_code=0,
-            stdout="              total        used        free      shared  buff/cache   available\n"
-                   "Mem:           7815        1234        4000         100        2581        6200\n"
-                   "Swap:           100          50          50\n"
+    def test_get_memory_info_parses_ram(self, temp_dir: Path) -> None:
+        """Should parse RAM from /proc/meminfo."""
+        meminfo = temp_dir / "meminfo"
+        meminfo.write_text(
+            "MemTotal:        8002600 kB\n"
+            "MemFree:         4096000 kB\n"
+            "MemAvailable:    6348800 kB\n"
+            "Buffers:          123456 kB\n"
         )
 
         info = SystemInfo()
-        SystemService._get_memory_info(info)
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.PROC_MEMINFO = meminfo
+
+            SystemService._get_memory_info(info)
 
         assert info.ram_mb == 7815
-        assert info.ram_free_mb == 4000
+        assert info.ram_free_mb == 6200
+
+    def test_get_memory_info_falls_back_to_memfree(self, temp_dir: Path) -> None:
+        """Should use MemFree on kernels without MemAvailable."""
+        meminfo = temp_dir / "meminfo"
+        meminfo.write_text(
+            "MemTotal:        8002600 kB\n"
+            "MemFree:         4096000 kB\n"
+        )
 
-    def test_get_memory_info_handles_failure(
-        self, mock_executor: MockCommandExecutor
-    ) -> None:
-        """Should handle command failure gracefully."""
-        mock_executor.set_response("free -m", return_code=1, stdout="")
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.PROC_MEMINFO = meminfo
+
+            SystemService._get_memory_info(info)
+
+        assert info.ram_free_mb == 4000
 
+    def test_get_memory_info_handles_failure(self, temp_dir: Path) -> None:
+        """Should handle a missing meminfo file gracefully."""
         info = SystemInfo()
-        SystemService._get_memory_info(info)
 
-        # ram_mb keeps default value (0) when command fails
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.PROC_MEMINFO = temp_dir / "nonexistent"
+
+            SystemService._get_memory_info(info)
+
+        # ram_mb keeps default value (0) when the file can't be read
         assert info.ram_mb == 0
 
 
+    def test_clear_cache_during_read_keeps_fd_open(self, temp_dir: Path) -> None:
+        """Should not close a kept-open fd while a read is using it."""
+        meminfo = temp_dir / "meminfo"
+        meminfo.write_text("MemTotal:        8002600 kB\n")
+        real_pread = os.pread
+        fds = []
+
+        def pread_after_clear(fd: int, size: int, offset: int) -> bytes:
+            fds.append(fd)
+            SystemService.clear_cache()
+            return real_pread(fd, size, offset)
+
+        with patch("services.system_service.os.pread", side_effect=pread_after_clear):
+            content = system_service._read_kept_open(meminfo, 256)
+
+        assert content.startswith(b"MemTotal:")
+        assert meminfo not in system_service._kept_fds
+        with pytest.raises(OSError):
+            os.fstat(fds[0])
+
+
 class TestSystemServiceDiskInfo:
     """Tests for disk information parsing."""
 
-    def test_get_disk_info_parses_df(
+    def test_get_disk_info_uses_statvfs(
         self, mock_executor: MockCommandExecutor
     ) -> None:
-        """Should parse disk info from df output."""
-        mock_executor.set_response(
-            "df -BG /",
-            return_code=0,
-            stdout="Filesystem     1G-blocks  Used Available Use% Mounted on\n"
-                   "/dev/mmcblk0p2       29G    8G       19G  30% /\n"
-        )
+        """Should compute disk sizes from statvfs without running df."""
+        st = os.statvfs_result((4096, 4096, 7602176, 5500000, 4980736, 0, 0, 0, 0, 255))
 
         info = SystemInfo()
-        SystemService._get_disk_info(info)
+
+        with patch("services.system_service.os.statvfs", return_value=st):
+            SystemService._get_disk_info(info)
 
         assert info.disk_total_gb == 29
         assert info.disk_free_gb == 19
+        assert mock_executor.calls == []
+
+    def test_get_disk_info_handles_failure(self) -> None:
+        """Should keep defaults when statvfs fails."""
+        info = SystemInfo()
+
+        with patch("services.system_service.os.statvfs", side_effect=OSError):
+            SystemService._get_disk_info(info)
+
+        assert info.disk_total_gb == 0
 
 
 class TestSystemServiceCpuInfo:
     """Tests for CPU information parsing."""
 
-    def test_get_cpu_info_reads_temperature(
-        self, mock_executor: MockCommandExecutor, temp_dir: Path
-    ) -> None:
+    def test_get_cpu_info_reads_temperature(self, temp_dir: Path) -> None:
         """Should read CPU temperature from thermal zone."""
         thermal_file = temp_dir / "temp"
         thermal_file.write_text("45000")  # 45°C in millidegrees
@@ -187,12 +365,125 @@ class TestSystemServiceCpuInfo:
             mock_paths.THERMAL_ZONE = thermal_file
             mock_paths.PROC_STAT = temp_dir / "stat"
 
-            mock_executor.set_response("grep cpu ", return_code=1)
-
             SystemService._get_cpu_info(info)
 
         assert info.cpu_temp_c == 45
 
+    def test_get_cpu_info_reads_usage_from_proc_stat(self, temp_dir: Path) -> None:
+        """Should compute CPU usage from the aggregate cpu line."""
+        stat_file = temp_dir / "stat"
+        stat_file.write_text(
+            "cpu  100 0 100 750 50 0 0 0 0 0\n"
+            "cpu0 25 0 25 200 0 0 0 0 0 0\n"
+        )
+
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            SystemService._get_cpu_info(info)
+
+        assert info.cpu_usage_percent == 25.0
+
+    def test_get_cpu_info_ignores_per_core_lines(self, temp_dir: Path) -> None:
+        """Should only parse the aggregate line, even with many cores."""
+        stat_file = temp_dir / "stat"
+        per_core = "".join(f"cpu{n} 1 0 1 1 0 0 0 0 0 0\n" for n in range(256))
+        stat_file.write_text("cpu  300 0 100 600 0 0 0 0 0 0\n" + per_core)
+
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            SystemService._get_cpu_info(info)
+
+        assert info.cpu_usage_percent == 40.0
+
+
+    def test_get_cpu_info_uses_delta_between_samples(self, temp_dir: Path) -> None:
+        """Should report usage since the previous call, not since boot."""
+        stat_file = temp_dir / "stat"
+        stat_file.write_text("cpu  1000 0 0 9000 0 0 0 0 0 0\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            with patch("services.system_service.time.monotonic", side_effect=[100.0, 101.0]):
+                first = SystemInfo()
+                SystemService._get_cpu_info(first)
+                # 100 jiffies elapse, 80 of them busy
+                stat_file.write_text("cpu  1080 0 0 9020 0 0 0 0 0 0\n")
+                second = SystemInfo()
+                SystemService._get_cpu_info(second)
+
+        assert first.cpu_usage_percent == 10.0
+        assert second.cpu_usage_percent == 80.0
+
+    def test_get_cpu_info_close_polls_reuse_last_reading(self, temp_dir: Path) -> None:
+        """Should report the last reading when polled within the minimum interval."""
+        stat_file = temp_dir / "stat"
+        stat_file.write_text("cpu  1000 0 0 9000 0 0 0 0 0 0\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            times = [100.0, 100.1, 101.0]
+            with patch("services.system_service.time.monotonic", side_effect=times):
+                SystemService._get_cpu_info(SystemInfo())
+                # A few jiffies, all busy, would read as 100%
+                stat_file.write_text("cpu  1003 0 0 9000 0 0 0 0 0 0\n")
+                close = SystemInfo()
+                SystemService._get_cpu_info(close)
+                # The next window still starts at the first sample
+                stat_file.write_text("cpu  1080 0 0 9020 0 0 0 0 0 0\n")
+                later = SystemInfo()
+                SystemService._get_cpu_info(later)
+
+        assert close.cpu_usage_percent == 10.0
+        assert later.cpu_usage_percent == 80.0
+
+    def test_get_cpu_info_concurrent_polls_share_one_sample(self, temp_dir: Path) -> None:
+        """Should give concurrent polls the same reading, not a tiny window."""
+        stat_file = temp_dir / "stat"
+        stat_file.write_text("cpu  1000 0 0 9000 0 0 0 0 0 0\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            results = [SystemInfo() for _ in range(8)]
+            threads = [
+                threading.Thread(target=SystemService._get_cpu_info, args=(info,))
+                for info in results
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert {info.cpu_usage_percent for info in results} == {10.0}
+
+    def test_get_cpu_info_unchanged_counters_fall_back(self, temp_dir: Path) -> None:
+        """Should not divide by zero when no time has elapsed."""
+        stat_file = temp_dir / "stat"
+        stat_file.write_text("cpu  1000 0 0 9000 0 0 0 0 0 0\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.THERMAL_ZONE = temp_dir / "nonexistent"
+            mock_paths.PROC_STAT = stat_file
+
+            SystemService._get_cpu_info(SystemInfo())
+            info = SystemInfo()
+            SystemService._get_cpu_info(info)
+
+        assert info.cpu_usage_percent == 10.0
+
 
 class TestSystemServiceUptime:
     """Tests for uptime parsing."""
@@ -211,6 +502,34 @@ class TestSystemServiceUptime:
 
         assert info.uptime_seconds == 12345
 
+    def test_get_uptime_keeps_file_open(self, temp_dir: Path) -> None:
+        """Should reuse one descriptor and still see updated contents."""
+        uptime_file = temp_dir / "uptime"
+        uptime_file.write_text("100.00 200.00\n")
+
+        with patch("services.system_service.Paths") as mock_paths, \
+                patch("services.system_service.os.open", wraps=os.open) as mock_open:
+            mock_paths.PROC_UPTIME = uptime_file
+
+            SystemService._get_uptime(SystemInfo())
+            uptime_file.write_text("160.50 300.00\n")
+            info = SystemInfo()
+            SystemService._get_uptime(info)
+
+        assert info.uptime_seconds == 160
+        assert mock_open.call_count == 1
+
+    def test_get_uptime_handles_missing_file(self, temp_dir: Path) -> None:
+        """Should keep the default when the file can't be read."""
+        info = SystemInfo()
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.PROC_UPTIME = temp_dir / "nonexistent"
+
+            SystemService._get_uptime(info)
+
+        assert info.uptime_seconds == 0
+
 
 class TestSystemServiceWifiCapabilities:
     """Tests for WiFi capability detection."""
@@ -261,9 +580,100 @@ class TestSystemServiceWifiCapabilities:
         assert info.wifi_capabilities.ap_mode is True
 
 
+    def test_get_wifi_capabilities_single_pass_detects_all(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should detect every capability from one scan of the output."""
+        mock_executor.set_response(
+            "iw list",
+            return_code=0,
+            stdout="Wiphy phy0\n"
+                   "\tSupported interface modes:\n\t\t * managed\n\t\t * AP\n"
+                   "\tHE Iftypes: managed\n"
+                   "\tVHT Capabilities (0x0f825832):\n"
+                   "\tFrequencies:\n\t\t* 2412 MHz [1] (20.0 dBm)\n\t\t* 5180 MHz [36]\n"
+        )
+
+        info = SystemInfo()
+        SystemService._get_wifi_capabilities(info)
+
+        caps = info.wifi_capabilities
+        assert (caps.supports_5ghz, caps.supports_ac, caps.supports_ax, caps.ap_mode) == (
+            True, True, True, True
+        )
+
+    def test_get_wifi_capabilities_2ghz_only(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should leave flags unset when markers are absent."""
+        mock_executor.set_response(
+            "iw list",
+            return_code=0,
+            stdout="Frequencies:\n\t* 2412 MHz\n\t* 2437 MHz\n"
+        )
+
+        info = SystemInfo()
+        SystemService._get_wifi_capabilities(info)
+
+        caps = info.wifi_capabilities
+        assert not (caps.supports_5ghz or caps.supports_ac or caps.supports_ax or caps.ap_mode)
+
+    def test_get_wifi_capabilities_cached(
+        self, mock_executor: MockCommandExecutor, temp_dir: Path
+    ) -> None:
+        """Should run 'iw list' once while the wireless PHYs are unchanged."""
+        (temp_dir / "phy0").mkdir()
+        mock_executor.set_response("iw list", return_code=0, stdout="\t* 5180 MHz\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.SYS_IEEE80211 = temp_dir
+
+            SystemService._get_wifi_capabilities(SystemInfo())
+            info = SystemInfo()
+            SystemService._get_wifi_capabilities(info)
+
+        assert info.wifi_capabilities.supports_5ghz is True
+        assert [cmd for cmd, _ in mock_executor.calls].count(["iw", "list"]) == 1
+
+    def test_get_wifi_capabilities_redetects_on_new_phy(
+        self, mock_executor: MockCommandExecutor, temp_dir: Path
+    ) -> None:
+        """Should re-run 'iw list' when an adapter is added."""
+        (temp_dir / "phy0").mkdir()
+        mock_executor.set_response("iw list", return_code=0, stdout="\t* 2412 MHz\n")
+
+        with patch("services.system_service.Paths") as mock_paths:
+            mock_paths.SYS_IEEE80211 = temp_dir
+
+            SystemService._get_wifi_capabilities(SystemInfo())
+            (temp_dir / "phy1").mkdir()
+            mock_executor.set_response("iw list", return_code=0, stdout="\t* 5180 MHz\n")
+            info = SystemInfo()
+            SystemService._get_wifi_capabilities(info)
+
+        assert info.wifi_capabilities.supports_5ghz is True
+
+
+class FakeNetlinkMessage(dict):
+    """Minimal stand-in for a pyroute2 netlink message."""
+
+    def __init__(self, index: int, **attrs: str) -> None:
+        super().__init__(index=index)
+        self.attrs = attrs
+
+    def get_attr(self, name: str) -> Optional[str]:
+        return self.attrs.get(name)
+
+
 class TestSystemServiceGetInterfaces:
     """Tests for interface enumeration."""
 
+    @pytest.fixture(autouse=True)
+    def no_netlink(self):
+        """Use the 'ip -j' fallback unless a test provides IPRoute."""
+        with patch("services.system_service.IPRoute", None):
+            yield
+
     def test_get_interfaces_categorizes_correctly(
         self, mock_executor: MockCommandExecutor
     ) -> None:
@@ -320,6 +730,66 @@ class TestSystemServiceGetInterfaces:
         assert result["vpn"] == []
 
 
+    def test_get_interfaces_skips_uncategorized(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should ignore interfaces outside the known categories."""
+        interfaces_json = json.dumps([
+            {"ifname": "lo", "operstate": "UNKNOWN", "address": "00:00:00:00:00:00", "addr_info": []},
+            {"ifname": "docker0", "operstate": "DOWN", "address": "02:42:00:00:00:01", "addr_info": []},
+            {"ifname": "end0", "operstate": "UP", "address": "aa:bb:cc:dd:ee:ff", "addr_info": []},
+        ])
+        mock_executor.set_response("ip -j addr show", return_code=0, stdout=interfaces_json)
+
+        with patch.object(
+            SystemService, "_parse_interface_info", wraps=SystemService._parse_interface_info
+        ) as mock_parse:
+            result = SystemService.get_interfaces()
+
+        assert [i.name for i in result["ethernet"]] == ["end0"]
+        assert mock_parse.call_count == 1
+
+    def test_get_interfaces_uses_netlink(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should query netlink instead of running ip when pyroute2 is available."""
+        ipr = MagicMock()
+        ipr.__enter__.return_value = ipr
+        ipr.get_links.return_value = [
+            FakeNetlinkMessage(
+                2, IFLA_IFNAME="eth0", IFLA_OPERSTATE="UP", IFLA_ADDRESS="aa:bb:cc:dd:ee:ff"
+            ),
+            FakeNetlinkMessage(3, IFLA_IFNAME="wg0", IFLA_OPERSTATE="UNKNOWN"),
+        ]
+        ipr.get_addr.return_value = [
+            FakeNetlinkMessage(2, IFA_LOCAL="192.168.1.100"),
+            FakeNetlinkMessage(3, IFA_ADDRESS="10.0.0.2"),
+        ]
+
+        with patch("services.system_service.IPRoute", return_value=ipr):
+            result = SystemService.get_interfaces()
+
+        assert result["ethernet"][0].mac == "aa:bb:cc:dd:ee:ff"
+        assert result["ethernet"][0].state == "up"
+        assert result["ethernet"][0].ip_addresses == ["192.168.1.100"]
+        assert result["vpn"][0].ip_addresses == ["10.0.0.2"]
+        assert mock_executor.calls == []
+
+    def test_get_interfaces_falls_back_when_netlink_fails(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should fall back to 'ip -j addr show' on netlink errors."""
+        interfaces_json = json.dumps([
+            {"ifname": "eth0", "operstate": "UP", "address": "aa:bb:cc:dd:ee:ff", "addr_info": []},
+        ])
+        mock_executor.set_response("ip -j addr show", return_code=0, stdout=interfaces_json)
+
+        with patch("services.system_service.IPRoute", side_effect=OSError("EPERM")):
+            result = SystemService.get_interfaces()
+
+        assert result["ethernet"][0].name == "eth0"
+
+
 class TestSystemServiceGetLogs:
     """Tests for service log retrieval."""
 
@@ -0,0 +1,260 @@
+"""
+VPN Manager Tests
+=================
+
+Unit tests for the unified WireGuard/OpenVPN manager.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.vpn import (
+    VPNManager,
+    VPNType,
+    VPNConnectionStatus,
+    VPNProfileInfo,
+    WireGuardProvider,
+    OpenVPNProvider,
+)
+
+
+@pytest.fixture
+def providers() -> Iterator[dict[VPNType, MagicMock]]:
+    """Replace both VPN providers with mocks."""
+    mocks = {
+        VPNType.WIREGUARD: MagicMock(name="wireguard"),
+        VPNType.OPENVPN: MagicMock(name="openvpn"),
+    }
+    for vpn_type, mock in mocks.items():
+        mock.vpn_type = vpn_type
+        mock.interface_name = "wg0" if vpn_type == VPNType.WIREGUARD else "tun0"
+        mock.get_status.return_value = VPNConnectionStatus(vpn_type=vpn_type)
+        mock.list_profiles.return_value = []
+        mock.is_active.return_value = False
+
+    VPNManager._invalidate_active_cache()
+    with patch.object(VPNManager, "get_provider", side_effect=mocks.__getitem__):
+        yield mocks
+    VPNManager._invalidate_active_cache()
+
+
+class TestVPNManagerGetProvider:
+    """Tests for VPNManager.get_provider()."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_providers(self) -> Iterator[None]:
+        """Start each test without cached provider instances."""
+        with patch.object(VPNManager, "_providers", {}):
+            yield
+
+    @pytest.mark.parametrize("vpn_type, provider_cls", [
+        (VPNType.WIREGUARD, WireGuardProvider),
+        (VPNType.OPENVPN, OpenVPNProvider),
+    ])
+    def test_returns_provider_for_type(
+        self, vpn_type: VPNType, provider_cls: type
+    ) -> None:
+        """Should create the matching provider."""
+        assert isinstance(VPNManager.get_provider(vpn_type), provider_cls)
+
+    def test_reuses_instance(self) -> None:
+        """Should return the same instance on later calls."""
+        first = VPNManager.get_provider(VPNType.WIREGUARD)
+
+        assert VPNManager.get_provider(VPNType.WIREGUARD) is first
+
+    def test_unknown_type_raises(self) -> None:
+        """Should raise ValueError for an unregistered type."""
+        with pytest.raises(ValueError, match="Unknown VPN type"):
+            VPNManager.get_provider("tailscale")  # type: ignore[arg-type]
+
+
+class TestVPNManagerDetectType:
+    """Tests for VPNManager.detect_vpn_type()."""
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("home.conf", VPNType.WIREGUARD),
+        ("Office.CONF", VPNType.WIREGUARD),
+        ("provider.ovpn", VPNType.OPENVPN),
+        ("us-east.udp.OVPN", VPNType.OPENVPN),
+    ])
+    def test_detects_type_from_extension(self, filename: str, expected: VPNType) -> None:
+        """Should map the extension case-insensitively."""
+        assert VPNManager.detect_vpn_type(filename) == expected
+
+    @pytest.mark.parametrize("filename", ["notes.txt", "profile", "conf"])
+    def test_unknown_extension_raises(self, filename: str) -> None:
+        """Should reject files without a known extension."""
+        with pytest.raises(ValueError, match="Unknown VPN config file type"):
+            VPNManager.detect_vpn_type(filename)
+
+
+class TestVPNManagerCombinedStatus:
+    """Tests for VPNManager.get_combined_status()."""
+
+    def test_reports_active_provider(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should report the active provider as current."""
+        providers[VPNType.OPENVPN].is_active.return_value = True
+        providers[VPNType.OPENVPN].get_status.return_value = VPNConnectionStatus(
+            active=True, vpn_type=VPNType.OPENVPN, interface="tun0"
+        )
+
+        result = VPNManager.get_combined_status()
+
+        assert result["active"] == "openvpn"
+        assert result["current"]["interface"] == "tun0"
+        assert result["wireguard"]["active"] is False
+
+    def test_reports_none_when_inactive(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should report no current VPN when both are down."""
+        result = VPNManager.get_combined_status()
+
+        assert result["active"] is None
+        assert result["current"] is None
+
+    def test_skips_full_status_for_inactive_providers(
+        self, providers: dict[VPNType, MagicMock]
+    ) -> None:
+        """Should only fetch the full status of running providers."""
+        result = VPNManager.get_combined_status()
+
+        providers[VPNType.WIREGUARD].get_status.assert_not_called()
+        providers[VPNType.OPENVPN].get_status.assert_not_called()
+        assert result["wireguard"] == VPNConnectionStatus(
+            vpn_type=VPNType.WIREGUARD, interface="wg0"
+        ).to_dict()
+        assert result["openvpn"]["interface"] == "tun0"
+
+    def test_queries_providers_concurrently(
+        self, providers: dict[VPNType, MagicMock]
+    ) -> None:
+        """Should not wait for one provider before querying the other."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_peer(vpn_type: VPNType) -> VPNConnectionStatus:
+            # Times out unless both status calls run at the same time
+            barrier.wait()
+            return VPNConnectionStatus(vpn_type=vpn_type)
+
+        for vpn_type, mock in providers.items():
+            mock.is_active.return_value = True
+            mock.get_status.side_effect = lambda t=vpn_type: wait_for_peer(t)
+
+        result = VPNManager.get_combined_status()
+
+        assert result["active"] is None
+
+
+class TestVPNManagerActiveStatus:
+    """Tests for VPNManager.get_active_status()."""
+
+    def test_returns_first_active_status(
+        self, providers: dict[VPNType, MagicMock]
+    ) -> None:
+        """Should return WireGuard's status without querying OpenVPN."""
+        providers[VPNType.WIREGUARD].is_active.return_value = True
+        providers[VPNType.WIREGUARD].get_status.return_value = VPNConnectionStatus(
+            active=True, vpn_type=VPNType.WIREGUARD
+        )
+
+        status = VPNManager.get_active_status()
+
+        assert status.vpn_type == VPNType.WIREGUARD
+        providers[VPNType.OPENVPN].is_active.assert_not_called()
+
+    def test_inactive_returns_default(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should return an inactive status without running get_status."""
+        status = VPNManager.get_active_status()
+
+        assert status.active is False
+        providers[VPNType.WIREGUARD].get_status.assert_not_called()
+        providers[VPNType.OPENVPN].get_status.assert_not_called()
+
+
+class TestVPNManagerProfiles:
+    """Tests for VPNManager.list_all_profiles()."""
+
+    def test_combines_profiles_in_provider_order(
+        self, providers: dict[VPNType, MagicMock]
+    ) -> None:
+        """Should list WireGuard profiles before OpenVPN ones."""
+        providers[VPNType.WIREGUARD].list_profiles.return_value = [
+            VPNProfileInfo(name="home", vpn_type=VPNType.WIREGUARD)
+        ]
+        providers[VPNType.OPENVPN].list_profiles.return_value = [
+            VPNProfileInfo(name="work", vpn_type=VPNType.OPENVPN)
+        ]
+
+        profiles = VPNManager.list_all_profiles()
+
+        assert [p.name for p in profiles] == ["home", "work"]
+
+
+
+class TestVPNManagerStopAll:
+    """Tests for VPNManager.stop_all()."""
+
+    def test_stops_both_providers(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should stop every provider."""
+        assert VPNManager.stop_all() is True
+
+        providers[VPNType.WIREGUARD].stop.assert_called_once()
+        providers[VPNType.OPENVPN].stop.assert_called_once()
+
+    def test_reports_failure_but_stops_others(
+        self, providers: dict[VPNType, MagicMock]
+    ) -> None:
+        """Should still stop OpenVPN when stopping WireGuard raises."""
+        providers[VPNType.WIREGUARD].stop.side_effect = RuntimeError("wg-quick failed")
+
+        assert VPNManager.stop_all() is False
+
+        providers[VPNType.OPENVPN].stop.assert_called_once()
+
+
+class TestVPNManagerActiveCache:
+    """Tests for the short-lived active VPN cache."""
+
+    def test_reuses_recent_probe(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should not re-probe providers within the TTL."""
+        providers[VPNType.OPENVPN].is_active.return_value = True
+
+        assert VPNManager.get_active_type() == VPNType.OPENVPN
+        assert VPNManager.is_any_active() is True
+
+        assert providers[VPNType.OPENVPN].is_active.call_count == 1
+
+    def test_reprobes_after_ttl(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should probe again once the TTL has elapsed."""
+        with patch.object(VPNManager, "ACTIVE_CACHE_TTL", 0.0):
+            VPNManager.is_any_active()
+            VPNManager.is_any_active()
+
+        assert providers[VPNType.WIREGUARD].is_active.call_count == 2
+
+    def test_start_invalidates_cache(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should see a newly started VPN immediately."""
+        assert VPNManager.get_active_type() is None
+
+        providers[VPNType.WIREGUARD].is_active.return_value = True
+        VPNManager.start(VPNType.WIREGUARD)
+
+        assert VPNManager.get_active_type() == VPNType.WIREGUARD
+
+    def test_stop_all_invalidates_cache(self, providers: dict[VPNType, MagicMock]) -> None:
+        """Should see a stopped VPN immediately."""
+        providers[VPNType.WIREGUARD].is_active.return_value = True
+        assert VPNManager.is_any_active() is True
+
+        providers[VPNType.WIREGUARD].is_active.return_value = False
+        VPNManager.stop_all()
+
+        assert VPNManager.is_any_active() is False
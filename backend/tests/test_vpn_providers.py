@@ -0,0 +1,759 @@
+"""
+VPN Provider Tests
+==================
+
+Unit tests for the WireGuard and OpenVPN provider implementations.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import errno
+import os
+import socket
+from pathlib import Path
+from typing import Iterator, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from exceptions import InvalidWireGuardConfigError, ValidationError
+from services.vpn import (
+    OpenVPNProvider,
+    VPNProvider,
+    VPNProfileInfo,
+    VPNTransferStats,
+    VPNType,
+    WireGuardProvider,
+)
+from tests.conftest import MockCommandExecutor
+
+
+@pytest.fixture(autouse=True)
+def no_netlink():
+    """Use the command fallbacks unless a test provides pyroute2 or journal."""
+    with patch("services.vpn.wireguard.WireGuardNetlink", None), \
+            patch("services.vpn.openvpn.IPRoute", None), \
+            patch("services.vpn.openvpn.journal", None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Validate configs from scratch in every test."""
+    VPNProvider.clear_validation_cache()
+    yield
+    VPNProvider.clear_validation_cache()
+
+
+@pytest.fixture
+def wg_paths(temp_dir: Path):
+    """Point the WireGuard provider at a temporary profiles directory."""
+    profiles_dir = temp_dir / "profiles"
+    profiles_dir.mkdir()
+    with patch("services.vpn.wireguard.Paths") as mock_paths:
+        mock_paths.WG_PROFILES_DIR = profiles_dir
+        mock_paths.WG_ACTIVE_CONF = temp_dir / "wg0.conf"
+        yield mock_paths
+
+
+class FakeNetlinkMessage(dict):
+    """Minimal stand-in for a pyroute2 netlink message."""
+
+    def __init__(self, **attrs: object) -> None:
+        super().__init__()
+        self.attrs = attrs
+
+    def get_attr(self, name: str) -> object:
+        return self.attrs.get(name)
+
+
+class TestVPNDataclasses:
+    """Tests for the shared VPN dataclasses."""
+
+    def test_profile_info_is_immutable(self) -> None:
+        """Profiles read from disk should not be modified in place."""
+        profile = VPNProfileInfo(name="home", vpn_type=VPNType.WIREGUARD)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            profile.active = True  # type: ignore[misc]
+
+    def test_transfer_stats_is_immutable(self) -> None:
+        """Transfer stats should be built once and not modified."""
+        stats = VPNTransferStats(received_bytes=1)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stats.received_bytes = 2  # type: ignore[misc]
+
+
+class TestWireGuardProviderTransferStats:
+    """Tests for WireGuardProvider._parse_transfer_stats()."""
+
+    def test_parses_transfer_line(self) -> None:
+        """Should parse received and sent sizes."""
+        stats = WireGuardProvider()._parse_transfer_stats(
+            "transfer: 1.50 MiB received, 512 KiB sent"
+        )
+
+        assert stats.received == "1.50 MiB"
+        assert stats.received_bytes == int(1.5 * 1024 ** 2)
+        assert stats.sent == "512 KiB"
+        assert stats.sent_bytes == 512 * 1024
+
+    @pytest.mark.parametrize("line", [
+        "transfer",
+        "transfer: lots received, some sent",
+        "transfer: 1.50 MiB received",
+    ])
+    def test_malformed_line_returns_defaults(self, line: str) -> None:
+        """Should return zeroed stats for unparseable lines."""
+        stats = WireGuardProvider()._parse_transfer_stats(line)
+
+        assert stats == VPNTransferStats()
+
+    @pytest.mark.parametrize("value,unit,expected", [
+        ("12", "B", 12),
+        ("1.5", "KiB", 1536),
+        ("2", "GiB", 2 * 1024 ** 3),
+        ("3", "MB", 3_000_000),
+        ("7", "parsecs", 7),
+        ("n/a", "MiB", 0),
+    ])
+    def test_parse_size_to_bytes(self, value: str, unit: str, expected: int) -> None:
+        """Should apply binary and decimal multipliers, ignoring unknown units."""
+        assert WireGuardProvider()._parse_size_to_bytes(value, unit) == expected
+
+
+class TestWireGuardProviderIsActive:
+    """Tests for WireGuardProvider.is_active()."""
+
+    def test_active_when_interface_exists(
+        self, mock_executor: MockCommandExecutor, temp_dir: Path
+    ) -> None:
+        """Should report active from sysfs without running wg."""
+        (temp_dir / "wg0").mkdir()
+
+        with patch("services.vpn.wireguard.Paths") as mock_paths:
+            mock_paths.SYS_NET = temp_dir
+
+            assert WireGuardProvider().is_active() is True
+
+        assert mock_executor.calls == []
+
+    def test_inactive_when_interface_missing(self, temp_dir: Path) -> None:
+        """Should report inactive when wg0 does not exist."""
+        with patch("services.vpn.wireguard.Paths") as mock_paths:
+            mock_paths.SYS_NET = temp_dir
+
+            assert WireGuardProvider().is_active() is False
+
+
+class TestWireGuardProviderListProfiles:
+    """Tests for WireGuardProvider.list_profiles()."""
+
+    def test_marks_active_profile(self, wg_paths) -> None:
+        """Should flag the profile the active symlink points at."""
+        for name in ("home", "office"):
+            (wg_paths.WG_PROFILES_DIR / f"{name}.conf").write_text("[Interface]\n")
+        wg_paths.WG_ACTIVE_CONF.symlink_to(wg_paths.WG_PROFILES_DIR / "office.conf")
+
+        resolved = []
+        real_resolve = Path.resolve
+
+        def resolve(path: Path, *args, **kwargs) -> Path:
+            resolved.append(path)
+            return real_resolve(path, *args, **kwargs)
+
+        with patch.object(Path, "resolve", resolve):
+            profiles = {p.name: p.active for p in WireGuardProvider().list_profiles()}
+
+        assert profiles == {"home": False, "office": True}
+        # Only the symlink and the profiles directory are resolved
+        assert resolved == [wg_paths.WG_ACTIVE_CONF, wg_paths.WG_PROFILES_DIR]
+
+    def test_no_active_profile(self, wg_paths) -> None:
+        """Should report every profile inactive without an active symlink."""
+        (wg_paths.WG_PROFILES_DIR / "home.conf").write_text("[Interface]\n")
+
+        assert [p.active for p in WireGuardProvider().list_profiles()] == [False]
+
+    def test_skips_other_entries(self, wg_paths) -> None:
+        """Should list only .conf files."""
+        (wg_paths.WG_PROFILES_DIR / "home.conf").write_text("[Interface]\n")
+        (wg_paths.WG_PROFILES_DIR / "notes.txt").write_text("")
+        (wg_paths.WG_PROFILES_DIR / "backup.conf").mkdir()
+
+        profiles = WireGuardProvider().list_profiles()
+
+        assert [(p.name, p.filename) for p in profiles] == [("home", "home.conf")]
+
+    def test_missing_directory(self, wg_paths, temp_dir: Path) -> None:
+        """Should return an empty list when the directory does not exist."""
+        wg_paths.WG_PROFILES_DIR = temp_dir / "missing"
+
+        assert WireGuardProvider().list_profiles() == []
+
+    def test_profile_symlinked_outside_directory(self, wg_paths, temp_dir: Path) -> None:
+        """Should fall back to resolving when the target is elsewhere."""
+        target = temp_dir / "elsewhere.conf"
+        target.write_text("[Interface]\n")
+        (wg_paths.WG_PROFILES_DIR / "linked.conf").symlink_to(target)
+        wg_paths.WG_ACTIVE_CONF.symlink_to(target)
+
+        profiles = WireGuardProvider().list_profiles()
+
+        assert [(p.name, p.active) for p in profiles] == [("linked", True)]
+
+class TestWireGuardProviderActivateProfile:
+    """Tests for WireGuardProvider.activate_profile()."""
+
+    @pytest.fixture
+    def profiles(self, wg_paths):
+        """Two profiles with 'home' active."""
+        for name in ("home", "office"):
+            (wg_paths.WG_PROFILES_DIR / f"{name}.conf").write_text("[Interface]\n")
+        wg_paths.WG_ACTIVE_CONF.symlink_to(wg_paths.WG_PROFILES_DIR / "home.conf")
+        return wg_paths
+
+    def test_already_active_is_noop(self, profiles, mock_executor: MockCommandExecutor) -> None:
+        """Should not restart the tunnel for the running profile."""
+        provider = WireGuardProvider()
+
+        with patch.object(provider, "is_active", return_value=True):
+            assert provider.activate_profile("home") is True
+
+        assert mock_executor.calls == []
+
+    def test_force_restarts_active_profile(
+        self, profiles, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should restart the running profile when forced."""
+        provider = WireGuardProvider()
+
+        with patch.object(provider, "is_active", return_value=True):
+            provider.activate_profile("home", force=True)
+
+        assert len(mock_executor.calls) == 2
+
+    def test_active_but_stopped_is_started(
+        self, profiles, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should start the active profile when the tunnel is down."""
+        provider = WireGuardProvider()
+
+        with patch.object(provider, "is_active", return_value=False):
+            provider.activate_profile("home")
+
+        assert len(mock_executor.calls) == 2
+
+    def test_switches_profile(self, profiles, mock_executor: MockCommandExecutor) -> None:
+        """Should repoint the symlink and restart for another profile."""
+        provider = WireGuardProvider()
+
+        with patch.object(provider, "is_active", return_value=True):
+            provider.activate_profile("office")
+
+        assert profiles.WG_ACTIVE_CONF.resolve().name == "office.conf"
+        assert len(mock_executor.calls) == 2
+
+class TestWireGuardProviderStatus:
+    """Tests for WireGuardProvider status parsing."""
+
+    WG_SHOW = (
+        "interface: wg0\n"
+        "  public key: abc=\n"
+        "peer: def=\n"
+        "  endpoint: 203.0.113.5:51820\n"
+        "  latest handshake: 12 seconds ago\n"
+        "  transfer: 1.50 MiB received, 512 KiB sent\n"
+    )
+
+    def test_get_status_parses_wg_show(self, mock_executor: MockCommandExecutor) -> None:
+        """Should parse endpoint, handshake and transfer."""
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=self.WG_SHOW)
+
+        status = WireGuardProvider().get_status()
+
+        assert status.active is True
+        assert status.endpoint == "203.0.113.5:51820"
+        assert status.latest_handshake == "12 seconds ago"
+        assert status.transfer.sent_bytes == 512 * 1024
+
+    def test_get_status_without_peers(self, mock_executor: MockCommandExecutor) -> None:
+        """Should report an up interface with no peer details."""
+        mock_executor.set_response(
+            "sudo wg show wg0", return_code=0,
+            stdout="interface: wg0\n  public key: abc=\n  listening port: 51820\n",
+        )
+
+        status = WireGuardProvider().get_status()
+
+        assert status.active is True
+        assert status.endpoint is None
+        assert status.latest_handshake is None
+        assert status.transfer == VPNTransferStats()
+
+    def test_get_status_inactive(self, mock_executor: MockCommandExecutor) -> None:
+        """Should report inactive when wg show fails."""
+        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+
+        status = WireGuardProvider().get_status()
+
+        assert status.active is False
+        assert status.interface == "wg0"
+
+
+class TestWireGuardProviderNetlink:
+    """Tests for the pyroute2 WireGuard status path."""
+
+    @pytest.fixture(autouse=True)
+    def _as_root(self) -> Iterator[None]:
+        """Run as if the backend had CAP_NET_ADMIN."""
+        with patch("services.vpn.wireguard._NETLINK_PERMITTED", True):
+            yield
+
+    @staticmethod
+    def _netlink(messages=None, error: Optional[Exception] = None) -> MagicMock:
+        client = MagicMock()
+        client.__enter__.return_value = client
+        if error is not None:
+            client.info.side_effect = error
+        else:
+            client.info.return_value = messages
+        return MagicMock(return_value=client)
+
+    def test_reads_peer_over_netlink(self, mock_executor: MockCommandExecutor) -> None:
+        """Should build the status from netlink attributes without running wg."""
+        peer = FakeNetlinkMessage(
+            WGPEER_A_ENDPOINT={"addr": "203.0.113.5", "port": 51820},
+            WGPEER_A_LAST_HANDSHAKE_TIME={"tv_sec": 1_000_000 - 75, "tv_nsec": 0},
+            WGPEER_A_RX_BYTES=int(1.5 * 1024 ** 2),
+            WGPEER_A_TX_BYTES=512 * 1024,
+        )
+        netlink = self._netlink([FakeNetlinkMessage(WGDEVICE_A_PEERS=[peer])])
+
+        with patch("services.vpn.wireguard.WireGuardNetlink", netlink), \
+                patch("services.vpn.wireguard.time.time", return_value=1_000_000):
+            status = WireGuardProvider().get_status()
+
+        assert status.active is True
+        assert status.endpoint == "203.0.113.5:51820"
+        assert status.latest_handshake == "1 minute, 15 seconds ago"
+        assert status.transfer.received == "1.50 MiB"
+        assert status.transfer.sent == "512.00 KiB"
+        assert status.transfer.sent_bytes == 512 * 1024
+        assert mock_executor.calls == []
+
+    def test_missing_interface_is_inactive(self, mock_executor: MockCommandExecutor) -> None:
+        """Should report inactive when the kernel has no such device."""
+        error = OSError(errno.ENODEV, "No such device")
+        error.code = errno.ENODEV  # type: ignore[attr-defined]
+
+        with patch("services.vpn.wireguard.WireGuardNetlink", self._netlink(error=error)):
+            status = WireGuardProvider().get_status()
+
+        assert status.active is False
+        assert mock_executor.calls == []
+
+    def test_falls_back_to_wg_show(self, mock_executor: MockCommandExecutor) -> None:
+        """Should run wg show when netlink is not permitted."""
+        mock_executor.set_response(
+            "sudo wg show wg0", return_code=0, stdout=TestWireGuardProviderStatus.WG_SHOW
+        )
+        error = PermissionError(errno.EPERM, "Operation not permitted")
+
+        with patch("services.vpn.wireguard.WireGuardNetlink", self._netlink(error=error)):
+            status = WireGuardProvider().get_status()
+
+        assert status.endpoint == "203.0.113.5:51820"
+
+    def test_unprivileged_skips_netlink(self, mock_executor: MockCommandExecutor) -> None:
+        """Should go straight to wg show without opening a netlink socket."""
+        mock_executor.set_response(
+            "sudo wg show wg0", return_code=0, stdout=TestWireGuardProviderStatus.WG_SHOW
+        )
+        netlink = self._netlink([])
+
+        with patch("services.vpn.wireguard._NETLINK_PERMITTED", False), \
+                patch("services.vpn.wireguard.WireGuardNetlink", netlink):
+            status = WireGuardProvider().get_status()
+
+        netlink.assert_not_called()
+        assert status.endpoint == "203.0.113.5:51820"
+
+    @pytest.mark.parametrize("seconds,expected", [
+        (0, "Now"),
+        (1, "1 second ago"),
+        (3600 + 2, "1 hour, 2 seconds ago"),
+        (2 * 86400 + 180, "2 days, 3 minutes ago"),
+    ])
+    def test_format_age(self, seconds: int, expected: str) -> None:
+        """Should match the wording of wg show."""
+        assert WireGuardProvider._format_age(seconds) == expected
+
+    @pytest.mark.parametrize("size,expected", [
+        (0, "0 B"),
+        (1023, "1023 B"),
+        (1024, "1.00 KiB"),
+        (3 * 1024 ** 3, "3.00 GiB"),
+    ])
+    def test_format_size(self, size: int, expected: str) -> None:
+        """Should match the units of wg show."""
+        assert WireGuardProvider._format_size(size) == expected
+
+class TestProviderStatusCache:
+    """Tests for the short-lived provider status cache."""
+
+    @staticmethod
+    def _wg_show_calls(mock_executor: MockCommandExecutor) -> int:
+        return sum(1 for cmd, _ in mock_executor.calls if cmd[:3] == ["sudo", "wg", "show"])
+
+    def test_repeat_calls_share_one_query(self, mock_executor: MockCommandExecutor) -> None:
+        """Should run wg show once for calls within the TTL."""
+        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+        provider = WireGuardProvider()
+
+        first = provider.get_status()
+        assert provider.get_status() is first
+        assert self._wg_show_calls(mock_executor) == 1
+
+    def test_expired_entry_is_refreshed(self, mock_executor: MockCommandExecutor) -> None:
+        """Should query again once the TTL has elapsed."""
+        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+        provider = WireGuardProvider()
+        provider.STATUS_CACHE_TTL = 0
+
+        provider.get_status()
+        provider.get_status()
+
+        assert self._wg_show_calls(mock_executor) == 2
+
+    @pytest.mark.parametrize("action", ["start", "stop", "restart"])
+    def test_state_changes_invalidate(
+        self, mock_executor: MockCommandExecutor, action: str
+    ) -> None:
+        """Should drop the cached status when the connection changes."""
+        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+        provider = WireGuardProvider()
+
+        provider.get_status()
+        getattr(provider, action)()
+        provider.get_status()
+
+        assert self._wg_show_calls(mock_executor) == 2
+
+    def test_openvpn_is_active_uses_cache(self, mock_executor: MockCommandExecutor) -> None:
+        """Should answer is_active from a fresh status without systemctl."""
+        mock_executor.set_response("sh -c", return_code=3, stdout="")
+        provider = OpenVPNProvider()
+
+        assert provider.get_status().active is False
+        calls = len(mock_executor.calls)
+
+        assert provider.is_active() is False
+        assert len(mock_executor.calls) == calls
+
+
+class TestOpenVPNProviderStatus:
+    """Tests for OpenVPN status parsing."""
+
+    STATUS_FILE = (
+        "OpenVPN STATISTICS\n"
+        "Updated,2025-11-26 12:00:00\n"
+        "Connected Since,2025-11-26 11:00:00\n"
+        "TUN/TAP read bytes,1048576\n"
+        "TUN/TAP write bytes,2048\n"
+        "END\n"
+    )
+
+    def test_parse_status_file(self, temp_dir: Path) -> None:
+        """Should parse connection time and transfer counters."""
+        status_file = temp_dir / "active.status"
+        status_file.write_text(self.STATUS_FILE)
+
+        with patch("services.vpn.openvpn.OPENVPN_STATUS_FILE", status_file):
+            result = OpenVPNProvider()._parse_status_file()
+
+        assert result is not None
+        assert result["connected_since"] == "2025-11-26 11:00:00"
+        assert result["transfer"].received_bytes == 1048576
+        assert result["transfer"].received == "1.00 MiB"
+        assert result["transfer"].sent_bytes == 2048
+
+    def test_parse_status_file_colon_format(self, temp_dir: Path) -> None:
+        """Should also accept "key: value" lines."""
+        status_file = temp_dir / "active.status"
+        status_file.write_text(
+            "Connected Since: Tue, 26 Nov 2025 11:00:00\n"
+            "TUN/TAP read bytes: 100\n"
+        )
+
+        with patch("services.vpn.openvpn.OPENVPN_STATUS_FILE", status_file):
+            result = OpenVPNProvider()._parse_status_file()
+
+        assert result is not None
+        assert result["connected_since"] == "Tue, 26 Nov 2025 11:00:00"
+        assert result["transfer"].received_bytes == 100
+        assert result["transfer"].sent_bytes == 0
+
+    def test_parse_status_file_reuses_unchanged_file(self, temp_dir: Path) -> None:
+        """Should not re-read the file while its mtime and size are unchanged."""
+        status_file = temp_dir / "active.status"
+        status_file.write_text(self.STATUS_FILE)
+        provider = OpenVPNProvider()
+
+        with patch("services.vpn.openvpn.OPENVPN_STATUS_FILE", status_file):
+            first = provider._parse_status_file()
+            with patch("builtins.open", side_effect=AssertionError("re-read")):
+                assert provider._parse_status_file() is first
+
+            status_file.write_text(self.STATUS_FILE.replace("2048", "4096"))
+            os.utime(status_file, ns=(0, 0))
+            result = provider._parse_status_file()
+
+        assert result is not None
+        assert result["transfer"].sent_bytes == 4096
+
+    @pytest.mark.parametrize("size,expected", [
+        (0, "0.00 B"),
+        (1023, "1023.00 B"),
+        (1024, "1.00 KiB"),
+        (1536, "1.50 KiB"),
+        (5 * 1024 ** 4, "5.00 TiB"),
+        (2048 * 1024 ** 5, "2048.00 PiB"),
+    ])
+    def test_format_bytes(self, size: int, expected: str) -> None:
+        """Should pick the largest binary unit below the size."""
+        assert OpenVPNProvider()._format_bytes(size) == expected
+
+    def test_parse_status_file_missing(self, temp_dir: Path) -> None:
+        """Should return None when there is no status file."""
+        with patch("services.vpn.openvpn.OPENVPN_STATUS_FILE", temp_dir / "missing"):
+            assert OpenVPNProvider()._parse_status_file() is None
+
+
+    @pytest.mark.parametrize("log_line", [
+        "TCP/UDP: Connecting to [AF_INET]198.51.100.7:1194",
+        "Peer Connection Initiated with [AF_INET]198.51.100.7:1194",
+    ])
+    def test_get_endpoint_from_journalctl(
+        self, mock_executor: MockCommandExecutor, log_line: str
+    ) -> None:
+        """Should fall back to journalctl without the journal bindings."""
+        mock_executor.set_response(
+            "journalctl -u openvpn-client@active", return_code=0,
+            stdout=f"Nov 26 openvpn[1]: {log_line}\n",
+        )
+
+        with patch("services.vpn.openvpn.journal", None):
+            assert OpenVPNProvider()._get_endpoint_from_logs() == "198.51.100.7:1194"
+
+    def test_get_endpoint_from_journal(self, mock_executor: MockCommandExecutor) -> None:
+        """Should read the unit's newest entries through the journal bindings."""
+        entries = iter([
+            {"MESSAGE": "Initialization Sequence Completed"},
+            {"MESSAGE": "TCP/UDP: Connecting to [AF_INET]198.51.100.7:1194"},
+            {},
+        ])
+        reader = MagicMock()
+        reader.__enter__.return_value = reader
+        reader.get_previous.side_effect = lambda: next(entries)
+        fake_journal = MagicMock()
+        fake_journal.Reader.return_value = reader
+
+        with patch("services.vpn.openvpn.journal", fake_journal):
+            endpoint = OpenVPNProvider()._get_endpoint_from_logs()
+
+        assert endpoint == "198.51.100.7:1194"
+        reader.add_match.assert_called_once_with(
+            _SYSTEMD_UNIT="openvpn-client@active.service"
+        )
+        assert mock_executor.calls == []
+
+class TestOpenVPNProviderInterface:
+    """Tests for OpenVPNProvider._query_interface()."""
+
+    @staticmethod
+    def _iproute(indexes: list[int], addrs: list[FakeNetlinkMessage]) -> MagicMock:
+        ipr = MagicMock()
+        ipr.__enter__.return_value = ipr
+        ipr.link_lookup.return_value = indexes
+        ipr.get_addr.return_value = addrs
+        return MagicMock(return_value=ipr)
+
+    def test_netlink_address(self, mock_executor: MockCommandExecutor) -> None:
+        """Should read the IPv4 address over netlink without running ip."""
+        iproute = self._iproute([7], [FakeNetlinkMessage(IFA_LOCAL="10.8.0.6")])
+
+        with patch("services.vpn.openvpn.IPRoute", iproute):
+            assert OpenVPNProvider()._query_interface() == (True, "10.8.0.6")
+
+        iproute.return_value.get_addr.assert_called_once_with(index=7, family=socket.AF_INET)
+        assert mock_executor.calls == []
+
+    def test_netlink_missing_interface(self) -> None:
+        """Should report a missing tun0 as not existing."""
+        with patch("services.vpn.openvpn.IPRoute", self._iproute([], [])):
+            assert OpenVPNProvider()._query_interface() == (False, None)
+
+    def test_ip_command_fallback(self, mock_executor: MockCommandExecutor) -> None:
+        """Should parse 'ip addr show' output without pyroute2."""
+        mock_executor.set_response(
+            "ip addr show tun0", return_code=0,
+            stdout="5: tun0: <POINTOPOINT,UP> mtu 1500\n    inet 10.8.0.6/24 scope global tun0\n",
+        )
+
+        assert OpenVPNProvider()._query_interface() == (True, "10.8.0.6")
+
+    def test_ip_command_missing_interface(self, mock_executor: MockCommandExecutor) -> None:
+        """Should report not existing when ip fails."""
+        mock_executor.set_response("ip addr show tun0", return_code=1)
+
+        assert OpenVPNProvider()._query_interface() == (False, None)
+
+class TestOpenVPNProviderBatchedStatus:
+    """Tests for the single-shell status fallback."""
+
+    IP_ADDR = "5: tun0: <POINTOPOINT,UP> mtu 1500\n    inet 10.8.0.6/24 scope global tun0\n"
+    LOGS = "Nov 26 openvpn[1]: TCP/UDP: Connecting to [AF_INET]198.51.100.7:1194\n"
+
+    def test_active_status_from_one_process(
+        self, mock_executor: MockCommandExecutor, temp_dir: Path
+    ) -> None:
+        """Should fill address and endpoint from a single shell invocation."""
+        mock_executor.set_response(
+            "sh -c", return_code=0,
+            stdout=f"{self.IP_ADDR}__ROSE_STATUS_SEP__\n{self.LOGS}",
+        )
+
+        with patch("services.vpn.openvpn.OPENVPN_STATUS_FILE", temp_dir / "missing"):
+            status = OpenVPNProvider().get_status()
+
+        assert status.active is True
+        assert status.local_ip == "10.8.0.6"
+        assert status.endpoint == "198.51.100.7:1194"
+        assert len(mock_executor.calls) == 1
+        cmd = mock_executor.calls[0][0]
+        assert cmd[:2] == ["sh", "-c"]
+        assert cmd[4:] == ["openvpn-client@active", "tun0", "50"]
+
+    @pytest.mark.parametrize("return_code", [3, 4])
+    def test_inactive_when_probe_stops_early(
+        self, mock_executor: MockCommandExecutor, return_code: int
+    ) -> None:
+        """Should report inactive when the service or interface is missing."""
+        mock_executor.set_response("sh -c", return_code=return_code, stdout="")
+
+        assert OpenVPNProvider().get_status().active is False
+
+    def test_separate_queries_with_structured_apis(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Should not batch when pyroute2 or the journal bindings exist."""
+        mock_executor.set_response("systemctl is-active", return_code=3, stdout="inactive")
+
+        with patch("services.vpn.openvpn.journal", MagicMock()):
+            assert OpenVPNProvider().get_status().active is False
+
+        assert [cmd[0] for cmd, _ in mock_executor.calls] == ["systemctl"]
+
+class TestOpenVPNProviderValidateConfig:
+    """Tests for OpenVPN config validation."""
+
+    def test_accepts_client_config(self) -> None:
+        """Should accept a config with remote and client directives."""
+        config = b"# comment\nclient\ndev tun\nremote vpn.example.com 1194\n"
+
+        assert OpenVPNProvider().validate_config(config) is True
+
+    def test_accepts_non_ascii_utf8(self) -> None:
+        """Should accept UTF-8 text beyond ASCII."""
+        config = "# Zürich exit node\nclient\nremote vpn.example.com\n".encode()
+
+        assert OpenVPNProvider().validate_config(config) is True
+
+    def test_accepts_connection_block(self) -> None:
+        """Should accept a <connection> block in place of remote."""
+        config = b"client\n<Connection>\nremote vpn.example.com\n</Connection>\n"
+
+        assert OpenVPNProvider().validate_config(config) is True
+
+    @pytest.mark.parametrize("config", [
+        b"client\nremote-cert-tls server\n",
+        b"client\n# remote vpn.example.com 1194\n",
+        b"client\n;remote vpn.example.com 1194\n",
+    ])
+    def test_rejects_missing_remote(self, config: bytes) -> None:
+        """Should not count similar directives or comments as remote."""
+        with pytest.raises(ValidationError):
+            OpenVPNProvider().validate_config(config)
+
+    @pytest.mark.parametrize("config", [b"", b"  \n\n"])
+    def test_rejects_empty(self, config: bytes) -> None:
+        """Should reject an empty config."""
+        with pytest.raises(ValidationError, match="empty"):
+            OpenVPNProvider().validate_config(config)
+
+    def test_rejects_non_utf8(self) -> None:
+        """Should reject binary content."""
+        with pytest.raises(ValidationError):
+            OpenVPNProvider().validate_config(b"\xff\xfe remote")
+
+    def test_warns_on_dangerous_directives(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Should log each script hook but still accept the config."""
+        config = (
+            b"client\nremote vpn.example.com\n"
+            b"Script-Security 2\nup /etc/openvpn/up.sh\nclient-connect /bin/x\n"
+            b"# down /etc/openvpn/down.sh\n"
+        )
+
+        assert OpenVPNProvider().validate_config(config) is True
+        warned = [r.getMessage() for r in caplog.records if "dangerous" in r.getMessage()]
+        assert len(warned) == 3
+        assert any("client-connect" in msg for msg in warned)
+
+    def test_revalidation_is_skipped(self) -> None:
+        """Should not re-scan a config that recently passed."""
+        config = b"client\nremote vpn.example.com\nup /etc/openvpn/up.sh\n"
+        provider = OpenVPNProvider()
+
+        provider.validate_config(config)
+
+        with patch("services.vpn.openvpn._RE_DIRECTIVE") as pattern:
+            assert provider.validate_config(config) is True
+        pattern.finditer.assert_not_called()
+
+    def test_failures_are_not_cached(self) -> None:
+        """Should reject an invalid config every time."""
+        provider = OpenVPNProvider()
+
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                provider.validate_config(b"client\n")
+
+    def test_cache_is_per_provider_type(self) -> None:
+        """Should not accept a config validated by the other provider."""
+        config = b"client\nremote vpn.example.com\n"
+        OpenVPNProvider().validate_config(config)
+
+        with pytest.raises(InvalidWireGuardConfigError):
+            WireGuardProvider().validate_config(config)
+
+    def test_cache_evicts_oldest(self) -> None:
+        """Should keep at most VALIDATION_CACHE_SIZE entries."""
+        provider = OpenVPNProvider()
+
+        with patch.object(VPNProvider, "VALIDATION_CACHE_SIZE", 2):
+            for host in ("a", "b", "c"):
+                provider.validate_config(f"remote {host}.example.com\n".encode())
+
+        keys = list(VPNProvider._validated_configs)
+        assert keys == [
+            provider._validation_key(b"remote b.example.com\n"),
+            provider._validation_key(b"remote c.example.com\n"),
+        ]
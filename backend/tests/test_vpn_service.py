@@ -76,6 +76,92 @@ transfer: 1.23 MiB received, 456 KiB sent
         assert "1.23 MiB" in status.transfer.received
         assert "456 KiB" in status.transfer.sent
 
+    def test_get_status_handles_crlf_and_missing_fields(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """get_status should strip CRLF endings and leave absent fields empty."""
+        wg_output = "interface: wg0\r\n  endpoint: 10.0.0.1:51820\r\n"
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=wg_output)
+
+        from services.vpn_service import VPNService
+
+        status = VPNService.get_status()
+
+        assert status.endpoint == "10.0.0.1:51820"
+        assert status.latest_handshake is None
+
+    def test_parse_transfer_stats_unrecognized(self) -> None:
+        """_parse_transfer_stats should return empty stats for odd input."""
+        from services.vpn_service import VPNService
+        from models import TransferStats
+
+        stats = VPNService._parse_transfer_stats("transfer: garbage")
+
+        assert stats == TransferStats()
+
+
+class TestVPNServiceStatusCache:
+    """Tests for the VPN status cache."""
+
+    WG_OUTPUT = "interface: wg0\n  endpoint: 192.168.1.1:51820\n"
+
+    def _wg_show_calls(self, mock_executor: MockCommandExecutor) -> int:
+        return sum(1 for cmd, _ in mock_executor.calls if "wg" in cmd and "show" in cmd)
+
+    def test_get_status_reuses_recent_result(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """Repeated get_status calls should run wg show once."""
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=self.WG_OUTPUT)
+
+        from services.vpn_service import VPNService
+
+        first = VPNService.get_status()
+        second = VPNService.get_status()
+
+        assert second is first
+        assert self._wg_show_calls(mock_executor) == 1
+
+    def test_get_status_force_bypasses_cache(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """get_status(force=True) should always query WireGuard."""
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=self.WG_OUTPUT)
+
+        from services.vpn_service import VPNService
+
+        VPNService.get_status()
+        VPNService.get_status(force=True)
+
+        assert self._wg_show_calls(mock_executor) == 2
+
+    def test_get_status_refreshes_after_ttl(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """get_status should query again once the TTL has expired."""
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=self.WG_OUTPUT)
+
+        from services.vpn_service import VPNService
+
+        with patch.object(VPNService, "STATUS_CACHE_TTL", 0.0):
+            VPNService.get_status()
+            VPNService.get_status()
+
+        assert self._wg_show_calls(mock_executor) == 2
+
+    def test_stop_invalidates_cache(self, mock_executor: MockCommandExecutor) -> None:
+        """stop should drop the cached status."""
+        mock_executor.set_response("sudo wg show wg0", return_code=0, stdout=self.WG_OUTPUT)
+
+        from services.vpn_service import VPNService
+
+        assert VPNService.get_status().active is True
+
+        mock_executor.set_response("sudo wg show wg0", return_code=1, stdout="")
+        VPNService.stop()
+
+        assert VPNService.get_status().active is False
+
 
 class TestVPNServiceProfiles:
     """Tests for VPN profile management."""
@@ -139,6 +225,60 @@ class TestVPNServiceProfiles:
             assert len(profiles) == 1
             assert profiles[0].active is True
 
+    def test_list_profiles_missing_directory(self, temp_dir: Path) -> None:
+        """list_profiles should return empty list when the directory is missing."""
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = temp_dir / "missing"
+            mock_paths.WG_ACTIVE_CONF = temp_dir / "wg0.conf"
+
+            from services.vpn_service import VPNService
+
+            assert VPNService.list_profiles() == []
+
+    def test_list_profiles_skips_other_entries(self, temp_dir: Path) -> None:
+        """list_profiles should ignore non-.conf files and directories."""
+        profiles_dir = temp_dir / "profiles"
+        profiles_dir.mkdir()
+        (profiles_dir / "server1.conf").write_text("[Interface]\nPrivateKey=abc")
+        (profiles_dir / "notes.txt").write_text("ignore me")
+        (profiles_dir / "nested.conf").mkdir()
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = profiles_dir
+            mock_paths.WG_ACTIVE_CONF = temp_dir / "wg0.conf"
+
+            from services.vpn_service import VPNService
+
+            profiles = VPNService.list_profiles()
+
+            assert [p.name for p in profiles] == ["server1"]
+
+    def test_list_profiles_active_via_linked_directory(self, temp_dir: Path) -> None:
+        """list_profiles should mark the active profile through chained symlinks."""
+        real_dir = temp_dir / "real"
+        real_dir.mkdir()
+        profile_path = real_dir / "home.conf"
+        profile_path.write_text("[Interface]\nPrivateKey=abc")
+
+        # Profiles directory is itself a symlink to the real location
+        profiles_dir = temp_dir / "profiles"
+        profiles_dir.symlink_to(real_dir)
+
+        wg0_conf = temp_dir / "wg0.conf"
+        wg0_conf.symlink_to(temp_dir / "elsewhere.conf")
+        (temp_dir / "elsewhere.conf").symlink_to(profile_path)
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = profiles_dir
+            mock_paths.WG_ACTIVE_CONF = wg0_conf
+
+            from services.vpn_service import VPNService
+
+            profiles = VPNService.list_profiles()
+
+            assert len(profiles) == 1
+            assert profiles[0].active is True
+
     def test_upload_profile_validates_size(self, temp_dir: Path) -> None:
         """upload_profile should reject files exceeding size limit."""
         profiles_dir = temp_dir / "profiles"
@@ -195,6 +335,26 @@ PublicKey = def456
             assert filename.endswith(".conf")
             assert (profiles_dir / filename).exists()
 
+    def test_upload_profile_overwrites_with_private_mode(self, temp_dir: Path) -> None:
+        """upload_profile should leave the profile mode 0600, even over an old file."""
+        profiles_dir = temp_dir / "profiles"
+        profiles_dir.mkdir()
+        existing = profiles_dir / "test.conf"
+        existing.write_text("old contents that are longer than the new ones " * 10)
+        existing.chmod(0o644)
+
+        valid_content = b"[Interface]\nPrivateKey = abc123"
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = profiles_dir
+
+            from services.vpn_service import VPNService
+
+            VPNService.upload_profile("test.conf", valid_content)
+
+            assert existing.read_bytes() == valid_content
+            assert existing.stat().st_mode & 0o777 == 0o600
+
     def test_upload_profile_sanitizes_filename(self, temp_dir: Path) -> None:
         """upload_profile should sanitize the filename."""
         profiles_dir = temp_dir / "profiles"
@@ -214,6 +374,53 @@ PublicKey = def456
             assert "/" not in filename
 
 
+class TestVPNServiceDelete:
+    """Tests for VPN profile deletion."""
+
+    def test_delete_profile_removes_file(self, temp_dir: Path) -> None:
+        """delete_profile should remove an inactive profile."""
+        profiles_dir = temp_dir / "profiles"
+        profiles_dir.mkdir()
+        active = profiles_dir / "active.conf"
+        active.write_text("[Interface]\nPrivateKey=abc")
+        other = profiles_dir / "other.conf"
+        other.write_text("[Interface]\nPrivateKey=def")
+
+        wg0_conf = temp_dir / "wg0.conf"
+        wg0_conf.symlink_to(active)
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = profiles_dir
+            mock_paths.WG_ACTIVE_CONF = wg0_conf
+
+            from services.vpn_service import VPNService
+
+            assert VPNService.delete_profile("other") is True
+            assert not other.exists()
+
+    def test_delete_profile_refuses_active(self, temp_dir: Path) -> None:
+        """delete_profile should not remove the profile wg0.conf points to."""
+        profiles_dir = temp_dir / "profiles"
+        profiles_dir.mkdir()
+        active = profiles_dir / "active.conf"
+        active.write_text("[Interface]\nPrivateKey=abc")
+
+        wg0_conf = temp_dir / "wg0.conf"
+        wg0_conf.symlink_to(active)
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.WG_PROFILES_DIR = profiles_dir
+            mock_paths.WG_ACTIVE_CONF = wg0_conf
+
+            from services.vpn_service import VPNService
+            from exceptions import VPNProfileActiveError
+
+            with pytest.raises(VPNProfileActiveError):
+                VPNService.delete_profile("active")
+
+            assert active.exists()
+
+
 class TestVPNServiceActivation:
     """Tests for VPN profile activation."""
 
@@ -341,6 +548,25 @@ CHECK_INTERVAL=120
             assert settings.ping_host == "1.1.1.1"
             assert settings.check_interval == 120
 
+    def test_get_settings_tolerates_quotes_and_junk(self, temp_dir: Path) -> None:
+        """get_settings should strip quotes and skip malformed lines."""
+        config_file = temp_dir / "vpn-settings.conf"
+        config_file.write_text("""# VPN Settings
+PING_HOST="9.9.9.9"
+not a setting
+check_interval=abc
+""")
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.VPN_SETTINGS_CONF = config_file
+
+            from services.vpn_service import VPNService
+
+            settings = VPNService.get_settings()
+
+            assert settings.ping_host == "9.9.9.9"
+            assert settings.check_interval == 60
+
     def test_save_settings_writes_config(
         self, temp_dir: Path, mock_executor: MockCommandExecutor
     ) -> None:
@@ -365,6 +591,50 @@ CHECK_INTERVAL=120
             assert "1.1.1.1" in content
             assert "90" in content
 
+    def test_save_settings_skips_restart_when_unchanged(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """save_settings should not restart the watchdog for identical settings."""
+        config_file = temp_dir / "vpn-settings.conf"
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.VPN_SETTINGS_CONF = config_file
+
+            from services.vpn_service import VPNService
+            from models import VPNSettings
+
+            settings = VPNSettings(ping_host="1.1.1.1", check_interval=90)
+            assert VPNService.save_settings(settings) is True
+            mtime = config_file.stat().st_mtime_ns
+            restarts = len(mock_executor.calls)
+
+            assert VPNService.save_settings(settings) is True
+
+            assert len(mock_executor.calls) == restarts
+            assert config_file.stat().st_mtime_ns == mtime
+            assert list(temp_dir.iterdir()) == [config_file]
+
+    def test_save_settings_restarts_when_changed(
+        self, temp_dir: Path, mock_executor: MockCommandExecutor
+    ) -> None:
+        """save_settings should rewrite and restart when settings change."""
+        config_file = temp_dir / "vpn-settings.conf"
+
+        with patch("services.vpn_service.Paths") as mock_paths:
+            mock_paths.VPN_SETTINGS_CONF = config_file
+
+            from services.vpn_service import VPNService
+            from models import VPNSettings
+
+            VPNService.save_settings(VPNSettings(ping_host="1.1.1.1", check_interval=90))
+            VPNService.save_settings(VPNSettings(ping_host="9.9.9.9", check_interval=90))
+
+            restarts = [
+                cmd for cmd, _ in mock_executor.calls if "restart" in cmd
+            ]
+            assert len(restarts) == 2
+            assert "PING_HOST=9.9.9.9" in config_file.read_text()
+
 
 class TestVPNServiceIsActive:
     """Tests for the is_active convenience method."""
@@ -74,31 +74,61 @@ class TestWANServiceWifi:
     ) -> None:
         """_get_wifi_status should detect connected state."""
         mock_executor.set_response(
-            "nmcli -t -f DEVICE,STATE,CONNECTION device",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="wlan1:connected:MyNetwork\n",
+            stdout="100 (connected)\nMyNetwork\n192.168.1.50/24\n",
         )
+
+        from services.wan_service import WANService
+
+        status = WANService._get_wifi_status("wlan1")
+
+        assert status.connected is True
+        assert status.ssid == "MyNetwork"
+        assert status.ip == "192.168.1.50/24"
+        assert len(mock_executor.calls) == 1
+
+    def test_get_wifi_status_multiple_addresses(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """_get_wifi_status should use the first address and unescape the SSID."""
         mock_executor.set_response(
-            "ip addr show wlan1",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="inet 192.168.1.50/24",
+            stdout="100 (connected)\nCafe\\:Guest\n10.0.0.5/24 | 10.0.0.6/24\n",
         )
 
         from services.wan_service import WANService
 
         status = WANService._get_wifi_status("wlan1")
 
-        assert status.connected is True
-        assert status.ssid == "MyNetwork"
+        assert status.ssid == "Cafe:Guest"
+        assert status.ip == "10.0.0.5/24"
+
+    def test_get_wifi_status_nmcli_failure(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """_get_wifi_status should report disconnected when nmcli fails."""
+        mock_executor.set_response(
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
+            return_code=10,
+        )
+
+        from services.wan_service import WANService
+
+        status = WANService._get_wifi_status("wlan1")
+
+        assert status.connected is False
+        assert status.ip is None
 
     def test_get_wifi_status_disconnected(
         self, mock_executor: MockCommandExecutor
     ) -> None:
         """_get_wifi_status should detect disconnected state."""
         mock_executor.set_response(
-            "nmcli -t -f DEVICE,STATE,CONNECTION device",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="wlan1:disconnected:\n",
+            stdout="30 (disconnected)\n\n\n",
         )
 
         from services.wan_service import WANService
@@ -156,6 +186,47 @@ UniqueNetwork:70:WPA3
         assert ssids.count("DuplicateNetwork") == 1
         assert len(networks) == 2
 
+    def test_scan_networks_keeps_strongest_duplicate(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """scan_networks should keep the strongest access point per SSID."""
+        mock_executor.set_response(
+            "sudo nmcli -t -f SSID,SIGNAL,SECURITY device wifi list",
+            return_code=0,
+            stdout="""Mesh:40:WPA2
+Other:60:WPA2
+Mesh:80:WPA3
+""",
+        )
+
+        from services.wan_service import WANService
+
+        networks = WANService.scan_networks()
+
+        assert [(n.ssid, n.signal, n.security) for n in networks] == [
+            ("Mesh", 80, "WPA3"),
+            ("Other", 60, "WPA2"),
+        ]
+
+    def test_scan_networks_handles_escaped_colons(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """scan_networks should unescape colons in SSIDs and tolerate bad signals."""
+        mock_executor.set_response(
+            "sudo nmcli -t -f SSID,SIGNAL,SECURITY device wifi list",
+            return_code=0,
+            stdout="Cafe\\:Guest:60:WPA2\nOdd::Open\nmalformed line\n",
+        )
+
+        from services.wan_service import WANService
+
+        networks = WANService.scan_networks()
+
+        assert [(n.ssid, n.signal, n.security) for n in networks] == [
+            ("Cafe:Guest", 60, "WPA2"),
+            ("Odd", 0, "Open"),
+        ]
+
     def test_scan_networks_raises_on_failure(
         self, mock_executor: MockCommandExecutor
     ) -> None:
@@ -270,9 +341,9 @@ class TestWANServiceHelpers:
             stdout="inet 192.168.1.100/24",
         )
         mock_executor.set_response(
-            "nmcli -t -f DEVICE,STATE,CONNECTION device",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="wlan1:disconnected:\n",
+            stdout="30 (disconnected)\n\n\n",
         )
 
         with patch("services.wan_service.InterfaceService") as mock_iface:
@@ -297,14 +368,9 @@ class TestWANServiceHelpers:
             stdout="",  # No IP
         )
         mock_executor.set_response(
-            "nmcli -t -f DEVICE,STATE,CONNECTION device",
-            return_code=0,
-            stdout="wlan1:connected:MyNetwork\n",
-        )
-        mock_executor.set_response(
-            "ip addr show wlan1",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="inet 10.0.0.50/24",
+            stdout="100 (connected)\nMyNetwork\n10.0.0.50/24\n",
         )
 
         with patch("services.wan_service.InterfaceService") as mock_iface:
@@ -325,9 +391,9 @@ class TestWANServiceHelpers:
         """is_connected should return False when nothing is connected."""
         mock_executor.set_response("ip addr show eth0", return_code=0, stdout="")
         mock_executor.set_response(
-            "nmcli -t -f DEVICE,STATE,CONNECTION device",
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
             return_code=0,
-            stdout="wlan1:disconnected:\n",
+            stdout="30 (disconnected)\n\n\n",
         )
 
         with patch("services.wan_service.InterfaceService") as mock_iface:
@@ -341,3 +407,114 @@ class TestWANServiceHelpers:
             result = WANService.is_connected()
 
             assert result is False
+
+
+class TestWANServiceStatusCache:
+    """Tests for the WAN status cache."""
+
+    def _set_disconnected(self, mock_executor: MockCommandExecutor) -> None:
+        mock_executor.set_response("ip addr show eth0", return_code=0, stdout="")
+        mock_executor.set_response(
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
+            return_code=0,
+            stdout="30 (disconnected)\n\n\n",
+        )
+
+    def test_helpers_share_one_status_read(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """is_connected and get_current_ssid should reuse the cached status."""
+        self._set_disconnected(mock_executor)
+
+        with patch("services.wan_service.InterfaceService") as mock_iface:
+            mock_interfaces = MagicMock()
+            mock_interfaces.ethernet = "eth0"
+            mock_interfaces.wifi_wan = "wlan1"
+            mock_iface.get_interfaces.return_value = mock_interfaces
+
+            from services.wan_service import WANService
+
+            WANService.is_connected()
+            WANService.get_current_ssid()
+
+            assert mock_iface.get_interfaces.call_count == 1
+
+    def test_force_bypasses_cache(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """get_status(force=True) should always query the interfaces."""
+        self._set_disconnected(mock_executor)
+
+        with patch("services.wan_service.InterfaceService") as mock_iface:
+            mock_interfaces = MagicMock()
+            mock_interfaces.ethernet = "eth0"
+            mock_interfaces.wifi_wan = "wlan1"
+            mock_iface.get_interfaces.return_value = mock_interfaces
+
+            from services.wan_service import WANService
+
+            WANService.get_status()
+            WANService.get_status(force=True)
+
+            assert mock_iface.get_interfaces.call_count == 2
+
+    def test_connect_invalidates_cache(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """connect_wifi should drop the cached status."""
+        self._set_disconnected(mock_executor)
+
+        with patch("services.wan_service.InterfaceService") as mock_iface:
+            mock_interfaces = MagicMock()
+            mock_interfaces.ethernet = "eth0"
+            mock_interfaces.wifi_wan = "wlan1"
+            mock_iface.get_interfaces.return_value = mock_interfaces
+
+            from services.wan_service import WANService
+
+            WANService.get_status()
+            WANService.connect_wifi("MyNetwork", "password123")
+            WANService.get_status()
+
+            assert mock_iface.get_interfaces.call_count == 2
+
+    def test_get_status_runs_ethernet_check_on_pool(
+        self, mock_executor: MockCommandExecutor
+    ) -> None:
+        """get_status should run the Ethernet check off the caller's thread."""
+        import threading
+
+        mock_executor.set_response(
+            "ip addr show eth0",
+            return_code=0,
+            stdout="inet 192.168.1.100/24",
+        )
+        mock_executor.set_response(
+            "nmcli -t -g GENERAL.STATE,GENERAL.CONNECTION,IP4.ADDRESS device show wlan1",
+            return_code=0,
+            stdout="30 (disconnected)\n\n\n",
+        )
+
+        with patch("services.wan_service.InterfaceService") as mock_iface:
+            mock_interfaces = MagicMock()
+            mock_interfaces.ethernet = "eth0"
+            mock_interfaces.wifi_wan = "wlan1"
+            mock_iface.get_interfaces.return_value = mock_interfaces
+
+            from services.wan_service import WANService
+
+            original = WANService._get_ethernet_status.__func__
+            threads = []
+
+            def recording(cls, interface):
+                threads.append(threading.current_thread())
+                return original(cls, interface)
+
+            with patch.object(WANService, "_get_ethernet_status", classmethod(recording)):
+                status = WANService.get_status()
+
+            assert status.ethernet.connected is True
+            assert status.ethernet.ip == "192.168.1.100/24"
+            assert status.wifi.connected is False
+            assert threads and threads[0] is not threading.current_thread()
+
@@ -4,6 +4,9 @@ ROSE Link Utilities
 
 This package contains utility modules for common operations:
 - command_runner: Execute system commands safely
+- compat: Python version compatibility shims
+- fileio: Atomic, owner-only file writes
+- json_codec: Fast JSON encoding/decoding (orjson with json fallback)
 - validators: Input validation functions
 - sanitizers: Input sanitization functions
 
@@ -11,7 +14,8 @@ Author: ROSE Link Team
 License: MIT
 """
 
-from utils.command_runner import CommandRunner, run_command
+from utils.command_runner import CommandRunner, run_command, run_command_async
+from utils.fileio import write_private_file
 from utils.validators import (
     validate_filename,
     validate_ssid,
@@ -28,6 +32,9 @@ __all__ = [
     # Command execution
     "CommandRunner",
     "run_command",
+    "run_command_async",
+    # File writing
+    "write_private_file",
     # Validators
     "validate_filename",
     "validate_ssid",
@@ -10,6 +10,7 @@ Key Features:
 - Structured return values (return_code, stdout, stderr)
 - Automatic exception handling
 - Convenience methods for common systemd operations
+- Async wrapper backed by a dedicated worker pool
 - Abstract interface for dependency injection and testing
 
 Architecture:
@@ -26,9 +27,12 @@ License: MIT
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
@@ -209,6 +213,39 @@ def run_command(
     return result.return_code, result.stdout, result.stderr
 
 
+# Dedicated pool for blocking commands awaited from async code, so that
+# long-running commands don't starve asyncio's default executor
+_subprocess_pool = ThreadPoolExecutor(
+    max_workers=Limits.SUBPROCESS_POOL_SIZE,
+    thread_name_prefix="rose-subproc",
+)
+
+
+async def run_command_async(
+    cmd: list[str],
+    check: bool = True,
+    timeout: int = Limits.DEFAULT_COMMAND_TIMEOUT,
+) -> tuple[int, str, str]:
+    """
+    Execute a command without blocking the event loop.
+
+    Runs run_command() on the dedicated subprocess pool.
+
+    Args:
+        cmd: Command and arguments as a list
+        check: Passed through to run_command()
+        timeout: Command timeout in seconds
+
+    Returns:
+        Tuple of (return_code, stdout, stderr)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _subprocess_pool,
+        functools.partial(run_command, cmd, check, timeout),
+    )
+
+
 class CommandRunner:
     """
     Utility class providing high-level command execution methods.
@@ -284,12 +321,17 @@ class CommandRunner:
 
     @staticmethod
     def is_service_active(service: str) -> bool:
-        """Check if a systemd service is active."""
-        ret, out, _ = run_command(
-            ["systemctl", "is-active", service],
+        """
+        Check if a systemd service is active.
+
+        Uses 'is-active --quiet', which answers through the exit code
+        alone and, unlike 'systemctl status', never reads the journal.
+        """
+        ret, _, _ = run_command(
+            ["systemctl", "is-active", service, "--quiet"],
             check=False,
         )
-        return ret == 0 and out.strip() == "active"
+        return ret == 0
 
     # =========================================================================
     # Network Operations
@@ -0,0 +1,18 @@
+"""
+Python Version Compatibility
+============================
+
+Shims for features that depend on the running Python version.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for @dataclass giving slotted instances where
+# supported (Python 3.10+); empty on older versions
+DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
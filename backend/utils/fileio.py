@@ -0,0 +1,50 @@
+"""
+File Writing Helpers
+====================
+
+Helpers for writing files that hold secrets, such as VPN profiles
+containing private keys.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from pathlib import Path
+
+
+def write_private_file(path: Path, content: bytes) -> None:
+    """
+    Atomically write a file readable only by its owner.
+
+    The data goes to a temporary file created with mode 0600 in the
+    same directory, which then replaces the target, so the file is
+    never visible half-written or with looser permissions.
+
+    Args:
+        path: Destination file
+        content: Data to write
+
+    Raises:
+        OSError: If the file cannot be written; the previous file, if
+            any, is left untouched
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        try:
+            # O_CREAT's mode does not apply if the file already existed
+            os.fchmod(fd, 0o600)
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
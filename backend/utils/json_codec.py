@@ -0,0 +1,100 @@
+"""
+JSON Encoding and Decoding
+==========================
+
+Thin wrapper around orjson with a transparent fallback to the standard
+library json module.
+
+orjson parses directly from bytes or str (including buffer objects such
+as mmap) and is several times faster than json for the command output
+and history files handled by the services. When it is not installed,
+the same functions fall back to json so behaviour is unchanged.
+
+Decode errors always raise json.JSONDecodeError (orjson's error type
+is a subclass), so callers can keep catching the standard exception.
+
+Author: ROSE Link Team
+License: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from types import ModuleType
+from typing import Any, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+HAS_ORJSON: bool = orjson is not None
+
+JSONInput = Union[str, bytes, bytearray, memoryview]
+
+
+def loads(data: JSONInput) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as str, or bytes / any buffer object
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview) or not isinstance(data, (str, bytes, bytearray)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def load_file(path: str | os.PathLike) -> Any:
+    """
+    Parse a JSON file.
+
+    The file is memory-mapped and parsed in place, avoiding an
+    intermediate copy of its contents.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        OSError: If the file cannot be read
+        JSONDecodeError: If the file is empty or not valid JSON
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap cannot map empty files
+            raise JSONDecodeError("Empty file", "", 0)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return loads(view)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
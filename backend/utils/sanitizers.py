@@ -15,16 +15,24 @@ License: MIT
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 
 from config import Limits
 
+# Characters not allowed in stored filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^a-zA-Z0-9._-]')
 
+
+@functools.lru_cache(maxsize=256)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename to prevent path traversal attacks.
 
+    Results are memoized, since the same few profile names are passed
+    in on every activate/delete request.
+
     This function:
     1. Extracts only the base filename (removes path components)
     2. Replaces unsafe characters with underscores
@@ -60,7 +68,7 @@ def sanitize_filename(filename: str) -> str:
 
     # Remove any potentially dangerous characters
     # Only allow: alphanumeric, dash, underscore, and dot
-    sanitized = re.sub(r'[^a-zA-Z0-9._-]', '_', basename)
+    sanitized = _UNSAFE_FILENAME_CHARS.sub('_', basename)
 
     # Ensure it doesn't start with a dot (hidden file)
     if sanitized.startswith('.'):